@@ -5,16 +5,37 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 @author: Informed Solutions
 """
 
-import requests
 import json
 from django.conf import settings
 
+from . import gateway
+from .postcode_cache import postcode_cache
+
 
 class AddressHelper:
     """
     Class containing helper methods when dealing with address details.
     """
 
+    @staticmethod
+    def search_postcode(postcode):
+        """
+        Helper method for fetching the addresses at a postcode, from the postcode cache if it has been searched for
+        recently, otherwise from the Addressing Service API
+        :param postcode: the postcode on which a search will be made
+        :return: dictionary of the count and results returned by the Addressing Service API, or None if the search
+        failed
+        """
+        def fetch():
+            headers = {"content-type": "application/json"}
+            response = gateway.get(settings.ADDRESSING_URL + '/api/v1/addresses/' + postcode + '/', headers=headers,
+                                   verify=False, timeout=settings.ADDRESSING_HTTP_REQUEST_TIMEOUT)
+            if response.status_code == 200:
+                return json.loads(response.text)
+            return None
+
+        return postcode_cache.get_or_fetch(postcode, fetch)
+
     @staticmethod
     def create_address_lookup_list(postcode):
         """
@@ -22,11 +43,8 @@ class AddressHelper:
         :param postcode: the postcode on which a search will be made (issued to Addressing Service API)
         :return: list of indexed one-line addresses formatted for a ChoiceField
         """
-        headers = {"content-type": "application/json"}
-        response = requests.get(settings.ADDRESSING_URL + '/api/v1/addresses/' + postcode + '/', headers=headers,
-                                verify=False)
-        if response.status_code == 200:
-            address_matches = json.loads(response.text)
+        address_matches = AddressHelper.search_postcode(postcode)
+        if address_matches is not None:
             results = address_matches['results']
             count = address_matches['count']
             results_no = str(count) + ' addresses found'
@@ -47,11 +65,8 @@ class AddressHelper:
         :param postcode: the postcode on which a search will be made (issued to Addressing Service API)
         :return: list of one-addresses and JavaScript objects containing address elements
         """
-        headers = {"content-type": "application/json"}
-        response = requests.get(settings.ADDRESSING_URL + '/api/v1/addresses/' + postcode + '/', headers=headers,
-                                verify=False)
-        if response.status_code == 200:
-            address_matches = json.loads(response.text)
+        address_matches = AddressHelper.search_postcode(postcode)
+        if address_matches is not None:
             results = address_matches['results']
             addresses = []
             for address in results:
@@ -0,0 +1,115 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- application_aggregate.py --
+
+@author: Informed Solutions
+
+Loader for the whole graph of records making up an application, used by the master summary and print pages so that
+the number of queries they make does not grow with the size of the applicant's household.
+"""
+
+from django.db.models import Prefetch
+
+from .application_loader import load_application
+from .models import (AdultInHome,
+                     AdultInHomeAddress,
+                     ApplicantHomeAddress,
+                     ApplicantName,
+                     ApplicantPersonalDetails,
+                     Child,
+                     ChildAddress,
+                     ChildInHome,
+                     ChildcareTraining,
+                     ChildcareType,
+                     CriminalRecordCheck,
+                     FirstAidTraining,
+                     Reference,
+                     UserDetails)
+
+
+class ApplicationAggregate:
+    """
+    Every record belonging to an application, fetched with a fixed number of queries
+    """
+
+    def __init__(self, application_id):
+        self.application = load_application(application_id)
+        application_id = self.application.pk
+
+        self.login_record = UserDetails.objects.get(application_id=application_id)
+        self.childcare_record = ChildcareType.objects.get(application_id=application_id)
+        self.applicant_record = ApplicantPersonalDetails.objects.get(application_id=application_id)
+        self.applicant_name_record = ApplicantName.objects.get(personal_detail_id=self.applicant_record.pk)
+
+        # The current and childcare addresses are usually the same record, so both are read in one query
+        self.applicant_home_address_record = None
+        self.applicant_childcare_address_record = None
+        for address in ApplicantHomeAddress.objects.filter(personal_detail_id=self.applicant_record.pk):
+            if address.current_address and self.applicant_home_address_record is None:
+                self.applicant_home_address_record = address
+            if address.childcare_address and self.applicant_childcare_address_record is None:
+                self.applicant_childcare_address_record = address
+        if self.applicant_home_address_record is None:
+            raise ApplicantHomeAddress.DoesNotExist
+
+        self.first_aid_record = FirstAidTraining.objects.get(application_id=application_id)
+        self.dbs_record = CriminalRecordCheck.objects.get(application_id=application_id)
+        self.childcare_training_record = ChildcareTraining.objects.get(application_id=application_id)
+
+        self.references = {reference.reference: reference
+                           for reference in Reference.objects.filter(application_id=application_id)}
+
+        # Each adult's address is attached as adult.addresses by a single prefetch query
+        self.adults = list(AdultInHome.objects.filter(application_id=application_id).order_by('adult').prefetch_related(
+            Prefetch('adultinhomeaddress_set',
+                     queryset=AdultInHomeAddress.objects.filter(application_id=application_id),
+                     to_attr='addresses')))
+
+        self.children_in_home = list(ChildInHome.objects.filter(application_id=application_id).order_by('child'))
+        self.children = list(Child.objects.filter(application_id=application_id).order_by('child'))
+        self.child_addresses = {child_address.child: child_address
+                                for child_address in ChildAddress.objects.filter(application_id=application_id)}
+
+    def get_reference(self, number):
+        """
+        :param number: 1 for the first reference, 2 for the second
+        :return: Reference object
+        """
+        try:
+            return self.references[number]
+        except KeyError:
+            raise Reference.DoesNotExist
+
+    @staticmethod
+    def get_adult_address(adult):
+        """
+        :param adult: AdultInHome object from self.adults
+        :return: the adult's AdultInHomeAddress object, or None if they have not given one
+        """
+        return adult.addresses[0] if adult.addresses else None
+
+    @property
+    def children_not_in_home(self):
+        """
+        :return: list of the applicant's children who do not live with them, ordered by child number
+        """
+        return [child for child in self.children if child.lives_with_childminder is False]
+
+    def get_child_address(self, child):
+        """
+        :param child: Child object from self.children
+        :return: the ChildAddress object for a child who does not live with the applicant
+        """
+        try:
+            return self.child_addresses[child.child]
+        except KeyError:
+            raise ChildAddress.DoesNotExist
+
+
+def load_application_aggregate(application_id):
+    """
+    Function to fetch every record making up an application
+    :param application_id: the id of the application to be fetched
+    :return: ApplicationAggregate object
+    """
+    return ApplicationAggregate(application_id)
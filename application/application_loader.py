@@ -0,0 +1,111 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- application_loader.py --
+
+@author: Informed Solutions
+
+Request scoped cache of Application records, so that the middleware, context processors, business logic and views
+handling a single request share one primary key lookup per application.
+"""
+
+import threading
+
+from .models import Application
+
+_request_state = threading.local()
+
+
+class ApplicationLoader:
+    """
+    Cache of Application records for the lifetime of a single request
+    """
+
+    def __init__(self):
+        self.applications = {}
+
+    def get(self, application_id):
+        """
+        Method to get an application, querying the database only the first time it is requested
+        :param application_id: the id of the application to be fetched
+        :return: Application object
+        """
+        key = str(application_id)
+        if key not in self.applications:
+            self.applications[key] = Application.objects.get(pk=application_id)
+        return self.applications[key]
+
+    def saved(self, instance):
+        """
+        Method called when an application is saved. If the saved instance is not the cached one then the cached copy
+        is stale, so it is dropped and will be re-read on next access
+        :param instance: the Application object that was saved
+        """
+        key = str(instance.pk)
+        if self.applications.get(key) is not instance:
+            self.applications.pop(key, None)
+
+    def invalidate(self, application_id):
+        """
+        Method to drop a cached application, for use after queryset updates or deletes which bypass save()
+        :param application_id: the id of the application to be dropped
+        """
+        self.applications.pop(str(application_id), None)
+
+
+def start_request(request):
+    """
+    Attaches a fresh ApplicationLoader to the request and makes it the loader for the current thread
+    :param request: the request being handled
+    :return: the new ApplicationLoader
+    """
+    loader = ApplicationLoader()
+    request.application_loader = loader
+    _request_state.loader = loader
+    return loader
+
+
+def end_request():
+    """
+    Detaches the loader from the current thread once the response has been produced
+    """
+    _request_state.loader = None
+
+
+def get_current_loader():
+    """
+    :return: the ApplicationLoader for the request being handled on this thread, or None outside of a request
+    """
+    return getattr(_request_state, 'loader', None)
+
+
+def load_application(application_id):
+    """
+    Function to get an application, using the current request's cache where one exists
+    :param application_id: the id of the application to be fetched
+    :return: Application object
+    """
+    loader = get_current_loader()
+    if loader is None:
+        return Application.objects.get(pk=application_id)
+    return loader.get(application_id)
+
+
+def application_saved(instance):
+    """
+    Function keeping the current request's cache consistent when an application is saved
+    :param instance: the Application object that was saved
+    """
+    loader = get_current_loader()
+    if loader is not None:
+        loader.saved(instance)
+
+
+def invalidate_application(application_id):
+    """
+    Function to drop an application from the current request's cache, if there is one
+    :param application_id: the id of the application to be dropped
+    """
+    loader = get_current_loader()
+    if loader is not None:
+        loader.invalidate(application_id)
+
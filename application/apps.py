@@ -18,8 +18,8 @@ class ApplicationConfig(AppConfig):
         # Imports must stay here. If you put it outside of this class it will fail.
         # Because this app is loaded on when it reaches ready() method.
         # Any interaction with django will fail before this class
-        from django.db.models.signals import post_init, post_save
-        from application.signals import timelog_post_init, timelog_post_save
+        from django.db.models.signals import post_init, pre_save, post_save
+        from application.signals import timelog_post_init, timelog_pre_save, timelog_post_save
 
         timelog_models_instances = [self.get_model(model) for model in [\
             'ApplicantName',
@@ -38,13 +38,39 @@ class ApplicationConfig(AppConfig):
 
         for model in timelog_models_instances:
             post_init.connect(timelog_post_init, sender=model, dispatch_uid="timelog_post_init")
+            pre_save.connect(timelog_pre_save, sender=model, dispatch_uid="timelog_pre_save")
             post_save.connect(timelog_post_save, sender=model, dispatch_uid="timelog_post_save")
 
+    def register_signals_application_loader(self):
+        """
+        Register signals keeping the request scoped application cache up to date
+        """
+        from django.db.models.signals import post_delete, post_save
+        from application.signals import application_post_delete, application_post_save
+
+        application_model = self.get_model('Application')
+        post_save.connect(application_post_save, sender=application_model, dispatch_uid="application_post_save")
+        post_delete.connect(application_post_delete, sender=application_model, dispatch_uid="application_post_delete")
+
+    def register_signals_ownership_cache(self):
+        """
+        Register signals dropping verified application owners from the ownership cache when accounts change
+        """
+        from django.db.models.signals import post_delete, post_save
+        from application.signals import user_details_post_delete, user_details_post_save
+
+        user_details_model = self.get_model('UserDetails')
+        post_save.connect(user_details_post_save, sender=user_details_model, dispatch_uid="user_details_post_save")
+        post_delete.connect(user_details_post_delete, sender=user_details_model,
+                            dispatch_uid="user_details_post_delete")
+
     def register_signals(self):
         """
         Register signals only for certains models
         """
         self.register_signals_timelog()
+        self.register_signals_application_loader()
+        self.register_signals_ownership_cache()
 
     def ready(self):
 
@@ -14,12 +14,13 @@ import pytz
 from dateutil.relativedelta import relativedelta
 
 from . import dbs
+from .application_loader import load_application
+from .field_updates import get_field_values, update_fields
 from .models import (AdultInHome,
                      AdultInHomeAddress,
                      ApplicantHomeAddress,
                      ApplicantName,
                      ApplicantPersonalDetails,
-                     Application,
                      ChildcareType,
                      ChildInHome,
                      CriminalRecordCheck,
@@ -37,7 +38,7 @@ def childcare_type_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: a ChildcareType object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     zero_to_five_status = '0-5' in form.cleaned_data.get('type_of_childcare')
     five_to_eight_status = '5-8' in form.cleaned_data.get('type_of_childcare')
     eight_plus_status = '8over' in form.cleaned_data.get('type_of_childcare')
@@ -60,7 +61,7 @@ def childcare_timing_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: a ChildcareType object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     childcare_timing = form.cleaned_data['time_of_childcare']
 
     options = (
@@ -144,7 +145,7 @@ def personal_name_logic(app_id, form):
     :param form: A form object containing the data to be stored
     :return: an ApplicantName object to be saved
     """
-    app_obj = Application.objects.get(pk=app_id.pk)
+    app_obj = load_application(app_id.pk)
     first_name = form.cleaned_data.get('first_name')
     middle_names = form.cleaned_data.get('middle_names')
     last_name = form.cleaned_data.get('last_name')
@@ -201,7 +202,7 @@ def personal_dob_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an ApplicantPersonalDetails object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     birth_day = form.cleaned_data.get('date_of_birth')[0]
     birth_month = form.cleaned_data.get('date_of_birth')[1]
     birth_year = form.cleaned_data.get('date_of_birth')[2]
@@ -227,7 +228,7 @@ def personal_home_address_logic(app_id, form):
     :return: an ApplicantHomeAddress object to be saved
     """
 
-    app_obj = Application.objects.get(application_id=app_id)
+    app_obj = load_application(app_id)
     street_line1 = form.cleaned_data.get('street_line1')
     street_line2 = form.cleaned_data.get('street_line2')
     town = form.cleaned_data.get('town')
@@ -277,7 +278,7 @@ def child_address_logic(app_id, child, form):
     :param form: A form object containing the data to be stored
     :return: an ChildAddress object to be saved
     """
-    application = Application.objects.get(application_id=app_id)
+    application = load_application(app_id)
     child_address = ChildAddress(application_id=application)
 
     if ChildAddress.objects.filter(application_id=app_id, child=child).exists():
@@ -300,7 +301,7 @@ def PITH_address_logic(app_id, adult, form):
     :param form: A form object containing the data to be stored
     :return: an AdultInHomeAddress object to be saved
     """
-    application = Application.objects.get(application_id=app_id)
+    application = load_application(app_id)
     PITH_address = AdultInHomeAddress(application_id=application)
 
     if AdultInHomeAddress.objects.filter(application_id=app_id, adult_id=adult).exists():
@@ -324,7 +325,7 @@ def personal_location_of_care_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an ApplicantHomeAddress object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     location_of_care = form.cleaned_data.get('childcare_location')
     # Retrieve the personal_details_id corresponding to the application
     personal_detail_record = ApplicantPersonalDetails.objects.get(application_id=this_application)
@@ -361,7 +362,7 @@ def personal_childcare_address_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an ApplicantHomeAddress object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     street_line1 = form.cleaned_data.get('street_line1')
     street_line2 = form.cleaned_data.get('street_line2')
     town = form.cleaned_data.get('town')
@@ -400,7 +401,7 @@ def first_aid_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an FirstAidTraining object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     training_organisation = form.cleaned_data.get('first_aid_training_organisation')
     course_title = form.cleaned_data.get('title_of_training_course')
     course_day = form.cleaned_data.get('course_date')[0]
@@ -430,7 +431,7 @@ def eyfs_details_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an EYFS object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     eyfs_course_name = form.cleaned_data.get('eyfs_course_name')
     eyfs_course_date_day = form.cleaned_data.get('eyfs_course_date').day
     eyfs_course_date_month = form.cleaned_data.get('eyfs_course_date').month
@@ -466,7 +467,7 @@ def training_for_childcare_register_logic(application_id_local, form):
     )
 
     if ChildcareTraining.objects.filter(application_id=application_id_local).count() == 0:
-        application_record = Application.objects.get(application_id=application_id_local)
+        application_record = load_application(application_id_local)
         childcare_training_record = ChildcareTraining.objects.create(application_id=application_record)
     else:
         childcare_training_record = ChildcareTraining.objects.get(application_id=application_id_local)
@@ -501,7 +502,7 @@ def dbs_check_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an CriminalRecordCheck object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     dbs_certificate_number = form.cleaned_data.get('dbs_certificate_number')
     cautions_convictions = form.cleaned_data.get('cautions_convictions')
     # If the user entered information for this task for the first time
@@ -524,7 +525,7 @@ def references_first_reference_logic(application_id_local, form, number):
     :param number: define whether it's first or second reference
     :return: an Reference object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     if form.cleaned_data.get('title')  != 'Other':
         title = form.cleaned_data.get('title')
     else:
@@ -571,7 +572,7 @@ def health_check_logic(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: an HealthDeclarationBooklet object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     send_hdb_declare = True
     # If the user entered information for this task for the first time
     if HealthDeclarationBooklet.objects.filter(application_id=application_id_local).count() == 0:
@@ -591,7 +592,7 @@ def your_children_details_logic(application_id_local, form, child):
     :param child: child number (integer)
     :return: an ChildInHome object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     first_name = form.cleaned_data.get('first_name')
     middle_names = form.cleaned_data.get('middle_names')
     last_name = form.cleaned_data.get('last_name')
@@ -627,7 +628,7 @@ def other_people_adult_details_logic(application_id_local, form, adult):
     :param adult: adult number (integer)
     :return: an AdultInHome object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     if form.cleaned_data.get('title')  != 'Other':
         title = form.cleaned_data.get('title')
     else:
@@ -676,7 +677,7 @@ def remove_adult(application_id_local, remove_person):
     :param remove_person: adult to remove (integer)
     :return:
     """
-    application = Application.objects.get(pk=application_id_local)
+    application = load_application(application_id_local)
 
     if AdultInHome.objects.filter(application_id=application_id_local, adult=remove_person).exists() is True:
         remove_adult_id = AdultInHome.objects.get(application_id=application_id_local, adult=remove_person).adult_id
@@ -690,7 +691,7 @@ def rearrange_adults(number_of_adults, application_id_local):
     :param application_id_local: current application ID
     :return:
     """
-    application = Application.objects.get(pk=application_id_local)
+    application = load_application(application_id_local)
 
     for i in range(1, number_of_adults + 1):
         # If there is a gap in the sequence of adult numbers
@@ -767,7 +768,7 @@ def other_people_children_details_logic(application_id_local, form, child):
     :param child: child number (integer)
     :return: an ChildInHome object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     first_name = form.cleaned_data.get('first_name')
     middle_names = form.cleaned_data.get('middle_names')
     last_name = form.cleaned_data.get('last_name')
@@ -801,7 +802,7 @@ def PITH_own_children_details_logic(application_id_local, form, child):
     :param child: child number (integer)
     :return: an ChildInHome object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     first_name = form.cleaned_data.get('first_name')
     middle_names = form.cleaned_data.get('middle_names')
     last_name = form.cleaned_data.get('last_name')
@@ -856,7 +857,7 @@ def login_contact_security_question(application_id_local, form):
     :param form: A form object containing the data to be stored
     :return: a UserDetails object to be saved
     """
-    this_application = Application.objects.get(application_id=application_id_local)
+    this_application = load_application(application_id_local)
     security_answer = form.cleaned_data.get('security_answer')
     login_and_contact_details_record = this_application.login_id
     login_and_contact_details_record.security_answer = security_answer
@@ -1205,28 +1206,17 @@ def show_resend_and_change_email(health_check_status, is_review=None):
     return health_check_status != 'Done'
 
 
-def update_criminal_record_check(app_id, field_obj, status):
+def update_criminal_record_check(app_id, field_obj, status=None):
     """
-    Updates the CriminalRecordCheck field with the given status.
+    Updates the CriminalRecordCheck field with the given status, writing all of the fields in one update.
     :param app_id: applicant's application_id
-    :param field_obj: CriminalRecordCheck field or list of CriminalRecordCheck fields
-    :param status: Value to update entry/entries with
+    :param field_obj: CriminalRecordCheck field, list of CriminalRecordCheck fields, or dictionary of CriminalRecordCheck fields to
+    their values
+    :param status: Value to update entry/entries with, unless field_obj is a dictionary
     :return: Boolean True if successfully updated.
     """
     criminal_record_check_record = CriminalRecordCheck.objects.get(application_id=app_id)
-
-    if isinstance(field_obj, list):
-        for field in field_obj:
-            setattr(criminal_record_check_record, field, status)
-        criminal_record_check_record.save()
-
-    elif isinstance(field_obj, str):
-        setattr(criminal_record_check_record, field_obj, status)
-        criminal_record_check_record.save()
-
-    else:
-        raise TypeError(
-            '{0} is not a valid field_obj, must be string or list not {1}'.format(field_obj, type(field_obj)))
+    update_fields(criminal_record_check_record, get_field_values(field_obj, status))
 
     return True
 
@@ -1252,7 +1242,15 @@ def get_criminal_record_check(app_id, field_obj):
 
 def get_childcare_register_type(app_id):
     childcare_record = ChildcareType.objects.get(application_id=app_id)
+    return get_childcare_register_type_from_record(childcare_record)
+
 
+def get_childcare_register_type_from_record(childcare_record):
+    """
+    Function to determine the register type and fee for an application from a ChildcareType record already loaded
+    :param childcare_record: ChildcareType object for the application
+    :return: tuple of the register type and the fee
+    """
     if (childcare_record.zero_to_five is True) \
             & (childcare_record.five_to_eight is True) \
             & (childcare_record.eight_plus is True):
@@ -1315,34 +1313,23 @@ def get_adult_in_home(app_id, field_obj):
             '{0} is not a valid field_obj, must be string or list not {1}'.format(field_obj, type(field_obj)))
 
 
-def update_adult_in_home(pk, field_obj, status):
+def update_adult_in_home(pk, field_obj, status=None):
     """
-    Updates the AdultInHome field with the given status.
+    Updates the AdultInHome field with the given status, writing all of the fields in one update.
     :param pk: AdultInHome primary key
-    :param field_obj: AdultInHome field or list of AdultInHome fields
-    :param status: Value to update entry/entries with
+    :param field_obj: AdultInHome field, list of AdultInHome fields, or dictionary of AdultInHome fields to
+    their values
+    :param status: Value to update entry/entries with, unless field_obj is a dictionary
     :return: Boolean True if successfully updated.
     """
     adult_in_home_record = AdultInHome.objects.get(pk=pk)
-
-    if isinstance(field_obj, list):
-        for field in field_obj:
-            setattr(adult_in_home_record, field, status)
-            adult_in_home_record.save()
-
-    elif isinstance(field_obj, str):
-        setattr(adult_in_home_record, field_obj, status)
-        adult_in_home_record.save()
-
-    else:
-        raise TypeError(
-            '{0} is not a valid field_obj, must be string or list not {1}'.format(field_obj, type(field_obj)))
+    update_fields(adult_in_home_record, get_field_values(field_obj, status))
 
     return True
 
 
 def get_application_object(app_id):
-    return Application.objects.get(application_id=app_id)
+    return load_application(app_id)
 
 
 def get_application(app_id, field_obj):
@@ -1351,7 +1338,7 @@ def get_application(app_id, field_obj):
     :param field_obj: Application field or list of Application fields
     :return:
     """
-    application_record = Application.objects.get(application_id=app_id)
+    application_record = load_application(app_id)
 
     if isinstance(field_obj, list):
         return {field: getattr(application_record, field) for field in field_obj}
@@ -1364,28 +1351,17 @@ def get_application(app_id, field_obj):
             '{0} is not a valid field_obj, must be string or list not {1}'.format(field_obj, type(field_obj)))
 
 
-def update_application(app_id, field_obj, status):
+def update_application(app_id, field_obj, status=None):
     """
-    Updates the Application field with the given status.
+    Updates the Application field with the given status, writing all of the fields in one update.
     :param app_id: applicant's application_id
-    :param field_obj: Application field or list of Application fields
-    :param status: Value to update entry/entries with
+    :param field_obj: Application field, list of Application fields, or dictionary of Application fields to
+    their values
+    :param status: Value to update entry/entries with, unless field_obj is a dictionary
     :return: Boolean True if successfully updated.
     """
-    application_record = Application.objects.get(application_id=app_id)
-
-    if isinstance(field_obj, list):
-        for field in field_obj:
-            setattr(application_record, field, status)
-            application_record.save()
-
-    elif isinstance(field_obj, str):
-        setattr(application_record, field_obj, status)
-        application_record.save()
-
-    else:
-        raise TypeError(
-            '{0} is not a valid field_obj, must be string or list not {1}'.format(field_obj, type(field_obj)))
+    application_record = load_application(app_id)
+    update_fields(application_record, get_field_values(field_obj, status))
 
     return True
 
@@ -4,28 +4,170 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 
 @author: Informed Solutions
 
-Handler for dbs api
+Handler for dbs api. Certificates are looked up in the local index of the Capita DBS list first, if one has been
+ingested, and then from the api. Lookups from the api are cached by certificate number: records which were found for
+DBS_LOOKUP_CACHE_TTL_IN_SECONDS and certificates which were not found for DBS_LOOKUP_NEGATIVE_CACHE_TTL_IN_SECONDS.
 """
 
-import requests
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import requests
 from django.conf import settings
 
+from . import dbs_index, gateway
+
 DBS_API_ENDPOINT = settings.DBS_URL
 
+log = logging.getLogger(__name__)
+
+
+class DBSLookupCache:
+    """
+    Time limited cache of DBS api responses keyed by certificate number
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_ttl(response):
+        """
+        :param response: a response from the DBS api
+        :return: the number of seconds the response may be cached for, or 0 if it must not be cached
+        """
+        if response.status_code == 200:
+            return settings.DBS_LOOKUP_CACHE_TTL_IN_SECONDS
+        if response.status_code == 404:
+            return settings.DBS_LOOKUP_NEGATIVE_CACHE_TTL_IN_SECONDS
+        return 0
+
+    def get(self, dbs_certificate_number):
+        """
+        :param dbs_certificate_number: the certificate number being looked up
+        :return: the cached response for the certificate number, or None if there is none
+        """
+        now = time.monotonic()
+        with self.lock:
+            entry = self.responses.get(dbs_certificate_number)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self.responses[dbs_certificate_number]
+                return None
+            return entry[1]
+
+    def set(self, dbs_certificate_number, response):
+        """
+        Method to cache a response, if its status allows it to be cached
+        :param dbs_certificate_number: the certificate number which was looked up
+        :param response: the response from the DBS api
+        """
+        ttl = self.get_ttl(response)
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        with self.lock:
+            # Drops expired responses so that the cache does not grow with every certificate ever looked up
+            for key in [key for key, entry in self.responses.items() if entry[0] <= now]:
+                del self.responses[key]
+            self.responses[dbs_certificate_number] = (now + ttl, response)
+
+    def invalidate(self, dbs_certificate_number):
+        """
+        Method to forget the cached response for a certificate number
+        """
+        with self.lock:
+            self.responses.pop(dbs_certificate_number, None)
+
+    def clear(self):
+        """
+        Method to forget every cached response
+        """
+        with self.lock:
+            self.responses.clear()
+
+
+lookup_cache = DBSLookupCache()
+
+
+def read_local(dbs_certificate_number):
+    """
+    Function to look up a certificate in the local index of the Capita DBS list
+    :param dbs_certificate_number: the certificate number being looked up
+    :return: :class:`Response <Response>` object in the form returned by the DBS api, or None if the certificate is
+    not in the local index or its indexed record cannot be used
+    """
+    record = dbs_index.lookup(dbs_certificate_number)
+    if record is None:
+        return None
+    if not dbs_index.is_valid_record(record):
+        log.warning('Indexed record for DBS certificate ' + dbs_certificate_number + ' is invalid, using the DBS api')
+        return None
+
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(record).encode('utf-8')
+    response.encoding = 'utf-8'
+    response.record = record
+    return response
+
 
 def read(dbs_certificate_number):
+    dbs_certificate_number = str(dbs_certificate_number)
+    response = lookup_cache.get(dbs_certificate_number)
+    if response is not None:
+        return response
+
+    # Certificates missing from the local index are looked up over HTTP, as the index may predate them, as are any
+    # whose indexed record is invalid
+    response = read_local(dbs_certificate_number)
+    if response is not None:
+        return response
+
     params = {'certificate_number': dbs_certificate_number}
-    response = requests.get(DBS_API_ENDPOINT + '/api/v1/dbs/' + dbs_certificate_number + '/', data=params, verify=False)
+    response = gateway.get(DBS_API_ENDPOINT + '/api/v1/dbs/' + dbs_certificate_number + '/', data=params,
+                           verify=False, timeout=settings.DBS_HTTP_REQUEST_TIMEOUT)
     if response.status_code == 200:
         response.record = json.loads(response.text)
+    lookup_cache.set(dbs_certificate_number, response)
     return response
 
 
+def read_many(dbs_certificate_numbers):
+    """
+    Function to look up several certificates at once, such as those of every adult in a household. Certificates
+    which are not cached are looked up concurrently, and their responses cached for subsequent calls to read().
+    :param dbs_certificate_numbers: iterable of certificate numbers
+    :return: dictionary of the response for each certificate number, leaving out any whose lookup raised an exception
+    """
+    def read_or_none(dbs_certificate_number):
+        try:
+            return read(dbs_certificate_number)
+        except Exception:
+            log.exception('DBS lookup for certificate ' + dbs_certificate_number + ' failed')
+            return None
+
+    dbs_certificate_numbers = list(dict.fromkeys(str(number) for number in dbs_certificate_numbers))
+    if len(dbs_certificate_numbers) <= 1:
+        responses = map(read_or_none, dbs_certificate_numbers)
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(dbs_certificate_numbers), settings.DBS_LOOKUP_CONCURRENCY)) \
+                as executor:
+            responses = list(executor.map(read_or_none, dbs_certificate_numbers))
+
+    return {number: response for number, response in zip(dbs_certificate_numbers, responses) if response is not None}
+
+
 def create(dbs_certificate_number, date_issued, date_of_birth, certificate_information):
     params = {'certificate_number': dbs_certificate_number, 'certificate_information': certificate_information,
               'date_of_issue': date_issued,
               'date_of_birth': date_of_birth}
-    response = requests.post(DBS_API_ENDPOINT + '/api/v1/dbs/', data=params, verify=False)
+    response = gateway.post(DBS_API_ENDPOINT + '/api/v1/dbs/', data=params, verify=False,
+                            timeout=settings.DBS_HTTP_REQUEST_TIMEOUT)
+    lookup_cache.invalidate(str(dbs_certificate_number))
     return response
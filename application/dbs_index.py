@@ -0,0 +1,165 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- dbs_index.py --
+
+@author: Informed Solutions
+
+Local index of the Capita DBS list, built by the ingest_capita_dbs_file management command, so that certificates can
+be looked up without a request to the DBS api. The index is a file of fixed width entries sorted by certificate number,
+followed by the certificate information of every entry, which is memory mapped and binary searched.
+"""
+
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime
+
+from django.conf import settings
+
+MAGIC = b'DBSIDX01'
+HEADER = struct.Struct('>8sI')
+# Certificate number, date of birth, date of issue, then the offset and length of the certificate information
+ENTRY = struct.Struct('>12s10s10sQI')
+
+
+def is_valid_record(record):
+    """
+    :param record: dictionary with certificate_number, date_of_birth and date_of_issue keys
+    :return: True if the certificate number is twelve digits and both dates are in YYYY-MM-DD format, as returned by
+    the DBS api
+    """
+    if len(record['certificate_number']) != 12 or not record['certificate_number'].isdigit():
+        return False
+    try:
+        datetime.strptime(record['date_of_birth'], '%Y-%m-%d')
+        datetime.strptime(record['date_of_issue'], '%Y-%m-%d')
+    except ValueError:
+        return False
+    # Dates must also fill their fixed width fields, which strptime does not require
+    return len(record['date_of_birth']) == 10 and len(record['date_of_issue']) == 10
+
+
+def write_index(records, path):
+    """
+    Function to write an index of DBS records, replacing any existing index only once it has been written in full
+    :param records: iterable of dictionaries with certificate_number, date_of_birth, date_of_issue (both YYYY-MM-DD)
+    and certificate_information keys
+    :param path: the path of the index file
+    :return: the number of records in the index
+    """
+    records = sorted({record['certificate_number']: record for record in records}.values(),
+                     key=lambda record: record['certificate_number'])
+
+    information_offset = HEADER.size + ENTRY.size * len(records)
+    entries = []
+    information = []
+    for record in records:
+        certificate_information = record['certificate_information'].encode('utf-8')
+        entries.append(ENTRY.pack(record['certificate_number'].encode('ascii'),
+                                  record['date_of_birth'].encode('ascii'),
+                                  record['date_of_issue'].encode('ascii'),
+                                  information_offset, len(certificate_information)))
+        information.append(certificate_information)
+        information_offset += len(certificate_information)
+
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as index_file:
+        index_file.write(HEADER.pack(MAGIC, len(records)))
+        index_file.writelines(entries)
+        index_file.writelines(information)
+    os.replace(temporary_path, path)
+
+    return len(records)
+
+
+class DBSIndex:
+    """
+    Read only view of an index file
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as index_file:
+            self.mapping = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.mapping, 0)
+        if magic != MAGIC:
+            self.mapping.close()
+            raise ValueError(path + ' is not a DBS index')
+
+    def __len__(self):
+        return self.count
+
+    def __get_entry(self, position):
+        return ENTRY.unpack_from(self.mapping, HEADER.size + ENTRY.size * position)
+
+    def lookup(self, dbs_certificate_number):
+        """
+        Method to find a certificate in the index
+        :param dbs_certificate_number: the certificate number being looked up
+        :return: dictionary in the form returned by the DBS api, or None if the certificate is not in the index
+        """
+        key = str(dbs_certificate_number).encode('ascii')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__get_entry(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low == self.count:
+            return None
+        certificate_number, date_of_birth, date_of_issue, offset, length = self.__get_entry(low)
+        if certificate_number != key:
+            return None
+
+        return {
+            'certificate_number': certificate_number.decode('ascii'),
+            'date_of_birth': date_of_birth.decode('ascii'),
+            'date_of_issue': date_of_issue.decode('ascii'),
+            'certificate_information': self.mapping[offset:offset + length].decode('utf-8'),
+        }
+
+    def close(self):
+        self.mapping.close()
+
+
+_index = None
+_index_modified = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """
+    Function to get the index at DBS_INDEX_PATH, opening it again if it has been replaced since it was last opened
+    :return: DBSIndex object, or None if no index has been configured or ingested
+    """
+    global _index, _index_modified
+
+    path = settings.DBS_INDEX_PATH
+    if not path:
+        return None
+    try:
+        modified = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if _index is None or modified != _index_modified:
+        with _index_lock:
+            if _index is None or modified != _index_modified:
+                # The previous mapping is left to be closed when no lookup is using it any longer
+                _index = DBSIndex(path)
+                _index_modified = modified
+    return _index
+
+
+def lookup(dbs_certificate_number):
+    """
+    Function to find a certificate in the local index
+    :param dbs_certificate_number: the certificate number being looked up
+    :return: dictionary in the form returned by the DBS api, or None if there is no index or the certificate is not in it
+    """
+    index = get_index()
+    if index is None:
+        return None
+    return index.lookup(dbs_certificate_number)
@@ -0,0 +1,44 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- field_updates.py --
+
+@author: Informed Solutions
+
+Updates of several fields of a record at once. Only the fields whose values change are written, in a single UPDATE of
+just those columns, and nothing is written if none change. The update goes through save(update_fields=...), so the
+save signals still fire: changes to timelogged models are tracked and the request's application cache is kept
+consistent.
+"""
+
+
+def update_fields(instance, values):
+    """
+    Function to set fields of a model instance and save those which changed
+    :param instance: the model instance to be updated
+    :param values: dictionary of field names to their new values
+    :return: list of the names of the fields which changed
+    """
+    changed = [field for field, value in values.items() if getattr(instance, field) != value]
+    if changed:
+        for field in changed:
+            setattr(instance, field, values[field])
+        instance.save(update_fields=changed)
+    return changed
+
+
+def get_field_values(field_obj, value):
+    """
+    Function to interpret the field arguments accepted by the business logic update_* helpers
+    :param field_obj: a field name, a list of field names to be given the same value, or a dictionary of field names
+    to their values
+    :param value: the value for a field name or list of field names, ignored for a dictionary
+    :return: dictionary of field names to their new values
+    """
+    if isinstance(field_obj, dict):
+        return field_obj
+    if isinstance(field_obj, list):
+        return {field: value for field in field_obj}
+    if isinstance(field_obj, str):
+        return {field_obj: value}
+    raise TypeError(
+        '{0} is not a valid field_obj, must be string, list or dict not {1}'.format(field_obj, type(field_obj)))
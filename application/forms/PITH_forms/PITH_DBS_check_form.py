@@ -6,7 +6,7 @@ from govuk_forms.widgets import NumberInput
 
 from application.business_logic import dbs_matches_childminder_dbs, find_dbs_status, DBSStatus
 from application.forms.PITH_forms.PITH_base_forms.PITH_childminder_form_retrofit import PITHChildminderFormAdapter
-from application.models import Application
+from application.application_loader import load_application
 
 log = logging.getLogger(__name__)
 
@@ -59,7 +59,7 @@ class PITHDBSCheckForm(PITHChildminderFormAdapter):
         cleaned_dbs_field = self.data[self.dbs_field_name] \
             if self.data[self.dbs_field_name] != "" \
             else None
-        application = Application.objects.get(application_id=self.application_id)
+        application = load_application(self.application_id)
 
         self.clean_dbs(cleaned_dbs_field, self.dbs_field, application)
 
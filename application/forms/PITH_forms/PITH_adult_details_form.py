@@ -6,7 +6,8 @@ from django.conf import settings
 
 from application.forms.fields import CustomSplitDateFieldDOB
 from application.forms.childminder import ChildminderForms
-from ...models import (AdultInHome, Application, UserDetails)
+from ...application_loader import load_application
+from ...models import (AdultInHome, UserDetails)
 from ...utils import date_formatter
 from ...business_logic import show_resend_and_change_email
 
@@ -140,7 +141,7 @@ class PITHAdultDetailsForm(ChildminderForms):
                 raise forms.ValidationError('Their email address cannot be the same as another person in your home')
             return email_address
         else:
-            application = Application.objects.get(application_id=self.application_id_local)
+            application = load_application(self.application_id_local)
 
             if application.application_status == 'FURTHER_INFORMATION':
                 is_review = True
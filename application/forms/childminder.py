@@ -3,6 +3,9 @@ from govuk_forms.forms import GOVUKForm
 
 from ..models import ArcComments
 
+NAME_FIELDS = ['first_name', 'last_name', 'middle_names']
+ADDRESS_FIELDS = ['street_line1', 'street_line2', 'town', 'county', 'country', 'postcode']
+
 
 class ChildminderForms(GOVUKForm):
     """
@@ -13,25 +16,47 @@ class ChildminderForms(GOVUKForm):
     pk = ''
     field_list = []
 
+    def get_arc_comments(self):
+        """
+        Fetches every ARC comment recorded against self.pk in a single query, so that flags for all fields in
+        field_list can be resolved without a query per field.
+        :return: dictionary of field names to a list of the ArcComments objects recorded against that field
+        """
+        arc_comments = {}
+        # Forms with no fields to check cannot have any flags resolved, so need no query
+        if not self.field_list:
+            return arc_comments
+        for arc_comment in ArcComments.objects.filter(table_pk=self.pk):
+            arc_comments.setdefault(arc_comment.field_name, []).append(arc_comment)
+        return arc_comments
+
+    @staticmethod
+    def get_field_comment(arc_comments, field_name):
+        """
+        Gets the single ARC comment recorded against a field
+        :param arc_comments: dictionary of comments, as returned by get_arc_comments
+        :param field_name: the name of the field to look up
+        :return: ArcComments object, or None if there is not exactly one comment for the field
+        """
+        field_comments = arc_comments.get(field_name, [])
+        if len(field_comments) == 1:
+            return field_comments[0]
+        return None
+
     def check_flag(self):
         """
         For a class to call this method it must set self.pk and self.field_list.  This method simply checks whether
         or not a field is flagged, and raises a validation error if it is
         :return: Form validation error.
         """
+        arc_comments = self.get_arc_comments()
         for i in self.field_list:
-            if ArcComments.objects.filter(table_pk=self.pk, field_name=i).exists():
-                log = ArcComments.objects.get(table_pk=self.pk, field_name=i)
-                try:
-                    if log.flagged:
-                        raise forms.ValidationError(log.comment)
-                    else:
-                        forms.ValidationError('')
-                except Exception as ex:
-                    self.cleaned_data = ''
-                    self.add_error(i, ex)
-            self.if_name(i, True)
-            self.if_address(i, True)
+            log = self.get_field_comment(arc_comments, i)
+            if log is not None and log.flagged:
+                self.cleaned_data = ''
+                self.add_error(i, forms.ValidationError(log.comment))
+            self.if_name(i, True, arc_comments)
+            self.if_address(i, True, arc_comments)
 
     def remove_flag(self):
         """
@@ -39,85 +64,72 @@ class ChildminderForms(GOVUKForm):
         comments.
         :return: Update the arc comments to remove the flag (but keep the comment)
         """
-        log = ''
+        arc_comments = self.get_arc_comments()
+        unflagged_ids = set()
         for i in self.field_list:
-            if ArcComments.objects.filter(table_pk=self.pk, field_name=i).count() == 1:
-                log = ArcComments.objects.get(table_pk=self.pk, field_name=i)
-                log.flagged = False
-                log.save()
-            self.if_name(i, False)
-            self.if_address(i, False)
-
-    def if_name(self, field, enabled):
+            log = self.get_field_comment(arc_comments, i)
+            if log is not None and log.flagged:
+                unflagged_ids.add(log.pk)
+            unflagged_ids.update(self.if_name(i, False, arc_comments))
+            unflagged_ids.update(self.if_address(i, False, arc_comments))
+
+        # Unflag every comment found above with a single UPDATE
+        if unflagged_ids:
+            ArcComments.objects.filter(pk__in=unflagged_ids).update(flagged=False)
+
+    def if_name(self, field, enabled, arc_comments=None):
         """
         This checks if a name has been flagged, as first, middle or last cannot be flagged individually.
-        :param field:
-        :return:
+        :param field: the name of the field being checked
+        :param enabled: True to raise the flag as a validation error, False to remove the flag
+        :param arc_comments: (optional) dictionary of comments, as returned by get_arc_comments
+        :return: list of the ids of comments to be unflagged
         """
+        if field not in NAME_FIELDS:
+            return []
 
-        log = None
-        if ArcComments.objects.filter(
-                table_pk=self.pk).count() > 0 and field in ['first_name', 'last_name', 'middle_names']:
-
-            if ArcComments.objects.filter(table_pk=self.pk, field_name='name').exists():
-                log = ArcComments.objects.get(table_pk=self.pk, field_name='name')
-
-            if ArcComments.objects.filter(table_pk=self.pk, field_name='full_name').exists():
-                log = ArcComments.objects.get(table_pk=self.pk, field_name='full_name')
-            try:
-                if hasattr(log, 'comment'):
+        if arc_comments is None:
+            arc_comments = self.get_arc_comments()
 
-                    if log.flagged:
-                        if enabled:
-                            raise forms.ValidationError(log.comment)
-                        else:
-                            print("DISABLE FLAG")
-                            log.flagged = False
-                            log.save()
-                else:
-                    forms.ValidationError('')
+        return self.__resolve_grouped_flag(field, enabled, arc_comments, ['name', 'full_name'], 'first_name')
 
-            except Exception as ex:
+    def if_address(self, field, enabled, arc_comments=None):
+        """
+        This checks if an address has been flagged, as each address field cannot be flagged individually.
+        :param field: the name of the field being checked
+        :param enabled: True to raise the flag as a validation error, False to remove the flag
+        :param arc_comments: (optional) dictionary of comments, as returned by get_arc_comments
+        :return: list of the ids of comments to be unflagged
+        """
+        if field not in ADDRESS_FIELDS:
+            return []
 
-                self.cleaned_data = ''
-                if field == 'first_name':
-                    self.add_error(field, ex)
+        if arc_comments is None:
+            arc_comments = self.get_arc_comments()
 
-                else:
-                    self.add_error(field, '')
+        # Right now only an address as a whole can be flagged, and the message is repeated for each field
+        return self.__resolve_grouped_flag(field, enabled, arc_comments, ['address', 'home_address'], 'street_line1')
 
-    def if_address(self, field, enabled):
+    def __resolve_grouped_flag(self, field, enabled, arc_comments, group_names, error_field):
         """
-        This checks if an address has been flagged, as each address field cannot be flagged individually.
-        :param field:
-        :return:
+        Resolves a flag raised against a group of fields (e.g. a name or an address) for one field of that group.
+        Where several group names have comments the last one in group_names takes precedence.
+        :return: list of the ids of comments to be unflagged
         """
-
         log = None
-        # Right now only an address as a whole can be flagged, and the message is repeated for each field
-        if ArcComments.objects.filter(table_pk=self.pk).count() > 0:
-            if field in ['street_line1', 'street_line2', 'town', 'county', 'country', 'postcode']:
-
-                if ArcComments.objects.filter(table_pk=self.pk, field_name='address').exists():
-                    log = ArcComments.objects.get(table_pk=self.pk, field_name='address')
-
-                if ArcComments.objects.filter(table_pk=self.pk, field_name='home_address').exists():
-                    log = ArcComments.objects.get(table_pk=self.pk, field_name='home_address')
-                try:
-
-                    if hasattr(log, 'comment'):
-                        if log.flagged:
-                            if enabled:
-                                raise forms.ValidationError(log.comment)
-                            else:
-                                print("DISABLE FLAG")
-                                log.flagged = False
-                                log.save()
-                    else:
-                        forms.ValidationError('')
-                except Exception as ex:
-                    self.cleaned_data = ''
-                    if field == 'street_line1':
-                        self.add_error(field, ex)
-                    else:
-                        self.add_error(field, '')
+        for group_name in group_names:
+            if group_name in arc_comments:
+                log = arc_comments[group_name][0]
+
+        if log is None or not log.flagged:
+            return []
+
+        if not enabled:
+            return [log.pk]
+
+        self.cleaned_data = ''
+        if field == error_field:
+            self.add_error(field, forms.ValidationError(log.comment))
+        else:
+            self.add_error(field, '')
+        return []
@@ -6,7 +6,8 @@ from application.widgets import ConditionalPostInlineRadioSelect
 from ..business_logic import childminder_dbs_duplicates_household_member_check, dbs_date_of_birth_no_match
 from ..dbs import read
 from ..forms.childminder import ChildminderForms
-from ..models import CriminalRecordCheck, Application
+from ..application_loader import load_application
+from ..models import CriminalRecordCheck
 
 
 class DBSRadioForm(ChildminderForms):
@@ -195,7 +196,7 @@ class DBSCheckDetailsForm(DBSRadioForm):
         if len(str(dbs_certificate_number)) < 12:
             raise forms.ValidationError('The certificate number should be 12 digits long')
 
-        application = Application.objects.get(pk=self.application_id)
+        application = load_application(self.application_id)
 
         if childminder_dbs_duplicates_household_member_check(application, dbs_certificate_number):
             raise forms.ValidationError('Please enter a different DBS number. '
@@ -2,6 +2,7 @@ from django import forms
 
 from application.forms.childminder import ChildminderForms
 from application.forms_helper import full_stop_stripper
+from application.application_loader import load_application
 from application.models import (Application)
 
 
@@ -37,8 +38,7 @@ class DeclarationForm(ChildminderForms):
         full_stop_stripper(self)
         # If information was previously entered, display it on the form
         if Application.objects.filter(application_id=self.application_id_local).count() > 0:
-            declaration_confirmation = Application.objects.get(
-                application_id=self.application_id_local).declaration_confirmation
+            declaration_confirmation = load_application(self.application_id_local).declaration_confirmation
             if declaration_confirmation is True:
                 self.fields['declaration_confirmation'].initial = '1'
             elif declaration_confirmation is False:
@@ -65,8 +65,7 @@ class PublishingYourDetailsForm(ChildminderForms):
         full_stop_stripper(self)
         # If information was previously entered, display it on the form
         if Application.objects.filter(application_id=self.application_id_local).count() > 0:
-            publish_details = Application.objects.get(
-                application_id=self.application_id_local).publish_details
+            publish_details = load_application(self.application_id_local).publish_details
             if publish_details is True:
                 self.fields['publish_details'].initial = None
             elif publish_details is False:
@@ -10,8 +10,8 @@ from ..business_logic import show_resend_and_change_email, TITLE_OPTIONS, get_ti
 from application.forms.fields import CustomSplitDateFieldDOB
 from ..forms.childminder import ChildminderForms
 from ..forms_helper import full_stop_stripper
+from ..application_loader import load_application
 from ..models import (AdultInHome,
-                      Application,
                       ChildInHome,
                       UserDetails)
 from ..utils import date_formatter
@@ -241,8 +241,7 @@ class OtherPeopleChildrenQuestionForm(ChildminderForms):
         super(OtherPeopleChildrenQuestionForm, self).__init__(*args, **kwargs)
         full_stop_stripper(self)
         # If information was previously entered, display it on the form
-        self.fields['children_in_home'].initial = Application.objects.get(
-            application_id=self.application_id_local).children_in_home
+        self.fields['children_in_home'].initial = load_application(self.application_id_local).children_in_home
         self.pk = self.application_id_local
         self.field_list = ['children_in_home']
 
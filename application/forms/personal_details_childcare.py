@@ -6,6 +6,7 @@ from govuk_forms.widgets import InlineRadioSelect
 
 from application.forms.childminder import ChildminderForms
 from application.forms_helper import full_stop_stripper
+from application.application_loader import load_application
 from application.models import (ApplicantHomeAddress,
                                 ApplicantPersonalDetails,
                                 Application)
@@ -218,7 +219,7 @@ class PersonalDetailsWorkingInOtherChildminderHomeForm(ChildminderForms):
         full_stop_stripper(self)
         # If information was previously entered, display it on the form
         if Application.objects.filter(application_id=self.application_id_local).count() > 0:
-            application = Application.objects.get(application_id=self.application_id_local)
+            application = load_application(self.application_id_local)
             self.fields['working_in_other_childminder_home'].initial = application.working_in_other_childminder_home
             self.field_list = ['working_in_other_childminder_home']
             self.pk = application.pk
@@ -265,7 +266,7 @@ class PersonalDetailsOwnChildrenForm(ChildminderForms):
         full_stop_stripper(self)
         # If information was previously entered, display it on the form
         if Application.objects.filter(application_id=self.application_id_local).count() > 0:
-            application = Application.objects.get(application_id=self.application_id_local)
+            application = load_application(self.application_id_local)
             self.fields['own_children'].initial = application.own_children
             self.fields['reasons_known_to_social_services'].initial = application.reasons_known_to_social_services
             self.field_list = ['own_children']
@@ -0,0 +1,111 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- gateway.py --
+
+@author: Informed Solutions
+
+Shared HTTP client for the downstream gateways (notify, payment, addressing, DBS and the integration adapter).
+Each host is given a single long lived requests session, so that connections are pooled and kept alive between calls
+instead of a new TCP/TLS connection being set up for every request.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .metrics import record_gateway_call
+
+# Only requests which are safe to repeat are retried once they have reached the gateway. Requests which failed to
+# connect are retried whatever their method, as they were never received.
+RETRYABLE_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+RETRYABLE_STATUSES = frozenset([502, 503, 504])
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def create_session():
+    """
+    Function to create a session whose connections are pooled and retried according to the gateway settings
+    :return: requests.Session object
+    """
+    retries = Retry(total=settings.GATEWAY_MAX_RETRIES,
+                    backoff_factor=settings.GATEWAY_RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRYABLE_STATUSES,
+                    method_whitelist=RETRYABLE_METHODS,
+                    raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=settings.GATEWAY_POOL_CONNECTIONS,
+                          pool_maxsize=settings.GATEWAY_POOL_MAXSIZE,
+                          max_retries=retries)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(url):
+    """
+    Function to get the pooled session for the host a url points at, creating it on first use
+    :param url: the url about to be requested
+    :return: requests.Session object
+    """
+    parts = urlsplit(url)
+    host = (parts.scheme, parts.netloc)
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = create_session()
+    return session
+
+
+def close_sessions():
+    """
+    Function to close every pooled session, releasing their connections
+    """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def request(method, url, timeout=None, **kwargs):
+    """
+    Function to issue a request to a gateway over its pooled session, recording its duration and any error
+    :param method: the HTTP method of the request
+    :param url: the url to be requested
+    :param timeout: (optional) number of seconds to wait for the gateway, defaulting to GATEWAY_TIMEOUT_IN_SECONDS
+    :param kwargs: any further arguments accepted by requests
+    :return: :class:`Response <Response>` object containing http request response
+    :rtype: requests.Response
+    """
+    if timeout is None:
+        timeout = settings.GATEWAY_TIMEOUT_IN_SECONDS
+    start = time.perf_counter()
+    try:
+        response = get_session(url).request(method, url, timeout=timeout, **kwargs)
+    except Exception as e:
+        record_gateway_call(method, url, time.perf_counter() - start, error=e)
+        raise
+    record_gateway_call(method, url, time.perf_counter() - start, status_code=response.status_code)
+    return response
+
+
+def get(url, params=None, **kwargs):
+    """
+    Function to issue a GET request to a gateway, see request()
+    """
+    return request('GET', url, params=params, **kwargs)
+
+
+def post(url, data=None, json=None, **kwargs):
+    """
+    Function to issue a POST request to a gateway, see request()
+    """
+    return request('POST', url, data=data, json=json, **kwargs)
@@ -0,0 +1,131 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- household_invitations.py --
+
+@author: Informed Solutions
+
+Sending of health check invitations to the adults in an applicant's home. Tokens for every adult are written in a
+single UPDATE and the invitation emails are then sent concurrently (or added to the notification outbox), rather than
+each adult being saved and emailed in turn. Only the adults whose invitation was sent are then marked as invited.
+"""
+
+import logging
+import random
+import string
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db.models import Case, CharField, Value, When
+from django.shortcuts import reverse
+from django.utils import timezone
+
+from . import notify
+from .models import AdultInHome
+
+log = logging.getLogger(__name__)
+
+INVITATION_TEMPLATE_ID = '1e3c066a-4bbe-4743-b6b1-1d52ac291caf'
+
+# Outcome of sending an invitation to one adult; error is None if the invitation was sent or queued
+InvitationResult = namedtuple('InvitationResult', ['adult', 'link', 'sent', 'error'])
+
+
+def generate_token():
+    """
+    :return: a new seven digit health check token
+    """
+    return ''.join([random.choice(string.digits[1:]) for n in range(7)])
+
+
+def get_health_check_link(token):
+    """
+    :param token: an adult's health check token
+    :return: the public url of the adult's health check authentication page
+    """
+    return settings.PUBLIC_APPLICATION_URL + reverse('Health-Check-Authentication', kwargs={'id': token}).replace(
+        '/childminder', '')
+
+
+def assign_tokens(adults):
+    """
+    Function to give each adult a new health check token, writing every adult in one UPDATE
+    :param adults: list of AdultInHome objects to be invited
+    """
+    if not adults:
+        return
+
+    for adult in adults:
+        adult.token = generate_token()
+
+    AdultInHome.objects.filter(pk__in=[adult.pk for adult in adults]).update(
+        token=Case(*[When(pk=adult.pk, then=Value(adult.token)) for adult in adults], output_field=CharField()))
+
+
+def record_sent_invitations(results):
+    """
+    Function to set the time the invitation was sent for each adult whose invitation was sent or queued, in one
+    UPDATE. Adults whose invitation failed are left without a timestamp, so that they are invited again.
+    :param results: list of InvitationResult objects
+    """
+    sent_adults = [result.adult for result in results if result.sent]
+    if not sent_adults:
+        return
+
+    now = timezone.now()
+    for adult in sent_adults:
+        adult.email_resent_timestamp = now
+    AdultInHome.objects.filter(pk__in=[adult.pk for adult in sent_adults]).update(email_resent_timestamp=now)
+
+
+def send_invitation(adult, link, applicant_name):
+    """
+    Function to send the invitation email to one adult
+    :param adult: AdultInHome object with a token assigned
+    :param link: the adult's health check link
+    :param applicant_name: the applicant's full name
+    :return: InvitationResult object
+    """
+    personalisation = {"link": link,
+                       "firstName": adult.first_name,
+                       "ApplicantName": applicant_name}
+    try:
+        r = notify.send_email(adult.email, personalisation, INVITATION_TEMPLATE_ID,
+                              idempotency_key='health-check-invitation-' + str(adult.pk) + '-' + adult.token)
+    except Exception as e:
+        log.exception('Failed to send health check invitation to adult ' + str(adult.pk))
+        return InvitationResult(adult, link, False, str(e) or e.__class__.__name__)
+
+    status_code = getattr(r, 'status_code', None)
+    if status_code is not None and status_code >= 300:
+        log.error('Notify gateway responded ' + str(status_code) + ' to health check invitation for adult ' +
+                  str(adult.pk))
+        return InvitationResult(adult, link, False, 'Notify gateway responded ' + str(status_code))
+    return InvitationResult(adult, link, True, None)
+
+
+def send_health_check_invitations(adults, applicant_name):
+    """
+    Function to invite each adult who has not yet completed their health check, and has not already been sent an
+    invitation, to do so
+    :param adults: iterable of AdultInHome objects living in or regularly visiting the applicant's home
+    :param applicant_name: the applicant's full name, included in the invitation
+    :return: list of InvitationResult objects, one for each adult invited, in the order given
+    """
+    # Adults who have already been sent an invitation keep their token, so that the link they were sent still works
+    adults = [adult for adult in adults
+              if adult.health_check_status != 'Done' and adult.email_resent_timestamp is None]
+    assign_tokens(adults)
+
+    invitations = [(adult, get_health_check_link(adult.token), applicant_name) for adult in adults]
+
+    # Queued invitations are written to the outbox by this thread, otherwise they are sent to the gateway in parallel
+    if len(invitations) > 1 and not notify.is_asynchronous(None):
+        with ThreadPoolExecutor(max_workers=min(len(invitations), settings.HOUSEHOLD_INVITATION_CONCURRENCY)) \
+                as executor:
+            results = list(executor.map(lambda invitation: send_invitation(*invitation), invitations))
+    else:
+        results = [send_invitation(*invitation) for invitation in invitations]
+
+    record_sent_invitations(results)
+    return results
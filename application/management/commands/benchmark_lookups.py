@@ -0,0 +1,100 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- benchmark_lookups.py --
+
+@author: Informed Solutions
+
+Management command reporting the latency of the sign in and health check login lookups, with and without their indexes
+"""
+
+import random
+import timeit
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ...models import AdultInHome, Application, UserDetails
+
+# Indexes added by migration 0075_lookup_indexes
+LOOKUP_INDEXES = ('user_details_email_upper_idx', 'user_details_magic_link_idx', 'adult_in_home_token_idx')
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Seeds applications and measures the latency of the email, magic link and health check token lookups ' \
+           'with and without their indexes. The seeded applications and dropped indexes are rolled back afterwards, ' \
+           'but the tables are locked while the command runs, so it should not be run against a live database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--applications', type=int, default=10000,
+                            help='Number of applications to seed')
+        parser.add_argument('--iterations', type=int, default=1000,
+                            help='Number of lookups to time for each scenario')
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                emails, links, tokens = self.seed(options['applications'])
+                scenarios = [
+                    ('Email (case insensitive)', lambda: UserDetails.get_by_email(random.choice(emails).upper())),
+                    ('Magic link', lambda: UserDetails.objects.get(magic_link_email=random.choice(links))),
+                    ('Health check token', lambda: AdultInHome.objects.get(token=random.choice(tokens))),
+                ]
+
+                with_indexes = self.time(scenarios, options['iterations'])
+                with connection.cursor() as cursor:
+                    for index in LOOKUP_INDEXES:
+                        cursor.execute('DROP INDEX IF EXISTS ' + index)
+                    cursor.execute('ANALYZE "USER_DETAILS"')
+                    cursor.execute('ANALYZE "ADULT_IN_HOME"')
+                without_indexes = self.time(scenarios, options['iterations'])
+
+                for description, seconds in without_indexes:
+                    self.stdout.write('{0}: {1:.1f} microseconds per lookup without indexes, {2:.1f} with'.format(
+                        description, seconds / options['iterations'] * 1000000,
+                        dict(with_indexes)[description] / options['iterations'] * 1000000))
+
+                raise Rollback()
+        except Rollback:
+            pass
+
+    @staticmethod
+    def seed(count):
+        """
+        Method to create applications with an account and an adult in the home awaiting their health check
+        :param count: the number of applications to create
+        :return: tuple of the lists of seeded email addresses, magic link codes and health check tokens
+        """
+        now = timezone.now()
+        applications = [Application(application_id=uuid.uuid4(), application_type='CHILDMINDER',
+                                    application_status='DRAFTING', date_created=now, date_updated=now)
+                        for n in range(count)]
+        Application.objects.bulk_create(applications, batch_size=1000)
+
+        emails = ['Benchmark.{0}@example.com'.format(n) for n in range(count)]
+        links = [uuid.uuid4().hex[:12].upper() for n in range(count)]
+        tokens = [uuid.uuid4().hex for n in range(count)]
+
+        UserDetails.objects.bulk_create([
+            UserDetails(application_id=application, email=email, magic_link_email=link)
+            for application, email, link in zip(applications, emails, links)], batch_size=1000)
+        AdultInHome.objects.bulk_create([
+            AdultInHome(application_id=application, birth_day=1, birth_month=1, birth_year=1980, token=token)
+            for application, token in zip(applications, tokens)], batch_size=1000)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE "USER_DETAILS"')
+            cursor.execute('ANALYZE "ADULT_IN_HOME"')
+        return emails, links, tokens
+
+    @staticmethod
+    def time(scenarios, iterations):
+        """
+        :return: list of each scenario's description and the number of seconds its lookups took
+        """
+        return [(description, timeit.timeit(lookup, number=iterations)) for description, lookup in scenarios]
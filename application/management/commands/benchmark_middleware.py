@@ -0,0 +1,46 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- benchmark_middleware.py --
+
+@author: Informed Solutions
+
+Management command reporting the per-request overhead of CustomAuthenticationHandler
+"""
+
+import timeit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.signing import TimestampSigner
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from ...middleware import CustomAuthenticationHandler, COOKIE_IDENTIFIER
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-request overhead of the custom authentication middleware'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=10000,
+                            help='Number of requests to time for each scenario')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        middleware = CustomAuthenticationHandler(lambda request: HttpResponse())
+        factory = RequestFactory()
+
+        authenticated_request = factory.get(settings.URL_PREFIX + '/task-list/')
+        authenticated_request.COOKIES[COOKIE_IDENTIFIER] = TimestampSigner().sign('benchmark@example.com')
+
+        scenarios = [
+            ('Authentication exempt path (first pattern)', factory.get(settings.URL_PREFIX + '/')),
+            ('Authentication exempt path (last pattern)', factory.get(settings.URL_PREFIX + '/prepare-interview/')),
+            ('Protected path without session', factory.get(settings.URL_PREFIX + '/task-list/')),
+            ('Protected path with session', authenticated_request),
+        ]
+
+        for description, request in scenarios:
+            seconds = timeit.timeit(lambda: middleware(request), number=iterations)
+            self.stdout.write('{0}: {1:.2f} microseconds per request'.format(
+                description, seconds / iterations * 1000000))
@@ -0,0 +1,94 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- ingest_capita_dbs_file.py --
+
+@author: Informed Solutions
+
+Management command loading a Capita DBS export into the local DBS index
+"""
+
+import csv
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from ...dbs_index import is_valid_record, write_index
+from ...models import CapitaDBSFile
+
+CSV_FIELDS = ('certificate_number', 'date_of_birth', 'date_of_issue', 'certificate_information')
+
+# Column positions of each field in a fixed width export, with the certificate information running to the end of the
+# line. Dates are in YYYY-MM-DD format in both kinds of export.
+FIXED_WIDTH_FIELDS = (('certificate_number', 0, 12), ('date_of_birth', 12, 22), ('date_of_issue', 22, 32),
+                      ('certificate_information', 32, None))
+
+
+def read_csv(export):
+    """
+    :param export: file object of a CSV export with a header row naming each of CSV_FIELDS
+    :return: generator of record dictionaries
+    """
+    reader = csv.DictReader(export)
+    missing = [field for field in CSV_FIELDS if field not in (reader.fieldnames or [])]
+    if missing:
+        raise CommandError('Export is missing the columns: ' + ', '.join(missing))
+    for row in reader:
+        yield {field: row[field].strip() for field in CSV_FIELDS}
+
+
+def read_fixed_width(export):
+    """
+    :param export: file object of a fixed width export laid out as FIXED_WIDTH_FIELDS
+    :return: generator of record dictionaries
+    """
+    for line in export:
+        line = line.rstrip('\r\n')
+        if line.strip():
+            yield {field: line[start:end].strip() for field, start, end in FIXED_WIDTH_FIELDS}
+
+
+class Command(BaseCommand):
+    help = 'Loads a Capita DBS export into the local index used to look up DBS certificates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('export', help='Path of the Capita DBS export')
+        parser.add_argument('--format', choices=['csv', 'fixed-width'],
+                            help='Format of the export, by default csv if the file name ends in .csv')
+        parser.add_argument('--index-path', default=settings.DBS_INDEX_PATH,
+                            help='Path of the index to write, by default DBS_INDEX_PATH')
+
+    def handle(self, *args, **options):
+        export_path = options['export']
+        index_path = options['index_path']
+        if not index_path:
+            raise CommandError('No index path given and DBS_INDEX_PATH is not set')
+
+        export_format = options['format'] or ('csv' if export_path.lower().endswith('.csv') else 'fixed-width')
+        read_export = read_csv if export_format == 'csv' else read_fixed_width
+
+        checksum = hashlib.sha256()
+        with open(export_path, 'rb') as export:
+            for chunk in iter(lambda: export.read(1024 * 1024), b''):
+                checksum.update(chunk)
+
+        skipped = 0
+        records = []
+        with open(export_path, newline='', encoding='utf-8') as export:
+            for record in read_export(export):
+                if is_valid_record(record):
+                    records.append(record)
+                else:
+                    skipped += 1
+
+        record_count = write_index(records, index_path)
+
+        CapitaDBSFile.objects.create(filename=os.path.basename(export_path)[:100],
+                                     date_uploaded=timezone.now().date(),
+                                     record_count=record_count,
+                                     checksum=checksum.hexdigest())
+
+        self.stdout.write('Indexed {0} certificates from {1} to {2}, skipped {3} invalid rows'.format(
+            record_count, export_path, index_path, skipped))
@@ -0,0 +1,124 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- reconcile_payments.py --
+
+@author: Informed Solutions
+
+Management command reconciling submitted payments which have not been marked as authorised with Worldpay
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from ...models import Payment
+from ...payment_reconciliation import reconcile_application_payment
+
+
+class RateLimiter:
+    """
+    Limits the number of calls made per second across all threads
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self.next_call = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Command(BaseCommand):
+    help = 'Checks the status of submitted payments which have not been authorised, finalising authorised payments ' \
+           'and rolling back refused or errored payments and payments Worldpay has no record of'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Reconcile the payments which are currently outstanding and exit')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of payments to check at the same time')
+        parser.add_argument('--rate', type=float, default=5,
+                            help='Maximum number of payment status checks per second')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Maximum number of payments to check in each sweep')
+        parser.add_argument('--interval', type=float, default=60,
+                            help='Number of seconds to wait between sweeps')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The last payment checked, so that each sweep carries on from where the previous one stopped
+        self.last_payment_id = None
+
+    def handle(self, *args, **options):
+        while True:
+            outcomes = self.sweep(options['batch_size'], options['concurrency'], options['rate'])
+            if outcomes:
+                self.stdout.write(', '.join('{0} {1}'.format(count, outcome)
+                                            for outcome, count in sorted(outcomes.items())))
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+
+    def sweep(self, batch_size, concurrency, rate):
+        """
+        Method to check the status of every outstanding payment once
+        :param batch_size: the maximum number of payments to check
+        :param concurrency: the number of payments to check at the same time
+        :param rate: the maximum number of checks per second
+        :return: Counter of the outcome of each check
+        """
+        application_ids = self.get_outstanding_application_ids(batch_size)
+        rate_limiter = RateLimiter(rate)
+
+        def reconcile(application_id):
+            rate_limiter.wait()
+            try:
+                return reconcile_application_payment(application_id)
+            except Exception as e:
+                self.stderr.write('Failed to reconcile payment for application {0}: {1}'.format(application_id, e))
+                return 'FAILED'
+
+        def reconcile_in_thread(application_id):
+            try:
+                return reconcile(application_id)
+            finally:
+                # Each worker thread has its own connection, closed once it is finished with
+                connection.close()
+
+        if concurrency <= 1:
+            return Counter(map(reconcile, application_ids))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return Counter(executor.map(reconcile_in_thread, application_ids))
+
+    def get_outstanding_application_ids(self, batch_size):
+        """
+        Method to get the next batch of payments which have been submitted but not authorised. Payments are taken in
+        order, carrying on from the last payment checked and wrapping around to the first, so that payments which
+        remain pending do not stop later payments from being checked.
+        :param batch_size: the maximum number of payments to return
+        :return: list of the ids of the applications whose payments are to be checked
+        """
+        outstanding = Payment.objects.filter(payment_submitted=True, payment_authorised=False) \
+            .exclude(payment_reference='PENDING').order_by('payment_id')
+
+        if self.last_payment_id is None:
+            payments = list(outstanding.values_list('payment_id', 'application_id')[:batch_size])
+        else:
+            payments = list(outstanding.filter(payment_id__gt=self.last_payment_id)
+                            .values_list('payment_id', 'application_id')[:batch_size])
+            if len(payments) < batch_size:
+                payments += list(outstanding.filter(payment_id__lte=self.last_payment_id)
+                                 .values_list('payment_id', 'application_id')[:batch_size - len(payments)])
+
+        self.last_payment_id = payments[-1][0] if payments else None
+        return [application_id for payment_id, application_id in payments]
@@ -0,0 +1,40 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- relay_payment_messages.py --
+
+@author: Informed Solutions
+
+Management command publishing the SC1 payment messages waiting in the payment outbox
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...payment_outbox import relay_due_payment_messages
+
+
+class Command(BaseCommand):
+    help = 'Publishes the SC1 payment messages waiting in the payment outbox to SQS, retrying those which fail'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Publish the messages which are currently due and exit')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of SQS batches of ten messages to publish at the same time')
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Maximum number of messages to claim at a time')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Number of seconds to wait when no messages are due')
+
+    def handle(self, *args, **options):
+        while True:
+            published, failed = relay_due_payment_messages(options['batch_size'], options['concurrency'])
+            if published or failed:
+                self.stdout.write('Published {0} payment messages, {1} failed'.format(published, failed))
+
+            if options['once']:
+                if published + failed < options['batch_size']:
+                    break
+            elif not published and not failed:
+                time.sleep(options['interval'])
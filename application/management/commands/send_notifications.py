@@ -0,0 +1,40 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- send_notifications.py --
+
+@author: Informed Solutions
+
+Management command sending the emails and texts waiting in the notification outbox
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...notification_outbox import send_due_notifications
+
+
+class Command(BaseCommand):
+    help = 'Sends the emails and texts waiting in the notification outbox, retrying those which fail'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Send the notifications which are currently due and exit')
+        parser.add_argument('--concurrency', type=int, default=4,
+                            help='Number of notifications to send at the same time')
+        parser.add_argument('--batch-size', type=int, default=50,
+                            help='Maximum number of notifications to claim at a time')
+        parser.add_argument('--interval', type=float, default=5,
+                            help='Number of seconds to wait when no notifications are due')
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_due_notifications(options['batch_size'], options['concurrency'])
+            if sent or failed:
+                self.stdout.write('Sent {0} notifications, {1} failed'.format(sent, failed))
+
+            if options['once']:
+                if sent + failed < options['batch_size']:
+                    break
+            elif not sent and not failed:
+                time.sleep(options['interval'])
@@ -1,21 +1,59 @@
 import boto3
+import collections
 import logging
 import json
+import os
+import threading
 
 from django.conf import settings
 
 logger = logging.getLogger()
 
+# The largest number of messages SQS accepts in a single send_message_batch request
+MAX_BATCH_SIZE = 10
+
+
+class LocalSQSClient:
+    """
+    Stand-in for the SQS client used when SQS_BACKEND is 'local', for offline development and tests. Messages are
+    appended to a file per queue in SQS_LOCAL_QUEUE_DIRECTORY if it is set, otherwise kept in memory.
+    """
+
+    messages = collections.defaultdict(list)
+    lock = threading.Lock()
+
+    def __init__(self, directory=None):
+        self.directory = directory
+
+    def get_queue_url(self, QueueName):
+        return {'QueueUrl': 'local://' + QueueName}
+
+    create_queue = get_queue_url
+
+    def send_message(self, QueueUrl, MessageBody):
+        self.__store(QueueUrl, [MessageBody])
+        return {'MessageId': str(len(self.messages[QueueUrl]))}
+
+    def send_message_batch(self, QueueUrl, Entries):
+        self.__store(QueueUrl, [entry['MessageBody'] for entry in Entries])
+        return {'Successful': [{'Id': entry['Id']} for entry in Entries], 'Failed': []}
+
+    def __store(self, queue_url, message_bodies):
+        with self.lock:
+            if self.directory:
+                queue_name = queue_url[len('local://'):]
+                with open(os.path.join(self.directory, queue_name + '.jsonl'), 'a') as queue_file:
+                    queue_file.writelines(message_body + '\n' for message_body in message_bodies)
+            else:
+                self.messages[queue_url].extend(message_bodies)
+
 
 class SQSHandler:
     """
-    Class for managing interactions with an Amazon SQS endpoint
+    Class for managing interactions with an Amazon SQS endpoint. The connection to SQS is only made when the first
+    message is published, and messages which could not be published are kept in a buffer to be retried.
     """
 
-    # Get the service resource
-    session = None
-    sqs = None
-    queue = None
     logger = logging.getLogger()
 
     def __init__(self, queue_name):
@@ -23,28 +61,109 @@ class SQSHandler:
         Default constructor
         :param queue_name: The name of the queue to publish messages to.
         """
-        self.logger.debug("Configuring SQS queue")
+        self.queue_name = queue_name
+        self.client = None
+        self.queue_url = None
+        self.lock = threading.Lock()
+        self.retry_buffer = collections.deque(maxlen=settings.SQS_RETRY_BUFFER_SIZE)
 
-        try:
-            self.session = boto3.Session(
-                aws_access_key_id=settings.AWS_SQS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SQS_SECRET_ACCESS_KEY,
-                region_name='eu-west-2'
-            )
-
-            # Get the queue. This returns an SQS.Queue instance
-            self.sqs = self.session.resource('sqs')
-            self.queue = self.sqs.get_queue_by_name(QueueName=queue_name)
-        except Exception as e:
-            logger.error(e)
-            self.queue = self.sqs.create_queue(QueueName=queue_name)
+    def connect(self):
+        """
+        Method to create the SQS client and look up the queue url, if not already done
+        """
+        if self.queue_url is not None:
+            return
+        with self.lock:
+            if self.queue_url is not None:
+                return
+
+            self.logger.debug("Configuring SQS queue")
+
+            if settings.SQS_BACKEND == 'local':
+                client = LocalSQSClient(settings.SQS_LOCAL_QUEUE_DIRECTORY)
+            else:
+                session = boto3.Session(
+                    aws_access_key_id=settings.AWS_SQS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SQS_SECRET_ACCESS_KEY,
+                    region_name='eu-west-2'
+                )
+                client = session.client('sqs')
+
+            try:
+                queue_url = client.get_queue_url(QueueName=self.queue_name)['QueueUrl']
+            except Exception as e:
+                logger.error(e)
+                queue_url = client.create_queue(QueueName=self.queue_name)['QueueUrl']
+
+            self.client = client
+            self.queue_url = queue_url
 
     def send_message(self, body):
         """
-        Genericised method for publishing a message to an SQS queue
+        Genericised method for publishing a message to an SQS queue. If the message cannot be published it is added
+        to the retry buffer, to be published before the next message.
         """
+        self.retry()
         try:
-            response = self.queue.send_message(MessageBody=json.dumps(body))
-            return response
+            self.connect()
+            return self.client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(body))
         except Exception as e:
             self.logger.error(e)
+            self.retry_buffer.append(body)
+
+    def send_messages(self, bodies, buffer_failures=True):
+        """
+        Method for publishing several messages to an SQS queue, in batches of up to ten
+        :param bodies: list of messages to be published
+        :param buffer_failures: whether to add messages which could not be published to the retry buffer
+        :return: list of the messages which could not be published
+        """
+        failed = []
+        for start in range(0, len(bodies), MAX_BATCH_SIZE):
+            batch = bodies[start:start + MAX_BATCH_SIZE]
+            entries = [{'Id': str(index), 'MessageBody': json.dumps(body)} for index, body in enumerate(batch)]
+            try:
+                self.connect()
+                response = self.client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+                failed.extend(batch[int(failure['Id'])] for failure in response.get('Failed', []))
+            except Exception as e:
+                self.logger.error(e)
+                failed.extend(batch)
+
+        if failed:
+            self.logger.error('Failed to publish ' + str(len(failed)) + ' messages to ' + self.queue_name)
+            if buffer_failures:
+                self.retry_buffer.extend(failed)
+        return failed
+
+    def retry(self):
+        """
+        Method to publish the messages in the retry buffer
+        :return: the number of messages still waiting to be retried
+        """
+        if not self.retry_buffer:
+            return 0
+        with self.lock:
+            bodies = list(self.retry_buffer)
+            self.retry_buffer.clear()
+        self.logger.info('Retrying ' + str(len(bodies)) + ' messages for ' + self.queue_name)
+        return len(self.send_messages(bodies))
+
+
+_handlers = {}
+_handlers_lock = threading.Lock()
+
+
+def get_sqs_handler(queue_name):
+    """
+    Function to get the process wide handler for a queue, creating it on first use
+    :param queue_name: The name of the queue to publish messages to.
+    :return: SQSHandler object
+    """
+    handler = _handlers.get(queue_name)
+    if handler is None:
+        with _handlers_lock:
+            handler = _handlers.get(queue_name)
+            if handler is None:
+                handler = _handlers[queue_name] = SQSHandler(queue_name)
+    return handler
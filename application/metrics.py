@@ -0,0 +1,198 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- metrics.py --
+
+@author: Informed Solutions
+
+In-process registry of latency histograms and error counters, rendered in the Prometheus text exposition format by
+the metrics view. MetricsMiddleware times each view by url name, and the gateway module times each call to the
+notify, payment, addressing, DBS and integration adapter gateways. Recording a value costs a dictionary lookup, a
+bisect and an increment under a lock, so instrumentation can be left on in production. Values are held per process,
+so each worker reports its own figures.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+HTTP_METHODS = frozenset(['GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'])
+
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def format_labels(labelnames, labelvalues, extra=''):
+    """
+    :return: the label set of a sample, e.g. {view="Task-List-View",method="GET"}
+    """
+    labels = ['{0}="{1}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+              for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        labels.append(extra)
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+
+class Counter:
+    """
+    Count of events, by label values
+    """
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount=1):
+        with self.lock:
+            self.values[labelvalues] = self.values.get(labelvalues, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            values = sorted(self.values.items())
+        for labelvalues, value in values:
+            yield self.name + format_labels(self.labelnames, labelvalues), value
+
+
+class Histogram:
+    """
+    Distribution of observed durations, by label values
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Label values -> [count in each bucket, with a final +Inf bucket, sum of observations]
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, *labelvalues):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.values.get(labelvalues)
+            if series is None:
+                series = self.values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self):
+        with self.lock:
+            values = sorted((labelvalues, (list(counts), total)) for labelvalues, (counts, total) in self.values.items())
+        for labelvalues, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                yield self.name + '_bucket' + format_labels(self.labelnames, labelvalues, 'le="{0}"'.format(bound)), \
+                    cumulative
+            yield self.name + '_sum' + format_labels(self.labelnames, labelvalues), total
+            yield self.name + '_count' + format_labels(self.labelnames, labelvalues), cumulative
+
+
+class Registry:
+    """
+    Collection of metrics rendered together
+    """
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def clear(self):
+        for metric in self.metrics:
+            with metric.lock:
+                metric.values.clear()
+
+    def render(self):
+        """
+        :return: every metric in the Prometheus text exposition format
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append('# HELP {0} {1}'.format(metric.name, metric.documentation))
+            lines.append('# TYPE {0} {1}'.format(metric.name, metric.type))
+            lines.extend('{0} {1}'.format(sample, repr(float(value))) for sample, value in metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+view_duration = registry.register(Histogram(
+    'childminder_view_duration_seconds', 'Time taken to respond to requests, by url name',
+    ('view', 'method')))
+view_responses = registry.register(Counter(
+    'childminder_view_responses_total', 'Responses returned, by url name and status code',
+    ('view', 'method', 'status')))
+gateway_duration = registry.register(Histogram(
+    'childminder_gateway_request_duration_seconds', 'Time taken by calls to downstream gateways',
+    ('gateway', 'method')))
+gateway_errors = registry.register(Counter(
+    'childminder_gateway_errors_total', 'Calls to downstream gateways which raised an error or returned a 5xx status',
+    ('gateway', 'method', 'error')))
+
+
+def get_gateway_name(url):
+    """
+    :param url: the url of a gateway request
+    :return: the name of the gateway the url belongs to, or its host if it is not one of the configured gateways
+    """
+    for name, base_url in (('notify', settings.NOTIFY_URL), ('payment', settings.PAYMENT_URL),
+                           ('addressing', settings.ADDRESSING_URL), ('dbs', settings.DBS_URL),
+                           ('noo', settings.INTEGRATION_ADAPTER_URL)):
+        if base_url and url.startswith(base_url):
+            return name
+    return urlsplit(url).netloc
+
+
+def record_gateway_call(method, url, duration, status_code=None, error=None):
+    """
+    Function to record the outcome of a gateway call
+    :param method: the HTTP method of the call
+    :param url: the url called
+    :param duration: the number of seconds the call took
+    :param status_code: (optional) the status of the response, if one was received
+    :param error: (optional) the exception raised by the call
+    """
+    gateway = get_gateway_name(url)
+    gateway_duration.observe(duration, gateway, method)
+    if error is not None:
+        gateway_errors.inc(gateway, method, error.__class__.__name__)
+    elif isinstance(status_code, int) and status_code >= 500:
+        gateway_errors.inc(gateway, method, str(status_code))
+
+
+class MetricsMiddleware(object):
+    """
+    Middleware timing each request by the name of the url it resolved to, enabled by METRICS_ENABLED
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view = resolver_match.url_name if resolver_match is not None and resolver_match.url_name else 'unresolved'
+        # Methods are limited to the standard set so that arbitrary requests cannot create new series
+        method = request.method if request.method in HTTP_METHODS else 'OTHER'
+        view_duration.observe(duration, view, method)
+        view_responses.inc(view, method, response.status_code)
+        return response
@@ -4,16 +4,22 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 @author: Informed Solutions
 """
 
-from re import compile
+import time
+from re import compile, sub
 
 from django.conf import settings
 from django.http import HttpResponseRedirect
 from django.core.signing import BadSignature, TimestampSigner, SignatureExpired
+from django.utils import baseconv
 
-from .models import Application, UserDetails
+from .application_loader import start_request, end_request, load_application
+from .ownership_cache import ownership_cache
 
 COOKIE_IDENTIFIER = '_ofs'
 
+# Lifetime of the session cookie in seconds
+SESSION_MAX_AGE = 1800
+
 
 class CustomAuthenticationHandler(object):
     """
@@ -23,19 +29,39 @@ class CustomAuthenticationHandler(object):
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.authentication_exempt_matcher = CustomAuthenticationHandler.compile_authentication_exempt_urls()
 
-    def __call__(self, request):
+    @staticmethod
+    def compile_authentication_exempt_urls():
+        """
+        Combines the login url and any authentication exempt url patterns defined in settings.py into a single
+        compiled regular expression, so that each request is tested against one pattern rather than recompiling and
+        testing each of them in turn
+        :return: compiled regular expression matching any authentication exempt path
+        """
         # Default the login url as being authentication exempt
-        authentication_exempt_urls = [compile(settings.LOGIN_URL.lstrip('/'))]
+        patterns = [settings.LOGIN_URL.lstrip('/')]
 
         # If further login exempt URLs have been defined in the settings.py file, append these to
         # the collection
         if hasattr(settings, 'AUTHENTICATION_EXEMPT_URLS'):
-            authentication_exempt_urls += [compile(expr) for expr in settings.AUTHENTICATION_EXEMPT_URLS]
+            patterns += list(settings.AUTHENTICATION_EXEMPT_URLS)
 
+        # Named groups are dropped as the same name may not appear twice in a single expression
+        return compile('|'.join('(?:%s)' % sub(r'\(\?P<\w+>', '(?:', pattern) for pattern in patterns))
+
+    def __call__(self, request):
+        # Share a single cache of applications between everything handling this request
+        start_request(request)
+        try:
+            return self.handle(request)
+        finally:
+            end_request()
+
+    def handle(self, request):
         # Allow authentication exempt paths straight through middleware function
-        if request.path_info == settings.AUTHENTICATION_URL or any(
-                m.match(request.path_info) for m in authentication_exempt_urls):
+        if request.path_info == settings.AUTHENTICATION_URL or \
+                self.authentication_exempt_matcher.match(request.path_info):
             return self.get_response(request)
 
         # If path is not exempt, and user cookie does not exist (e.g. a bypass is being attempted) return
@@ -54,20 +80,20 @@ class CustomAuthenticationHandler(object):
         if request.method == 'POST' and 'id' in request.POST:
             application_id = request.POST['id']
 
-        # If an application id is present fetch application from store
+        # If an application id is present check the email address stored in the session matches that found on the
+        # application and if not raise generic exception
         if application_id is not None:
-            application = Application.objects.get(pk=application_id)
-            account = UserDetails.objects.get(application_id=application)
-            # Check the email address stored in the session matches that found on the application
-            # and if not raise generic exception
-            if account.email != self.get_session_user(request):
+            if not ownership_cache.is_owner(session_user, application_id):
                 raise Exception
 
         # If request has not been blocked at this point in the execution flow, allow
         # request to continue processing as normal
         response = self.get_response(request)
 
-        if session_user is not None:
+        # Slide the session forward only once the cookie is near expiry, and never over a cookie set or deleted by the
+        # view itself
+        if session_user is not None and COOKIE_IDENTIFIER not in response.cookies and \
+                self.get_session_age(request) >= SESSION_MAX_AGE - settings.SESSION_REFRESH_WINDOW_IN_SECONDS:
             CustomAuthenticationHandler.create_session(response, session_user)
 
         return response
@@ -77,17 +103,43 @@ class CustomAuthenticationHandler(object):
         global COOKIE_IDENTIFIER
         return COOKIE_IDENTIFIER
 
+    @staticmethod
+    def get_session(request):
+        """
+        Method to verify the session cookie, memoised on the request so that the signature is only checked once
+        however many times the session is inspected while handling the request
+        :param request: the request being handled
+        :return: tuple of the session email address and the cookie's age in seconds, or (None, None)
+        """
+        if not hasattr(request, '_ofs_session'):
+            request._ofs_session = CustomAuthenticationHandler.unsign_session(request.COOKIES.get(COOKIE_IDENTIFIER))
+        return request._ofs_session
+
+    @staticmethod
+    def unsign_session(signed_email):
+        """
+        :param signed_email: the value of the session cookie
+        :return: tuple of the session email address and the cookie's age in seconds, or (None, None)
+        """
+        if signed_email is None:
+            return None, None
+        signer = TimestampSigner()
+        try:
+            email = signer.unsign(signed_email, max_age=SESSION_MAX_AGE)
+        except BadSignature or SignatureExpired:
+            # the cookie identifier has not been signed
+            return None, None
+        # The signature has been verified, so the timestamp can be read straight out of the cookie value
+        timestamp = baseconv.base62.decode(signed_email.rsplit(signer.sep, 2)[1])
+        return email, time.time() - timestamp
+
     @staticmethod
     def get_session_user(request):
-        if COOKIE_IDENTIFIER not in request.COOKIES:
-            return None
-        else:
-            signer = TimestampSigner()
-            try:
-                return signer.unsign(request.COOKIES.get(COOKIE_IDENTIFIER), max_age=1800)
-            except BadSignature or SignatureExpired:
-                # the cookie identifier has not been signed
-                return None
+        return CustomAuthenticationHandler.get_session(request)[0]
+
+    @staticmethod
+    def get_session_age(request):
+        return CustomAuthenticationHandler.get_session(request)[1]
 
     @staticmethod
     def create_session(response, email):
@@ -95,7 +147,7 @@ class CustomAuthenticationHandler(object):
         signer = TimestampSigner()
         signed_email = signer.sign(email)
         response.set_cookie(COOKIE_IDENTIFIER, signed_email,
-                            secure=settings.SESSION_COOKIE_SECURE, httponly=True, max_age=1800)
+                            secure=settings.SESSION_COOKIE_SECURE, httponly=True, max_age=SESSION_MAX_AGE)
 
     @staticmethod
     def destroy_session(response):
@@ -144,7 +196,7 @@ def register_as_childminder_link_location(request):
 
         if application_id is not None:
 
-            application = Application.objects.get(pk=application_id)
+            application = load_application(application_id)
 
             if application.application_status not in ['ARC_REVIEW', 'CYGNUM_REVIEW', 'SUBMITTED']:
 
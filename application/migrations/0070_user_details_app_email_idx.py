@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 06:54
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0069_auto_20191219_1424'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userdetails',
+            index=models.Index(fields=['application_id', 'email'], name='user_details_app_email_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 06:59
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0070_user_details_app_email_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummarySnapshot',
+            fields=[
+                ('application_id', models.OneToOneField(db_column='application_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='application.Application')),
+                ('version', models.IntegerField()),
+                ('context', models.BinaryField()),
+                ('date_created', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'SUMMARY_SNAPSHOT',
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 07:05
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0071_summarysnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundNotification',
+            fields=[
+                ('notification_id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('idempotency_key', models.CharField(max_length=100, unique=True)),
+                ('notification_type', models.CharField(choices=[('EMAIL', 'EMAIL'), ('SMS', 'SMS')], max_length=10)),
+                ('recipient', models.CharField(max_length=100)),
+                ('template_id', models.CharField(max_length=100)),
+                ('personalisation', models.TextField()),
+                ('status', models.CharField(choices=[('PENDING', 'PENDING'), ('SENDING', 'SENDING'), ('SENT', 'SENT'), ('FAILED', 'FAILED')], default='PENDING', max_length=10)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('last_error', models.TextField(blank=True)),
+                ('date_created', models.DateTimeField(auto_now_add=True)),
+                ('date_sent', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'OUTBOUND_NOTIFICATION',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='outboundnotification',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='outbound_notif_due_idx'),
+        ),
+    ]
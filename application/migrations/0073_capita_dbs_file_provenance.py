@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 07:13
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0072_outboundnotification'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='capitadbsfile',
+            name='checksum',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='capitadbsfile',
+            name='record_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
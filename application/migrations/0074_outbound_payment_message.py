@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 07:21
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0073_capita_dbs_file_provenance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundPaymentMessage',
+            fields=[
+                ('message_id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('payment_ref', models.CharField(max_length=29, unique=True)),
+                ('message_body', models.TextField()),
+                ('status', models.CharField(choices=[('PENDING', 'PENDING'), ('PUBLISHING', 'PUBLISHING'), ('PUBLISHED', 'PUBLISHED')], default='PENDING', max_length=10)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('last_error', models.TextField(blank=True)),
+                ('date_created', models.DateTimeField(auto_now_add=True)),
+                ('date_published', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'OUTBOUND_PAYMENT_MESSAGE',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='outboundpaymentmessage',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='outbound_payment_due_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Indexes for the lookups made by the sign in and health check login pages. These cannot be expressed as model
+    indexes in this version of Django: the email index is on the upper cased address to serve case insensitive lookups,
+    and the token indexes are partial as most rows have no token.
+    """
+
+    dependencies = [
+        ('application', '0074_outbound_payment_message'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX user_details_email_upper_idx ON "USER_DETAILS" (UPPER("email"))',
+            'DROP INDEX user_details_email_upper_idx',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX user_details_magic_link_idx ON "USER_DETAILS" ("magic_link_email") '
+            'WHERE "magic_link_email" IS NOT NULL',
+            'DROP INDEX user_details_magic_link_idx',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX adult_in_home_token_idx ON "ADULT_IN_HOME" ("token") WHERE "token" IS NOT NULL',
+            'DROP INDEX adult_in_home_token_idx',
+        ),
+    ]
@@ -29,3 +29,6 @@ from .child_address import *
 from .childbase import *
 from .child import *
 from .capita_dbs_file import CapitaDBSFile
+from .summary_snapshot import SummarySnapshot
+from .outbound_notification import OutboundNotification
+from .outbound_payment_message import OutboundPaymentMessage
@@ -3,10 +3,12 @@ from django.db import models
 
 class CapitaDBSFile(models.Model):
     """
-    Model to store the last filename used to update the DBS API.
+    Model to store the last filename used to update the DBS API, and the local DBS index.
     """
     filename = models.CharField(max_length=100)
     date_uploaded = models.DateField()
+    record_count = models.IntegerField(null=True, blank=True)
+    checksum = models.CharField(max_length=64, blank=True)
 
     class Meta:
         db_table = 'CAPITA_DBS_FILE'
@@ -0,0 +1,39 @@
+from uuid import uuid4
+
+from django.db import models
+
+
+class OutboundNotification(models.Model):
+    """
+    Model for OUTBOUND_NOTIFICATION table, holding emails and texts waiting to be sent via the notify gateway
+    """
+    NOTIFICATION_TYPES = (
+        ('EMAIL', 'EMAIL'),
+        ('SMS', 'SMS'),
+    )
+
+    STATUSES = (
+        ('PENDING', 'PENDING'),
+        ('SENDING', 'SENDING'),
+        ('SENT', 'SENT'),
+        ('FAILED', 'FAILED'),
+    )
+
+    notification_id = models.UUIDField(primary_key=True, default=uuid4)
+    idempotency_key = models.CharField(max_length=100, unique=True)
+    notification_type = models.CharField(choices=NOTIFICATION_TYPES, max_length=10)
+    recipient = models.CharField(max_length=100)
+    template_id = models.CharField(max_length=100)
+    personalisation = models.TextField()
+    status = models.CharField(choices=STATUSES, max_length=10, default='PENDING')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_sent = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'OUTBOUND_NOTIFICATION'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_notif_due_idx'),
+        ]
@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from django.db import models
+
+
+class OutboundPaymentMessage(models.Model):
+    """
+    Model for OUTBOUND_PAYMENT_MESSAGE table, holding the SC1 payment messages waiting to be published to the NOO
+    payment notifications queue. There is only ever one message for each payment reference.
+    """
+    STATUSES = (
+        ('PENDING', 'PENDING'),
+        ('PUBLISHING', 'PUBLISHING'),
+        ('PUBLISHED', 'PUBLISHED'),
+    )
+
+    message_id = models.UUIDField(primary_key=True, default=uuid4)
+    payment_ref = models.CharField(max_length=29, unique=True)
+    message_body = models.TextField()
+    status = models.CharField(choices=STATUSES, max_length=10, default='PENDING')
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True)
+    date_created = models.DateTimeField(auto_now_add=True)
+    date_published = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'OUTBOUND_PAYMENT_MESSAGE'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbound_payment_due_idx'),
+        ]
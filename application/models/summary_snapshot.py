@@ -0,0 +1,17 @@
+from django.db import models
+
+from .application import Application
+
+
+class SummarySnapshot(models.Model):
+    """
+    Model for SUMMARY_SNAPSHOT table, holding the serialised master summary of a submitted application
+    """
+    application_id = models.OneToOneField(Application, on_delete=models.CASCADE, primary_key=True,
+                                          db_column='application_id')
+    version = models.IntegerField()
+    context = models.BinaryField()
+    date_created = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'SUMMARY_SNAPSHOT'
@@ -20,6 +20,23 @@ class UserDetails(models.Model):
     sms_resend_attempts = models.IntegerField(default=0, blank=True, null=True)
     sms_resend_attempts_expiry_date = models.IntegerField(default=0, blank=True, null=True)
 
+    @classmethod
+    def get_by_email(cls, email):
+        """
+        Method to find the account registered with an email address, ignoring the case of the address. The lookup is
+        served by the upper case email index; if accounts were registered with more than one case of the same address,
+        the one matching exactly is preferred.
+        :param email: the email address entered by the applicant
+        :return: the UserDetails object, or None if no account is registered with the address
+        """
+        email = (email or '').strip()
+        if not email:
+            return None
+        accounts = list(cls.objects.filter(email__iexact=email))
+        if not accounts:
+            return None
+        return next((account for account in accounts if account.email == email), accounts[0])
+
     @property
     def timelog_fields(self):
         """
@@ -41,3 +58,6 @@ class UserDetails(models.Model):
 
     class Meta:
         db_table = 'USER_DETAILS'
+        indexes = [
+            models.Index(fields=['application_id', 'email'], name='user_details_app_email_idx'),
+        ]
@@ -0,0 +1,151 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- notification_outbox.py --
+
+@author: Informed Solutions
+
+Outbox of emails and texts to be sent via the notify gateway. Notifications queued here are sent by the
+send_notifications management command rather than the request that queued them, so that requests do not wait on the
+gateway. Each notification carries an idempotency key so that it is only queued, and sent, once.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundNotification
+
+log = logging.getLogger(__name__)
+
+
+def queue_notification(notification_type, recipient, personalisation, template_id, idempotency_key=None):
+    """
+    Function to add a notification to the outbox
+    :param notification_type: 'EMAIL' or 'SMS'
+    :param recipient: the email address or phone number to send the notification to
+    :param personalisation: object containing the personalisation of the notification
+    :param template_id: string containing the templateId of the notification request
+    :param idempotency_key: (optional) key identifying the notification, so that queueing it again has no effect
+    :return: the OutboundNotification object
+    """
+    if idempotency_key is None:
+        idempotency_key = str(uuid4())
+
+    notification, created = OutboundNotification.objects.get_or_create(
+        idempotency_key=idempotency_key,
+        defaults={
+            'notification_type': notification_type,
+            'recipient': recipient,
+            'personalisation': json.dumps(personalisation),
+            'template_id': template_id,
+            'next_attempt_at': timezone.now(),
+        })
+
+    if not created:
+        log.info('Notification with idempotency key ' + idempotency_key + ' has already been queued')
+    return notification
+
+
+def claim_notifications(limit):
+    """
+    Function to claim notifications which are due to be sent, so that no other worker sends them. A claim lasts for
+    NOTIFICATION_OUTBOX_LEASE_IN_SECONDS, after which the notification is treated as due again in case the worker
+    holding it has died.
+    :param limit: the maximum number of notifications to claim
+    :return: list of claimed OutboundNotification objects
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        notifications = list(OutboundNotification.objects.select_for_update(skip_locked=True).filter(
+            status__in=['PENDING', 'SENDING'], next_attempt_at__lte=now).order_by('next_attempt_at')[:limit])
+
+        lease_expiry = now + timedelta(seconds=settings.NOTIFICATION_OUTBOX_LEASE_IN_SECONDS)
+        for notification in notifications:
+            notification.status = 'SENDING'
+            notification.attempts += 1
+            notification.next_attempt_at = lease_expiry
+
+        OutboundNotification.objects.filter(pk__in=[notification.pk for notification in notifications]).update(
+            status='SENDING', next_attempt_at=lease_expiry, attempts=F('attempts') + 1)
+
+    return notifications
+
+
+def deliver_notification(notification):
+    """
+    Function to send a claimed notification and record the outcome, scheduling a retry with exponential backoff if
+    sending fails
+    :param notification: a claimed OutboundNotification object
+    :return: True if the notification was sent
+    """
+    # Imported here as notify depends on this module
+    from . import notify
+
+    personalisation = json.loads(notification.personalisation)
+    try:
+        if notification.notification_type == 'SMS':
+            response = notify.send_text(notification.recipient, personalisation, notification.template_id,
+                                        asynchronous=False)
+        else:
+            response = notify.send_email(notification.recipient, personalisation, notification.template_id,
+                                         asynchronous=False)
+        error = None if response.status_code < 300 else 'Notify gateway responded ' + str(response.status_code)
+    except Exception as e:
+        error = str(e) or e.__class__.__name__
+
+    # Only record the outcome if the claim has not expired and been taken by another worker in the meantime
+    claimed = OutboundNotification.objects.filter(pk=notification.pk, status='SENDING',
+                                                  attempts=notification.attempts)
+
+    if error is None:
+        claimed.update(status='SENT', date_sent=timezone.now(), last_error='')
+        return True
+
+    if notification.attempts >= settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS:
+        log.error('Giving up sending notification ' + str(notification.pk) + ': ' + error)
+        claimed.update(status='FAILED', last_error=error)
+    else:
+        backoff = settings.NOTIFICATION_OUTBOX_RETRY_BACKOFF_IN_SECONDS * 2 ** (notification.attempts - 1)
+        log.warning('Failed to send notification ' + str(notification.pk) + ', retrying in ' + str(backoff) +
+                    ' seconds: ' + error)
+        claimed.update(status='PENDING', last_error=error,
+                       next_attempt_at=timezone.now() + timedelta(seconds=backoff))
+    return False
+
+
+def _deliver_in_thread(notification):
+    """
+    Sends a notification from a worker thread, closing the thread's own database connection afterwards
+    """
+    try:
+        return deliver_notification(notification)
+    finally:
+        connection.close()
+
+
+def send_due_notifications(batch_size=50, concurrency=4):
+    """
+    Function to claim and send one batch of due notifications, several at a time
+    :param batch_size: the maximum number of notifications to send
+    :param concurrency: the number of notifications to send at the same time
+    :return: tuple of the number of notifications sent and the number which failed
+    """
+    notifications = claim_notifications(batch_size)
+    if not notifications:
+        return 0, 0
+
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(_deliver_in_thread, notifications))
+    else:
+        results = [deliver_notification(notification) for notification in notifications]
+
+    sent = results.count(True)
+    return sent, len(results) - sent
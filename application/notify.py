@@ -5,28 +5,69 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 @author: Informed Solutions
 
 Handler for dispatching email notifications via the GOV.UK notify gateway api.
+Notifications are either sent straight away or, when sent asynchronously, added to the notification outbox to be sent
+by the send_notifications management command.
 """
 
 import json
 
-import requests
 from django.conf import settings
 
+from . import gateway, notification_outbox
 from .business_logic import convert_mobile_to_notify_standard
+from .notify_monitor import notify_monitor
 
 
-def send_email(email: object, personalisation: object, template_id: object) -> object:
+def post_notification(url, notification_request):
+    """
+    Method to post a notification request to the Notify Gateway API, recording the outcome with the health monitor
+    :param url: the url of the notification endpoint
+    :param notification_request: dictionary containing the notification request
+    :return: :class:`Response <Response>` object containing http request response
+    :rtype: requests.Response
+    """
+    header = {'content-type': 'application/json'}
+    try:
+        r = gateway.post(url, json.dumps(notification_request), headers=header,
+                         timeout=settings.NOTIFY_HTTP_REQUEST_TIMEOUT)
+    except Exception:
+        notify_monitor.record_failure()
+        raise
+
+    if r.status_code >= 500:
+        notify_monitor.record_failure()
+    else:
+        notify_monitor.record_success()
+    return r
+
+
+def is_asynchronous(asynchronous):
+    """
+    :param asynchronous: True or False if the caller has chosen how to send a notification, otherwise None
+    :return: True if the notification should be added to the outbox rather than sent straight away
+    """
+    if asynchronous is None:
+        return settings.NOTIFY_SEND_ASYNCHRONOUSLY
+    return asynchronous
+
+
+def send_email(email: object, personalisation: object, template_id: object, asynchronous: bool = None,
+               idempotency_key: str = None) -> object:
     """
     Method to send an email using the Notify Gateway API
     :param email: string containing the e-mail address to send the e-mail to
     :param personalisation: object containing the personalisation related to an application
     :param template_id: string containing the templateId of the notification request
-    :return: :class:`Response <Response>` object containing http request response
+    :param asynchronous: (optional) whether to add the email to the outbox, defaulting to NOTIFY_SEND_ASYNCHRONOUSLY
+    :param idempotency_key: (optional) key identifying the email, so that it is only queued once
+    :return: :class:`Response <Response>` object containing http request response, or the queued
+    OutboundNotification object if sent asynchronously
     :rtype: requests.Response
     """
+    if is_asynchronous(asynchronous):
+        return notification_outbox.queue_notification('EMAIL', email, personalisation, template_id, idempotency_key)
 
     base_request_url = settings.NOTIFY_URL
-    header = {'content-type': 'application/json'}
 
     # If executing function in test mode override email address
     if settings.EXECUTING_AS_TEST == 'True':
@@ -37,24 +78,27 @@ def send_email(email: object, personalisation: object, template_id: object) -> o
         'personalisation': personalisation,
         'templateId': template_id
     }
-    r = requests.post(base_request_url + '/api/v1/notifications/email/',
-                      json.dumps(notification_request),
-                      headers=header)
+    r = post_notification(base_request_url + '/api/v1/notifications/email/', notification_request)
 
     return r
 
 
-def send_text(phone, personalisation, template_id):
+def send_text(phone, personalisation, template_id, asynchronous=None, idempotency_key=None):
     """
     Method to send an SMS verification code using the Notify Gateway API
     :param phone: string containing the phone number to send the code to
     :param personalisation: object containing the personalisation related to an application
     :param template_id: string containing the templateId of the notification request
-    :return: :class:`Response <Response>` object containing http request response
+    :param asynchronous: (optional) whether to add the text to the outbox, defaulting to NOTIFY_SEND_ASYNCHRONOUSLY
+    :param idempotency_key: (optional) key identifying the text, so that it is only queued once
+    :return: :class:`Response <Response>` object containing http request response, or the queued
+    OutboundNotification object if sent asynchronously
     :rtype: requests.Response
     """
+    if is_asynchronous(asynchronous):
+        return notification_outbox.queue_notification('SMS', phone, personalisation, template_id, idempotency_key)
+
     base_request_url = settings.NOTIFY_URL
-    header = {'content-type': 'application/json'}
 
     # If executing function in test mode override phone number
     if settings.EXECUTING_AS_TEST == 'True':
@@ -69,6 +113,5 @@ def send_text(phone, personalisation, template_id):
         'personalisation': personalisation,
         'templateId': template_id
     }
-    r = requests.post(base_request_url + '/api/v1/notifications/sms/', json.dumps(notification_request),
-                      headers=header)
+    r = post_notification(base_request_url + '/api/v1/notifications/sms/', notification_request)
     return r
@@ -0,0 +1,125 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- notify_monitor.py --
+
+@author: Informed Solutions
+
+Background health monitor for the Notify gateway. The gateway is probed periodically from a daemon thread and the
+outcome of every notification sent is recorded, so that sign-in can check whether Notify is available without making
+a request of its own. Consecutive failures open a circuit breaker, which stays open until a probe succeeds again.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+
+class NotifyHealthMonitor:
+    """
+    Cached up/down state of the Notify gateway with a circuit breaker
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+
+    def __init__(self, probe=None):
+        self.probe = probe
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.last_checked = None
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def is_available(self):
+        """
+        Method to check whether Notify is available, from the cached state rather than a request to the gateway
+        :return: False if the circuit breaker is open, otherwise True
+        """
+        self.start()
+        return self.state == self.CLOSED
+
+    def record_success(self):
+        """
+        Method called when a request to Notify succeeds, closing the circuit breaker
+        """
+        with self.lock:
+            if self.state == self.OPEN:
+                log.info('Notify gateway is available again, closing circuit breaker')
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self):
+        """
+        Method called when a request to Notify fails, opening the circuit breaker once the failure threshold is met
+        """
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.state == self.CLOSED and \
+                    self.consecutive_failures >= settings.NOTIFY_CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                log.error('Notify gateway failed ' + str(self.consecutive_failures) +
+                          ' consecutive requests, opening circuit breaker')
+                self.state = self.OPEN
+
+    def check(self):
+        """
+        Method to probe Notify once and record the outcome
+        :return: True if the probe succeeded
+        """
+        probe = self.probe
+        if probe is None:
+            # Imported here as utils depends on this module
+            from . import utils
+            probe = utils.test_notify_connection
+
+        try:
+            healthy = bool(probe())
+        except Exception:
+            log.exception('Notify gateway health probe raised an exception')
+            healthy = False
+
+        self.last_checked = time.time()
+        if healthy:
+            self.record_success()
+        else:
+            self.record_failure()
+        return healthy
+
+    def start(self):
+        """
+        Method to start the background probe thread, if it is not already running in this process
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name='notify-health-monitor', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """
+        Method to stop the background probe thread
+        """
+        self.stopped.set()
+
+    def run(self):
+        """
+        Background loop probing Notify at a fixed interval, probing more often while the circuit breaker is open so
+        that recovery is noticed quickly
+        """
+        while not self.stopped.is_set():
+            self.check()
+            if self.state == self.OPEN:
+                interval = settings.NOTIFY_CIRCUIT_BREAKER_RETRY_INTERVAL_IN_SECONDS
+            else:
+                interval = settings.NOTIFY_HEALTH_CHECK_INTERVAL_IN_SECONDS
+            self.stopped.wait(interval)
+
+
+notify_monitor = NotifyHealthMonitor()
@@ -0,0 +1,98 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- ownership_cache.py --
+
+@author: Informed Solutions
+
+Process wide cache of (email, application id) pairs that have already been verified as belonging together, so that
+the authentication middleware does not have to query USER_DETAILS on every request that carries an application id.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from .models import UserDetails
+
+
+class OwnershipCache:
+    """
+    Time limited cache of verified (email, application id) pairs
+    """
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl
+        self.verified = {}
+        self.lock = threading.Lock()
+
+    def get_ttl(self):
+        """
+        :return: the number of seconds a verified pair is trusted for before being checked against the database again
+        """
+        if self.ttl is not None:
+            return self.ttl
+        return getattr(settings, 'OWNERSHIP_CACHE_TTL_IN_SECONDS', 60)
+
+    def is_owner(self, email, application_id):
+        """
+        Method to check whether an email address owns an application, querying the database only if the pair has not
+        been verified within the cache TTL
+        :param email: the email address stored in the session cookie
+        :param application_id: the id of the application being accessed
+        :return: True if the email address is the one registered against the application
+        """
+        key = (email, str(application_id))
+        now = time.monotonic()
+
+        with self.lock:
+            expiry = self.verified.get(key)
+        if expiry is not None and expiry > now:
+            return True
+
+        # Single indexed lookup on (application_id, email) rather than fetching the application and account
+        if not UserDetails.objects.filter(application_id=application_id, email=email).exists():
+            return False
+
+        ttl = self.get_ttl()
+        if ttl > 0:
+            with self.lock:
+                self.__purge_expired(now)
+                self.verified[key] = now + ttl
+        return True
+
+    def invalidate(self, application_id):
+        """
+        Method to forget every verified pair for an application, for use when its email address changes
+        :param application_id: the id of the application whose pairs are to be dropped
+        """
+        application_id = str(application_id)
+        with self.lock:
+            for key in [key for key in self.verified if key[1] == application_id]:
+                del self.verified[key]
+
+    def clear(self):
+        """
+        Method to forget every verified pair
+        """
+        with self.lock:
+            self.verified.clear()
+
+    def __purge_expired(self, now):
+        """
+        Drops expired pairs so that the cache does not grow with every application ever accessed by this process
+        :param now: the current monotonic time
+        """
+        for key in [key for key, expiry in self.verified.items() if expiry <= now]:
+            del self.verified[key]
+
+
+ownership_cache = OwnershipCache()
+
+
+def invalidate_ownership(application_id):
+    """
+    Function to drop verified pairs for an application from the process wide ownership cache
+    :param application_id: the id of the application whose pairs are to be dropped
+    """
+    ownership_cache.invalidate(application_id)
@@ -0,0 +1,164 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- payment_outbox.py --
+
+@author: Informed Solutions
+
+Outbox of SC1 payment messages to be published to the NOO payment notifications queue. A message is written in the
+same transaction that marks its payment as authorised, so that a payment is never authorised without its message. It
+is then published straight away once that transaction commits, if PAYMENT_OUTBOX_PUBLISH_ON_COMMIT is set, and
+otherwise (or if that fails) by the relay_payment_messages management command. Messages are published at least once;
+each payment reference has a single message, which the Integration Adapter can use to discard repeats.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .messaging.sqs_handler import MAX_BATCH_SIZE, get_sqs_handler
+from .models import OutboundPaymentMessage
+
+log = logging.getLogger(__name__)
+
+
+def queue_payment_message(message_body):
+    """
+    Function to add an SC1 message to the outbox, if there is not already a message for its payment reference
+    :param message_body: the message, as built by payment_reconciliation.build_message_body()
+    :return: the OutboundPaymentMessage object
+    """
+    message, created = OutboundPaymentMessage.objects.get_or_create(
+        payment_ref=message_body['payment_ref'],
+        defaults={
+            'message_body': json.dumps(message_body),
+            'next_attempt_at': timezone.now(),
+        })
+
+    if not created:
+        log.info('Payment message for ' + message.payment_ref + ' has already been queued')
+    return message
+
+
+def claim_payment_messages(limit, payment_ref=None):
+    """
+    Function to claim messages which are due to be published, so that no other relay publishes them. A claim lasts for
+    PAYMENT_OUTBOX_LEASE_IN_SECONDS, after which the message is treated as due again in case the relay holding it has
+    died.
+    :param limit: the maximum number of messages to claim
+    :param payment_ref: (optional) the payment reference of the only message to be claimed
+    :return: list of claimed OutboundPaymentMessage objects
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due_messages = OutboundPaymentMessage.objects.select_for_update(skip_locked=True).filter(
+            status__in=['PENDING', 'PUBLISHING'], next_attempt_at__lte=now)
+        if payment_ref is not None:
+            due_messages = due_messages.filter(payment_ref=payment_ref)
+        messages = list(due_messages.order_by('next_attempt_at')[:limit])
+
+        lease_expiry = now + timedelta(seconds=settings.PAYMENT_OUTBOX_LEASE_IN_SECONDS)
+        for message in messages:
+            message.status = 'PUBLISHING'
+            message.attempts += 1
+            message.next_attempt_at = lease_expiry
+
+        OutboundPaymentMessage.objects.filter(pk__in=[message.pk for message in messages]).update(
+            status='PUBLISHING', next_attempt_at=lease_expiry, attempts=F('attempts') + 1)
+
+    return messages
+
+
+def get_retry_delay(attempts):
+    """
+    :param attempts: the number of times publishing a message has been attempted
+    :return: the number of seconds to wait before trying again
+    """
+    return min(settings.PAYMENT_OUTBOX_RETRY_BACKOFF_IN_SECONDS * 2 ** (attempts - 1),
+               settings.PAYMENT_OUTBOX_MAX_BACKOFF_IN_SECONDS)
+
+
+def publish_payment_messages(messages):
+    """
+    Function to publish claimed messages in batches and record the outcome. Messages which could not be published
+    are retried with exponential backoff; they are never given up on, as NOO must be told of every payment.
+    :param messages: list of claimed OutboundPaymentMessage objects
+    :return: tuple of the number of messages published and the number which failed
+    """
+    if not messages:
+        return 0, 0
+
+    handler = get_sqs_handler(settings.PAYMENT_NOTIFICATIONS_QUEUE_NAME)
+    failed = handler.send_messages([json.loads(message.message_body) for message in messages],
+                                   buffer_failures=False)
+    failed_refs = {body['payment_ref'] for body in failed}
+
+    # Only record the outcome if the claim has not expired and been taken by another relay in the meantime
+    published = [message for message in messages if message.payment_ref not in failed_refs]
+    OutboundPaymentMessage.objects.filter(
+        pk__in=[message.pk for message in published], status='PUBLISHING',
+        next_attempt_at=messages[0].next_attempt_at).update(
+        status='PUBLISHED', date_published=timezone.now(), last_error='')
+
+    for message in messages:
+        if message.payment_ref in failed_refs:
+            delay = get_retry_delay(message.attempts)
+            log.error('Failed to publish payment message for ' + message.payment_ref + ', retrying in ' +
+                      str(delay) + ' seconds')
+            OutboundPaymentMessage.objects.filter(
+                pk=message.pk, status='PUBLISHING', attempts=message.attempts).update(
+                status='PENDING', last_error='Publishing to ' + handler.queue_name + ' failed',
+                next_attempt_at=timezone.now() + timedelta(seconds=delay))
+
+    return len(published), len(failed_refs)
+
+
+def publish_payment_message(payment_ref):
+    """
+    Function to publish a newly queued message straight away, once the transaction queuing it has been committed. This
+    is a best effort: a message which cannot be published is left in the outbox for the relay to retry.
+    :param payment_ref: the payment reference of the message to be published
+    :return: True if the message was published
+    """
+    try:
+        published, failed = publish_payment_messages(claim_payment_messages(1, payment_ref=payment_ref))
+    except Exception:
+        log.exception('Failed to publish payment message for ' + payment_ref + ', leaving it for the relay')
+        return False
+    return published == 1
+
+
+def _publish_in_thread(messages):
+    """
+    Publishes messages from a worker thread, closing the thread's own database connection afterwards
+    """
+    try:
+        return publish_payment_messages(messages)
+    finally:
+        connection.close()
+
+
+def relay_due_payment_messages(batch_size=100, concurrency=4):
+    """
+    Function to claim and publish one batch of due messages, several SQS batches at a time
+    :param batch_size: the maximum number of messages to publish
+    :param concurrency: the number of SQS batches to publish at the same time
+    :return: tuple of the number of messages published and the number which failed
+    """
+    messages = claim_payment_messages(batch_size)
+    if not messages:
+        return 0, 0
+
+    if concurrency > 1:
+        chunks = [messages[start:start + MAX_BATCH_SIZE] for start in range(0, len(messages), MAX_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(_publish_in_thread, chunks))
+    else:
+        results = [publish_payment_messages(messages)]
+
+    return sum(published for published, failed in results), sum(failed for published, failed in results)
@@ -0,0 +1,172 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- payment_reconciliation.py --
+
+@author: Informed Solutions
+
+Reconciliation of submitted card payments with their status in Worldpay, shared by the card payment details page,
+the background payment status poller and the reconcile_payments management command. Authorised payments are
+finalised only once, however many of these check the same payment at the same time.
+"""
+
+import datetime
+import json
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from .business_logic import get_childcare_register_type
+from .models import Application, ApplicantName, Payment
+from .payment_outbox import publish_payment_message, queue_payment_message
+from .services import payment_service
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of checking a payment's status
+AUTHORISED = 'AUTHORISED'
+REFUSED = 'REFUSED'
+ERROR = 'ERROR'
+NOT_FOUND = 'NOT_FOUND'
+PENDING = 'PENDING'
+
+
+def get_payment_amount(application_id):
+    """
+    :param application_id: the id of the application being paid for
+    :return: the payment amount in pence
+    """
+    childcare_register_type, childcare_register_cost = get_childcare_register_type(application_id)
+    return int(childcare_register_cost) * 100
+
+
+def check_payment_status(payment_reference):
+    """
+    Function to query Worldpay for the status of a payment
+    :param payment_reference: the reference of the payment to be checked
+    :return: AUTHORISED, REFUSED or ERROR if Worldpay has recorded that outcome, NOT_FOUND if Worldpay has no record of
+    the payment, otherwise PENDING
+    """
+    payment_status_response_raw = payment_service.check_payment(payment_reference)
+
+    if payment_status_response_raw.status_code == 404:
+        return NOT_FOUND
+
+    last_event = json.loads(payment_status_response_raw.text).get('lastEvent')
+    if last_event in (AUTHORISED, REFUSED, ERROR):
+        return last_event
+    return PENDING
+
+
+def reconcile_payment(application):
+    """
+    Function to check the status of an application's submitted payment and act on it, finalising the payment if it
+    has been authorised and rolling it back if it has been refused, Worldpay recorded an error or Worldpay has no
+    record of it, so that the payment processing page can show the outcome without the payment being checked again
+    :param application: the application whose payment is to be reconciled
+    :return: the outcome of the status check, or NOT_FOUND if the application has no payment reference to check
+    """
+    payment = Payment.objects.filter(application_id=application).first()
+    if payment is None or payment.payment_reference is None or payment.payment_reference == "PENDING":
+        return NOT_FOUND
+
+    if payment.payment_authorised:
+        return AUTHORISED
+
+    outcome = check_payment_status(payment.payment_reference)
+    if outcome == AUTHORISED:
+        finalise_authorised_payment(application)
+    elif outcome in (REFUSED, ERROR, NOT_FOUND):
+        rollback_payment_submission_status(application)
+    return outcome
+
+
+def reconcile_application_payment(application_id):
+    """
+    Function to reconcile the payment of an application, see reconcile_payment()
+    :param application_id: the id of the application whose payment is to be reconciled
+    :return: the outcome of the status check
+    """
+    application = Application.objects.filter(pk=application_id).first()
+    if application is None:
+        return NOT_FOUND
+    return reconcile_payment(application)
+
+
+def finalise_authorised_payment(application, amount=None):
+    """
+    Function to mark an application's payment as authorised, submit the application and queue the SC1 message
+    notifying NOO of the payment, all in one transaction, publishing the message once the transaction commits if
+    PAYMENT_OUTBOX_PUBLISH_ON_COMMIT is set. Does nothing if the payment has already been marked as authorised, so
+    that NOO is only notified once.
+    :param application: application associated with the payment
+    :param amount: (optional) the payment amount in pence, looked up from the application if not given
+    :return: True if the payment was finalised by this call
+    """
+    logger.info('Marking payment as AUTHORISED for application with id: ' + str(application.application_id))
+    with transaction.atomic():
+        updated = Payment.objects.filter(application_id=application.application_id, payment_authorised=False) \
+            .update(payment_authorised=True)
+        if not updated:
+            logger.info('Payment has already been authorised for application with id: ' +
+                        str(application.application_id))
+            return False
+
+        # Transition application to submitted
+        logger.info('Assigning submitted date for application with id: ' + str(application.application_id))
+        application.date_submitted = datetime.datetime.today()
+        application.save()
+
+        # Queue ad-hoc payment to NOO, also published by the relay_payment_messages command if it is not sent here
+        if amount is None:
+            amount = get_payment_amount(application.application_id)
+        app_cost_float = float(amount / 100)
+        message = queue_payment_message(build_message_body(application, format(app_cost_float, '.4f')))
+        if settings.PAYMENT_OUTBOX_PUBLISH_ON_COMMIT:
+            transaction.on_commit(lambda: publish_payment_message(message.payment_ref))
+    return True
+
+
+def rollback_payment_submission_status(application):
+    """
+    Method for rolling back a payment submission if card details have been declined
+    :param application: the application for which a payment is to be rolled back
+    """
+    logger.info('Rolling payment back for application with id: '
+                + str(application.application_id))
+
+    if Payment.objects.filter(application_id=application).exists():
+        payment_record = Payment.objects.get(application_id=application.application_id)
+        if not payment_record.payment_authorised:
+            # Only delete the record if the payment is not authorised
+            payment_record.delete()
+        else:
+            logger.info('Rollback cancelled - payment has already been authorised')
+
+
+def build_message_body(application, amount):
+    """
+    Helper method to build an SQS request to be picked up by the Integration Adapter component
+    for relay to NOO
+    :param application: the application for which a payment request is to be generated
+    :param amount: the amount that the payment was for
+    :return: an SQS request that can be consumed up by the Integration Adapter component
+    """
+
+    application_reference = application.application_reference
+    applicant_name_obj = ApplicantName.objects.get(application_id=application)
+
+    if len(applicant_name_obj.middle_names):
+        applicant_name = applicant_name_obj.last_name + ',' + applicant_name_obj.first_name + " " + applicant_name_obj.middle_names
+    else:
+        applicant_name = applicant_name_obj.last_name + ',' + applicant_name_obj.first_name
+
+    payment_reference = Payment.objects.get(application_id=application).payment_reference
+
+    return {
+        "payment_action": "SC1",
+        "payment_ref": payment_reference,
+        "payment_amount": amount,
+        "urn": str(settings.PAYMENT_URN_PREFIX) + application_reference,
+        "setting_name": applicant_name
+    }
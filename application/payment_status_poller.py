@@ -0,0 +1,120 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- payment_status_poller.py --
+
+@author: Informed Solutions
+
+Background poller checking the status of payments which Worldpay had not yet authorised or refused when the applicant
+submitted their card details. Each payment is checked from a daemon thread with an increasing delay between checks,
+so that the request which submitted it can return straight away to the payment processing page.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from .payment_reconciliation import PENDING, reconcile_application_payment
+
+log = logging.getLogger(__name__)
+
+
+class PaymentStatusPoller:
+    """
+    Schedule of payments awaiting a status check, worked through by a background thread
+    """
+
+    def __init__(self, reconcile=None):
+        self.reconcile = reconcile
+        # Application id -> (time of next check, number of checks made)
+        self.payments = {}
+        self.condition = threading.Condition()
+        self.thread = None
+
+    @staticmethod
+    def get_delay(checks_made):
+        """
+        :param checks_made: the number of times the payment's status has been checked
+        :return: the number of seconds to wait before checking it again
+        """
+        return min(settings.PAYMENT_STATUS_POLL_INITIAL_DELAY_IN_SECONDS * 2 ** checks_made,
+                   int(settings.PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS))
+
+    def poll(self, application_id):
+        """
+        Method to start checking the status of an application's payment, if it is not already being checked
+        :param application_id: the id of the application whose payment is awaiting authorisation
+        """
+        application_id = str(application_id)
+        with self.condition:
+            if application_id not in self.payments:
+                self.payments[application_id] = (time.monotonic() + self.get_delay(0), 0)
+                self.condition.notify()
+        self.start()
+
+    def is_polling(self, application_id):
+        """
+        :param application_id: the id of an application
+        :return: True if the application's payment is still being checked
+        """
+        with self.condition:
+            return str(application_id) in self.payments
+
+    def check(self, application_id, checks_made):
+        """
+        Method to check the status of a payment once, scheduling a further check if it is still pending
+        :param application_id: the id of the application whose payment is to be checked
+        :param checks_made: the number of times the payment has already been checked
+        """
+        reconcile = self.reconcile or reconcile_application_payment
+        try:
+            outcome = reconcile(application_id)
+        except Exception:
+            log.exception('Failed to check payment status for application ' + application_id)
+            outcome = PENDING
+
+        checks_made += 1
+        with self.condition:
+            if outcome == PENDING and checks_made < int(settings.PAYMENT_PROCESSING_ATTEMPTS):
+                self.payments[application_id] = (time.monotonic() + self.get_delay(checks_made), checks_made)
+            else:
+                log.info('Stopped checking payment status for application ' + application_id + ': ' + outcome)
+                del self.payments[application_id]
+
+    def start(self):
+        """
+        Method to start the background thread, if it is not already running in this process
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.condition:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name='payment-status-poller', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        """
+        Background loop checking each payment once it is due
+        """
+        while True:
+            with self.condition:
+                now = time.monotonic()
+                due = [(application_id, checks_made)
+                       for application_id, (next_check, checks_made) in self.payments.items() if next_check <= now]
+                if not due:
+                    next_checks = [next_check for next_check, checks_made in self.payments.values()]
+                    self.condition.wait(min(next_checks) - now if next_checks else None)
+                    continue
+
+            try:
+                for application_id, checks_made in due:
+                    self.check(application_id, checks_made)
+            finally:
+                # The thread's connection is closed between checks so that it is not left idle
+                connection.close()
+
+
+payment_status_poller = PaymentStatusPoller()
@@ -0,0 +1,143 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- postcode_cache.py --
+
+@author: Informed Solutions
+
+Cache of addressing service results keyed on normalised postcode, so that the address select pages do not search for
+the same postcode again when the chosen address is posted. Results are held in a process wide LRU with a TTL and,
+if POSTCODE_CACHE_BACKEND names one of the configured CACHES, in that shared cache as well.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def normalise_postcode(postcode):
+    """
+    :param postcode: a postcode as entered by the applicant
+    :return: the postcode in upper case with all whitespace removed
+    """
+    return ''.join(postcode.split()).upper()
+
+
+class PostcodeCache:
+    """
+    Least recently used cache of postcode search results with a TTL and hit/miss counts
+    """
+
+    def __init__(self, max_entries=None, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_max_entries(self):
+        """
+        :return: the number of postcodes held before the least recently used are evicted
+        """
+        if self.max_entries is not None:
+            return self.max_entries
+        return settings.POSTCODE_CACHE_MAX_ENTRIES
+
+    def get_ttl(self):
+        """
+        :return: the number of seconds search results are cached for
+        """
+        if self.ttl is not None:
+            return self.ttl
+        return settings.POSTCODE_CACHE_TTL_IN_SECONDS
+
+    @staticmethod
+    def get_shared_cache():
+        """
+        :return: the shared cache named by POSTCODE_CACHE_BACKEND, or None if results are only cached in process
+        """
+        if not settings.POSTCODE_CACHE_BACKEND:
+            return None
+        return caches[settings.POSTCODE_CACHE_BACKEND]
+
+    @staticmethod
+    def get_shared_key(key):
+        """
+        :param key: a normalised postcode
+        :return: the key under which the postcode's results are held in the shared cache
+        """
+        return 'postcode-search:' + key
+
+    def get_or_fetch(self, postcode, fetch):
+        """
+        Method to get the search results for a postcode, calling fetch only if they are not cached
+        :param postcode: the postcode being searched for
+        :param fetch: function returning the search results, or None if the search failed
+        :return: the search results, or None if the search failed
+        """
+        key = normalise_postcode(postcode)
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self.entries[key]
+
+        shared_cache = self.get_shared_cache()
+        results = shared_cache.get(self.get_shared_key(key)) if shared_cache is not None else None
+
+        with self.lock:
+            if results is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if results is None:
+            results = fetch()
+            # Failed searches are not cached so that they are retried
+            if results is None:
+                return None
+            if shared_cache is not None:
+                shared_cache.set(self.get_shared_key(key), results, self.get_ttl())
+
+        self.__store(key, results, now)
+        return results
+
+    def __store(self, key, results, now):
+        """
+        Adds search results to the in process cache, evicting the least recently used postcodes beyond the maximum
+        """
+        ttl = self.get_ttl()
+        if ttl <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (now + ttl, results)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.get_max_entries():
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        """
+        :return: dictionary of the number of cache hits, misses and postcodes held in process
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
+
+    def clear(self):
+        """
+        Method to forget every cached postcode and reset the hit/miss counts
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+postcode_cache = PostcodeCache()
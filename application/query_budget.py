@@ -0,0 +1,103 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- query_budget.py --
+
+@author: Informed Solutions
+
+Instrumentation of the SQL queries issued by each request. QueryBudgetMiddleware records the number of queries, the
+time spent in them and any query repeated with different parameters (the signature of an N+1 lookup), and logs
+requests whose view issues more queries than the budget declared for its url name in QUERY_BUDGETS. With
+QUERY_BUDGET_STRICT set, for example when running the test suite, a request over budget raises QueryBudgetExceeded
+instead so that regressions are caught before they are merged.
+"""
+
+import logging
+import re
+from collections import Counter, namedtuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+log = logging.getLogger(__name__)
+
+# Literal values replaced when fingerprinting a query, so that the same query with different parameters matches
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+VALUE_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+
+QueryStats = namedtuple('QueryStats', ['count', 'time', 'duplicates'])
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql):
+    """
+    :param sql: the SQL of an executed query
+    :return: the query with its literal values replaced by placeholders
+    """
+    sql = NUMBER_LITERAL.sub('?', STRING_LITERAL.sub('?', sql))
+    return VALUE_LIST.sub('(?)', sql)
+
+
+def get_query_stats(queries):
+    """
+    :param queries: list of queries captured by CaptureQueriesContext
+    :return: QueryStats of the number of queries, the seconds spent in them and a Counter of the fingerprints of
+    queries issued more than QUERY_BUDGET_DUPLICATE_THRESHOLD times
+    """
+    fingerprints = Counter(fingerprint(query['sql']) for query in queries)
+    duplicates = Counter({sql: count for sql, count in fingerprints.items()
+                          if count > settings.QUERY_BUDGET_DUPLICATE_THRESHOLD})
+    return QueryStats(len(queries), sum(float(query['time']) for query in queries), duplicates)
+
+
+def get_budget(url_name):
+    """
+    :param url_name: the name of a url in childminder/urls.py
+    :return: the maximum number of queries the url's view may issue
+    """
+    return settings.QUERY_BUDGETS.get(url_name, settings.QUERY_BUDGET_DEFAULT)
+
+
+def describe(url_name, stats):
+    """
+    :return: description of a request's queries for the log or a failed test
+    """
+    description = '{0} issued {1} queries (budget {2}) taking {3:.3f}s'.format(
+        url_name, stats.count, get_budget(url_name), stats.time)
+    for sql, count in stats.duplicates.most_common(5):
+        description += '\n  {0} x {1}'.format(count, sql if len(sql) <= 200 else sql[:200] + '...')
+    return description
+
+
+class QueryBudgetMiddleware(object):
+    """
+    Middleware recording the queries issued by each request, enabled by QUERY_BUDGET_ENABLED or QUERY_BUDGET_STRICT
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_BUDGET_ENABLED and not settings.QUERY_BUDGET_STRICT:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_response(request)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        url_name = resolver_match.url_name if resolver_match is not None else None
+        if url_name is None:
+            return response
+
+        stats = get_query_stats(queries.captured_queries)
+        if stats.count > get_budget(url_name):
+            if settings.QUERY_BUDGET_STRICT:
+                raise QueryBudgetExceeded(describe(url_name, stats))
+            log.warning(describe(url_name, stats))
+        elif stats.duplicates:
+            log.info(describe(url_name, stats))
+        return response
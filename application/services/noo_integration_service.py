@@ -2,9 +2,10 @@
 Utility functions for generating a new unique application reference number
 """
 
-import requests
 from django.conf import settings
 
+from .. import gateway
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,8 @@ def create_application_reference():
     """
     try:
         integration_adapter_endpoint = settings.INTEGRATION_ADAPTER_URL
-        response = requests.get(integration_adapter_endpoint + '/api/v1/urns/')
+        response = gateway.get(integration_adapter_endpoint + '/api/v1/urns/',
+                               timeout=settings.INTEGRATION_ADAPTER_HTTP_REQUEST_TIMEOUT)
 
         response_body_as_json = response.json()
         urn = response_body_as_json['URN']
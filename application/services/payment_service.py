@@ -10,10 +10,10 @@ import logging
 import time
 from urllib.parse import quote
 
-import requests
-
 from django.conf import settings
 
+from .. import gateway
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,8 +51,8 @@ def make_payment(amount, name, number, cvc, expiry_m, expiry_y, currency, custom
 
     logger.info('Submitting payment request to payment gateway for order: ' + str(customer_order_code))
 
-    response = requests.post(base_url + "/api/v1/payments/card/", json.dumps(payload),
-                             headers=header, timeout=int(settings.PAYMENT_HTTP_REQUEST_TIMEOUT))
+    response = gateway.post(base_url + "/api/v1/payments/card/", json.dumps(payload),
+                            headers=header, timeout=int(settings.PAYMENT_HTTP_REQUEST_TIMEOUT))
 
     logger.info('Received response from payment gateway for order ' + str(customer_order_code) + ': ' +
                 str(response.status_code))
@@ -68,7 +68,7 @@ def check_payment(payment_reference):
     base_url = settings.PAYMENT_URL
     header = {'content-type': 'application/json'}
     query_path = base_url + "/api/v1/payments/" + quote(payment_reference)
-    response = requests.get(query_path, headers=header, timeout=int(settings.PAYMENT_HTTP_REQUEST_TIMEOUT))
+    response = gateway.get(query_path, headers=header, timeout=int(settings.PAYMENT_HTTP_REQUEST_TIMEOUT))
     return response
 
 
@@ -6,38 +6,107 @@ https://docs.djangoproject.com/en/dev/topics/signals/
 import sys
 import traceback
 
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
 from timeline_logger.models import TimelineLog
 from application.models import Application
+from application.application_loader import application_saved, get_current_loader, invalidate_application
+from application.ownership_cache import invalidate_ownership
 
-def timelog_post_init(sender, instance, **kwargs):
+# Placeholder for tracked fields which were deferred when the instance was loaded, and so cannot have been changed
+NOT_LOADED = object()
+
+# Model class -> tuple of the fields listed in its timelog_fields, resolved once per model
+_tracked_fields = {}
+
+
+def get_tracked_fields(instance):
     """
-    Signal for post_init() saves original data for the future usage in post_save()
+    :param instance: an instance of a model registered for timelog signals
+    :return: tuple of the model fields named in the model's timelog_fields
+    """
+    model = instance.__class__
+    fields = _tracked_fields.get(model)
+    if fields is None:
+        try:
+            names = instance.timelog_fields
+        except AttributeError:
+            traceback.print_exc(file=sys.stdout)
+            sys.exit('''
+                -------------------------------------------------------------------
+                Sorry your model doesn't have timelog_fields method. You can't use
+                timelog without specifying which fields to log in your model.
+                -------------------------------------------------------------------
+            ''')
+        fields = _tracked_fields[model] = tuple(model._meta.get_field(name) for name in names)
+    return fields
+
+
+def take_snapshot(instance):
+    """
+    Records the current values of an instance's tracked fields, reading only those already loaded so that deferred
+    fields are not fetched
     """
+    values = instance.__dict__
+    instance._timelog_snapshot = tuple(values.get(field.attname, NOT_LOADED) for field in get_tracked_fields(instance))
 
+
+def normalise(field, value):
+    """
+    :return: the value converted to the field's python type, so that e.g. '5' and 5 compare equal as the saved values
+    would
+    """
     try:
-        for field in instance.timelog_fields:
-            setattr(instance, '_original_%s' % field, getattr(instance, field))
-    except AttributeError:
-        traceback.print_exc(file=sys.stdout)
-        sys.exit('''
-            -------------------------------------------------------------------
-            Sorry your model doesn't have timelog_fields method. You can't use
-            timelog without specifying which fields to log in your model.
-            -------------------------------------------------------------------
-        ''')
+        return field.to_python(value)
+    except (ValidationError, TypeError, ValueError):
+        return value
 
 
-def timelog_post_save(sender, instance, created, **kwargs):
+def timelog_pre_save(sender, instance, **kwargs):
     """
-    When post_save() called for specified Models trigger this signal
+    Signal for pre_save() fetching the original values of tracked fields which were deferred when the instance was
+    loaded but have since been set, so that post_save() can tell whether they changed. Instances loaded with all of
+    their tracked fields, as nearly all are, need no query.
+    """
+    fields = get_tracked_fields(instance)
+    values = instance.__dict__
+    deferred = [index for index, original in enumerate(instance._timelog_snapshot)
+                if original is NOT_LOADED and fields[index].attname in values]
+    if not deferred or instance._state.adding:
+        return
+
+    originals = sender._base_manager.filter(pk=instance.pk).values_list(
+        *[fields[index].attname for index in deferred]).first()
+    if originals is None:
+        return
+    snapshot = list(instance._timelog_snapshot)
+    for index, original in zip(deferred, originals):
+        snapshot[index] = original
+    instance._timelog_snapshot = tuple(snapshot)
+
 
-    This signal is searching for fields defined in timelog_fields()
-    in a model which caught this signal. After that checks changed
-    value and writes changes to the timelogger.
+def get_changed_fields(instance):
     """
+    :return: list of the names of the tracked fields whose values have changed since the snapshot was taken
+    """
+    values = instance.__dict__
+    changed = []
+    for field, original in zip(get_tracked_fields(instance), instance._timelog_snapshot):
+        if original is NOT_LOADED:
+            continue
+        value = values.get(field.attname, NOT_LOADED)
+        if value is not NOT_LOADED and normalise(field, value) != normalise(field, original):
+            changed.append(field.name)
+    return changed
+
 
+def get_application_status(instance):
+    """
+    :return: the status of the application an instance belongs to, using the application already loaded by the
+    instance or by the current request where there is one
+    """
     try:
-        status = Application.objects.get(pk=instance.application_id.pk).application_status
+        application_id = instance.application_id_id
     except AttributeError:
         traceback.print_exc(file=sys.stdout)
         sys.exit('''
@@ -47,22 +116,79 @@ def timelog_post_save(sender, instance, created, **kwargs):
             ------------------------------------------------------------------
         ''')
 
-    instance.refresh_from_db()
+    if instance.__class__.application_id.is_cached(instance):
+        return instance.application_id.application_status
+
+    loader = get_current_loader()
+    if loader is not None:
+        return loader.get(application_id).application_status
+
+    return Application.objects.filter(pk=application_id).values_list('application_status', flat=True).first()
+
 
+def timelog_post_init(sender, instance, **kwargs):
+    """
+    Signal for post_init() saves original data for the future usage in post_save()
+    """
+    take_snapshot(instance)
+
+
+def timelog_post_save(sender, instance, created, **kwargs):
+    """
+    When post_save() called for specified Models trigger this signal
+
+    This signal compares the fields defined in timelog_fields() of the
+    saved model with their values when it was loaded. If any have changed
+    and the application has been returned to the applicant, the changes
+    are written to the timelogger in one insert.
+    """
+    changed = get_changed_fields(instance)
+    take_snapshot(instance)
+    if not changed:
+        return
+
+    status = get_application_status(instance)
     if status == 'FURTHER_INFORMATION':
-        for field in instance.timelog_fields:
-            value = getattr(instance, field)
-            orig_value = getattr(instance, '_original_%s' % field)
-            if value != orig_value:
-                TimelineLog.objects.create(
-                    content_object=instance.application_id,
-                    user=None,
-                    template='timeline_logger/application_field.txt',
-                    extra_data={
-                        'user_type': 'applicant',
-                        'application_status': status,
-                        'field': field,
-                        'formatted_field': field.replace("_", " "),
-                        'action': 'updated'
-                    }
-                )
+        content_type = ContentType.objects.get_for_model(Application)
+        TimelineLog.objects.bulk_create([
+            TimelineLog(
+                content_type=content_type,
+                object_id=str(instance.application_id_id),
+                user=None,
+                template='timeline_logger/application_field.txt',
+                extra_data={
+                    'user_type': 'applicant',
+                    'application_status': status,
+                    'field': field,
+                    'formatted_field': field.replace("_", " "),
+                    'action': 'updated'
+                }
+            ) for field in changed])
+
+
+def application_post_save(sender, instance, **kwargs):
+    """
+    Keeps the request scoped application cache consistent when an application is saved
+    """
+    application_saved(instance)
+
+
+def application_post_delete(sender, instance, **kwargs):
+    """
+    Drops a deleted application from the request scoped application cache
+    """
+    invalidate_application(instance.pk)
+
+
+def user_details_post_save(sender, instance, **kwargs):
+    """
+    Forgets verified owners of an application whenever its account is saved, as the email address may have changed
+    """
+    invalidate_ownership(instance.application_id_id)
+
+
+def user_details_post_delete(sender, instance, **kwargs):
+    """
+    Forgets verified owners of an application when its account is deleted
+    """
+    invalidate_ownership(instance.application_id_id)
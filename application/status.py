@@ -5,17 +5,16 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 @author: Informed Solutions
 """
 
-from .models import Application
+from .application_loader import load_application
+from .field_updates import update_fields
 
 
 def update(application_id, field_name, status):
     """
-    Method to update task status
+    Method to update task status, writing only the status column and only if it has changed
     :param application_id: application ID
     :param field_name: status to update
     :param status: status
     :return:
     """
-    local_application = Application.objects.get(pk=application_id)
-    setattr(local_application, field_name, status)
-    local_application.save()
+    update_fields(load_application(application_id), {field_name: status})
@@ -0,0 +1,55 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- summary_snapshot.py --
+
+@author: Informed Solutions
+
+Store of master summary contexts for applications the applicant can no longer change, so that the master summary and
+print pages for a submitted application are served from a single read rather than rebuilt from every task's records.
+"""
+
+import logging
+import pickle
+
+from .models import SummarySnapshot
+
+log = logging.getLogger(__name__)
+
+# Statuses in which an application's data cannot be changed by the applicant
+SNAPSHOT_STATUSES = ('SUBMITTED', 'ARC_REVIEW')
+
+# Increase whenever the shape of the summary context changes, so that older snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
+
+def get_summary_snapshot(application, build_variables):
+    """
+    Function to get the master summary context for an application, served from its snapshot where one is held
+    :param application: the Application object being summarised
+    :param build_variables: callable building the summary context from the database
+    :return: dictionary of template variables
+    """
+    if application.application_status not in SNAPSHOT_STATUSES:
+        return build_variables()
+
+    snapshot = SummarySnapshot.objects.filter(application_id=application.pk, version=SNAPSHOT_VERSION).first()
+    if snapshot is not None:
+        try:
+            return pickle.loads(bytes(snapshot.context))
+        except Exception:
+            log.exception('Discarding unreadable summary snapshot for application with id: ' + str(application.pk))
+
+    variables = build_variables()
+    SummarySnapshot.objects.update_or_create(application_id=application,
+                                             defaults={'version': SNAPSHOT_VERSION,
+                                                       'context': pickle.dumps(variables)})
+    return variables
+
+
+def invalidate_summary_snapshot(application_id):
+    """
+    Function to discard the snapshot of an application, for use when it is resubmitted after being returned to the
+    applicant, as ARC returns applications outside of this service
+    :param application_id: the id of the application whose snapshot is to be discarded
+    """
+    SummarySnapshot.objects.filter(application_id=application_id).delete()
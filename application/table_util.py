@@ -7,30 +7,63 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 
 from django.urls import reverse
 
-from .models import ArcComments, Application
+from .application_loader import load_application
+from .models import ArcComments
 from .summary_page_data import submit_link_dict, back_link_dict
 
 
+class ArcCommentIndex:
+    """
+    In-memory index of the flagged ARC comments for a set of table primary keys, built with a single query so that
+    summary tables can resolve their row errors without issuing a query per row
+    """
+
+    def __init__(self, table_pks):
+        """
+        Standard init that loads every flagged comment for the given primary keys
+        :param table_pks: An iterable of the primary keys of the database tables that will be rendered
+        """
+        self.comments = {}
+        self.counts = {}
+        flagged_comments = ArcComments.objects.filter(table_pk__in=set(table_pks), flagged=True)\
+            .values_list('table_pk', 'field_name', 'comment')
+        for table_pk, field_name, comment in flagged_comments:
+            key = (str(table_pk), field_name)
+            self.comments[key] = comment
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def get_comment(self, table_pk, field_name):
+        """
+        Method to find the flagged comment for a field, mirroring the previous lookup of exactly one flagged comment
+        :param table_pk: The primary key of the database table the field belongs to
+        :param field_name: The name of the field as stored in the database
+        :return: The comment if the field has been flagged, otherwise None
+        """
+        key = (str(table_pk), field_name)
+        if self.counts.get(key) == 1:
+            return self.comments[key]
+        return None
+
+
 class Table:
     """
     Table data structure use in generic summary template, this is used as a container for the list of rows with values
     """
-    def get_errors(self):
+    def get_errors(self, arc_comment_index=None):
         """
         Method to scan each row in a table for any occurrences in the ARC_COMMENTS table (i.e it has an error)
+        :param arc_comment_index: An optional ArcCommentIndex already holding the comments for this table, one is
+        built for this table's primary keys if not supplied
         :return: Does not need to return anything as it edits the rows in its row list
         """
+        if arc_comment_index is None:
+            arc_comment_index = ArcCommentIndex(self.table_pk)
+
         for row in self.row_list:
             for key in self.table_pk:
-                if ArcComments.objects.filter(table_pk=key, field_name=row.data_name, flagged=True).count() == 1:
-                    log = ArcComments.objects.get(table_pk=key, field_name=row.data_name)
-                    try:
-                        if log.flagged:
-                            row.error = log.comment
-                        else:
-                            row.error = ''
-                    except:
-                        pass
+                comment = arc_comment_index.get_comment(key, row.data_name)
+                if comment is not None:
+                    row.error = comment
 
     def add_row(self, row):
         """
@@ -108,6 +141,9 @@ def table_creator(object_list, field_names, data_names, table_names, table_error
     data_list = []
     table_list = []
 
+    # Load the ARC comments for every object to be rendered up front, rather than per row
+    arc_comment_index = ArcCommentIndex([object.pk for object_table_list in object_list for object in object_table_list])
+
     # Grab each list from the list of lists
     for object_table_list in object_list:
         # For each database object
@@ -125,7 +161,7 @@ def table_creator(object_list, field_names, data_names, table_names, table_error
                 local_row = Row(row[0], row[1], row[2], row[3], '')
                 temp_table.add_row(local_row)
         # Store any errors for each row in the row itself and add the table to the table list
-        temp_table.get_errors()
+        temp_table.get_errors(arc_comment_index)
         table_list.append(temp_table)
     table_to_title = zip(table_list, table_names, table_error_names)
 
@@ -162,6 +198,11 @@ def create_tables(tables_values, page_name_dict, page_link_dict, change_link_des
     :return: Returns the full list of table objects in a form that can be passed to the generic summary template
     """
     table_output_list = []
+
+    # Load the ARC comments for all tables on the page in a single query
+    arc_comment_index = ArcCommentIndex(
+        [table_pk for table in tables_values for table_pk in table['table_object'].table_pk])
+
     for table in tables_values:
 
         # Each iteration of table will be a dictionary (see a call of this function for the definition of this)
@@ -176,7 +217,7 @@ def create_tables(tables_values, page_name_dict, page_link_dict, change_link_des
             table['table_object'].add_row(temp_row)
 
         # Once all rows have been added to the object, get errors can be called, getting any errors for all of the rows
-        table['table_object'].get_errors()
+        table['table_object'].get_errors(arc_comment_index)
         table['table_object'].title = table['title']
         table['table_object'].error_summary_title = table['error_summary_title']
         # An extra part to the back links must be added for the other people pages, if this detail is passed, its added
@@ -187,7 +228,15 @@ def create_tables(tables_values, page_name_dict, page_link_dict, change_link_des
 
 
 def submit_link_setter(variables, table_list, section_name, application_id):
-    application = Application.objects.get(application_id=application_id)
+    """
+    Function to set the submit and back links of a summary page, based on whether its tables contain any errors
+    :param variables: The dictionary of variables to be passed to the template
+    :param table_list: The list of table objects on the summary page, with errors already resolved
+    :param section_name: The name of the section, as used in the submit_link_dict and back_link_dict
+    :param application_id: The id of the application
+    :return: The updated variables dictionary
+    """
+    application_status = load_application(application_id).application_status
     for table in table_list:
         if table.get_error_amount() != 0:
             variables['submit_link'] = reverse(submit_link_dict[section_name])
@@ -195,7 +244,7 @@ def submit_link_setter(variables, table_list, section_name, application_id):
             #Go to task list
             variables['submit_link'] = reverse('Task-List-View')
         #If section status is completed and not in arc review, we should go back to the previous question in section
-        if application.application_status != 'FURTHER_INFORMATION':
+        if application_status != 'FURTHER_INFORMATION':
             variables['back_link'] = back_link_dict[section_name]
         # Otherwise, return to the task list
         else:
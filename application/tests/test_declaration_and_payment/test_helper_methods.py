@@ -17,7 +17,7 @@ from application.tests import utils
 @tag('unit')
 class ApplicationReferenceTests(TestCase):
 
-    @patch('requests.get')
+    @patch('application.gateway.get')
     def test_can_produce_application_reference(self, request_get_mock):
         test_urn_response = {
             "URN": 123456789
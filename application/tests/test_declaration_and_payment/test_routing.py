@@ -1,11 +1,14 @@
+import datetime
 import json
 from unittest import mock
 from uuid import UUID
 
+from django.db import connection
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse, resolve
 
-from application import models, views
+from application import models, payment_reconciliation, views
 from application.tests import utils
 
 
@@ -98,6 +101,40 @@ class DeclarationSummaryPageFunctionalTests(utils.NoMiddlewareTestCase):
         utils.assertNotSummaryField(response, 'Known to council social services in regards to their own children?',
                                     heading='Joe Johannsen')
 
+    def test_number_of_queries_does_not_grow_with_household_size(self):
+        self.application.working_in_other_childminder_home = False
+        self.application.adults_in_home = True
+        self.application.save()
+
+        def add_household_member(number):
+            adult = models.AdultInHome.objects.create(application_id=self.application, adult=number,
+                                                      first_name='Adult', last_name=str(number), birth_day=1,
+                                                      birth_month=1, birth_year=1980, PITH_same_address=False)
+            models.AdultInHomeAddress.objects.create(application_id=self.application, adult_id=adult,
+                                                     street_line1='1 Road', town='Town', postcode='AB1 2CD',
+                                                     moved_in_day=1, moved_in_month=1, moved_in_year=2000)
+            models.Child.objects.create(application_id=self.application, child=number, first_name='Child',
+                                        last_name=str(number), birth_day=1, birth_month=1, birth_year=2010,
+                                        lives_with_childminder=False)
+            models.ChildAddress.objects.create(application_id=self.application, child=number,
+                                               street_line1='2 Road', town='Town', postcode='AB1 2CD')
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(reverse('Declaration-Summary-View'), data={'id': self.application.pk})
+            self.assertEqual(200, response.status_code)
+            return len(context.captured_queries)
+
+        add_household_member(1)
+        # The first request also warms caches such as the content type cache, so is not counted
+        count_queries()
+        queries_for_one = count_queries()
+
+        for number in range(2, 5):
+            add_household_member(number)
+
+        self.assertEqual(queries_for_one, count_queries())
+
 
 @tag('http')
 class PaymentPageFunctionalTests(utils.NoMiddlewareTestCase):
@@ -365,3 +402,110 @@ class PaymentPageFunctionalTests(utils.NoMiddlewareTestCase):
         self.assertIsNotNone(payment_record.payment_reference)
         self.assertTrue(payment_record.payment_submitted)
         self.assertTrue(payment_record.payment_authorised)
+
+    @mock.patch('application.payment_status_poller.payment_status_poller.poll')
+    @mock.patch('application.services.noo_integration_service.create_application_reference')
+    @mock.patch('application.services.payment_service.make_payment')
+    @mock.patch('application.services.payment_service.check_payment')
+    def test_submit_redirects_to_processing_page_if_payment_still_being_processed(
+            self, check_payment_mock, post_payment_mock, application_reference_mock, poll_mock):
+        """
+        Test that a payment Worldpay has neither authorised nor refused is checked in the background, rather than the
+        request waiting for it
+        """
+        application_reference_mock.return_value = 'TESTURN'
+
+        test_payment_response = {
+            "customerOrderCode": "TEST",
+            "lastEvent": "SENT_FOR_AUTHORISATION"
+        }
+
+        post_payment_mock.return_value.status_code = 201
+        post_payment_mock.return_value.text = json.dumps(test_payment_response)
+        check_payment_mock.return_value.status_code = 200
+        check_payment_mock.return_value.text = json.dumps(test_payment_response)
+
+        with mock.patch('time.sleep') as sleep_mock:
+            response = self.client.post(
+                reverse('Payment-Details-View'),
+                {
+                    'id': self.app_id,
+                    'card_type': 'visa',
+                    'card_number': '5454545454545454',
+                    'expiry_date_0': 1,
+                    'expiry_date_1': (datetime.date.today().year + 2) % 100,
+                    'cardholders_name': 'Mr Example Cardholder',
+                    'card_security_code': 123,
+                }
+            )
+
+        sleep_mock.assert_not_called()
+        self.assertEqual(check_payment_mock.call_count, 1)
+        poll_mock.assert_called_once_with(self.app_id)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(resolve(response.url).view_name, 'Payment-Processing-View')
+
+    @mock.patch('application.payment_status_poller.payment_status_poller.poll')
+    def test_processing_page_refreshes_while_payment_is_processed(self, poll_mock):
+        models.Payment.objects.create(application_id=self.application, payment_reference='MO:TEST',
+                                      payment_submitted=True)
+
+        response = self.client.get(reverse('Payment-Processing-View'), data={'id': self.app_id, 'attempt': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['refresh_url'],
+                         reverse('Payment-Processing-View') + '?id=' + str(self.app_id) + '&attempt=3')
+        poll_mock.assert_called_once_with(str(self.app_id))
+
+    def test_processing_page_redirects_to_confirmation_once_payment_authorised(self):
+        self.application.application_reference = 'TESTURN'
+        self.application.save()
+        models.Payment.objects.create(application_id=self.application, payment_reference='MO:TEST',
+                                      payment_submitted=True, payment_authorised=True)
+
+        response = self.client.get(reverse('Payment-Processing-View'), data={'id': self.app_id})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(resolve(response.url).view_name, 'Payment-Confirmation')
+
+    def test_processing_page_shows_error_if_payment_rolled_back(self):
+        response = self.client.get(reverse('Payment-Processing-View'), data={'id': self.app_id})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['non_field_errors'].data[0].message,
+                         'There has been a problem when trying to process your payment. '
+                         'Your card has not been charged. '
+                         'Please check your card details and try again.')
+
+    @mock.patch('application.payment_status_poller.payment_status_poller.poll')
+    @mock.patch('application.services.payment_service.check_payment')
+    def test_processing_page_shows_error_at_once_after_payment_error(self, check_payment_mock, poll_mock):
+        models.Payment.objects.create(application_id=self.application, payment_reference='MO:TEST',
+                                      payment_submitted=True)
+        check_payment_mock.return_value.status_code = 200
+        check_payment_mock.return_value.text = json.dumps({'lastEvent': 'ERROR'})
+
+        # The background check finds that Worldpay recorded an error
+        self.assertEqual(payment_reconciliation.reconcile_application_payment(self.app_id), 'ERROR')
+
+        response = self.client.get(reverse('Payment-Processing-View'), data={'id': self.app_id, 'attempt': 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['non_field_errors'].data[0].message,
+                         'There has been a problem when trying to process your payment. '
+                         'Your card has not been charged. '
+                         'Please check your card details and try again.')
+        poll_mock.assert_not_called()
+
+    def test_processing_page_shows_error_once_attempts_exhausted(self):
+        models.Payment.objects.create(application_id=self.application, payment_reference='MO:TEST',
+                                      payment_submitted=True)
+
+        with self.settings(PAYMENT_PROCESSING_ATTEMPTS=3):
+            response = self.client.get(reverse('Payment-Processing-View'), data={'id': self.app_id, 'attempt': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['non_field_errors'].data[0].message,
+                         'There has been a problem when trying to process your payment. '
+                         'Please contact Ofsted for assistance.')
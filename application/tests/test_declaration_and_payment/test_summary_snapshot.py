@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import tag
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from application import models
+from application.tests import utils
+
+
+@tag('http')
+class SummarySnapshotFunctionalTests(utils.NoMiddlewareTestCase):
+
+    def setUp(self):
+        self.application = utils.make_test_application()
+        self.application.application_status = 'SUBMITTED'
+        self.application.declarations_status = 'COMPLETED'
+        self.application.save()
+
+        self.reference = models.Reference.objects.get(application_id=self.application, reference=1)
+        self.reference.first_name = 'Original'
+        self.reference.save()
+
+    def get_summary(self):
+        return self.client.get(reverse('Declaration-Summary-View'), data={'id': self.application.pk})
+
+    def test_submitted_application_summary_is_served_from_snapshot(self):
+        self.get_summary()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_summary()
+
+        self.assertEqual(200, response.status_code)
+        self.assertFalse([query for query in context.captured_queries if '"REFERENCE"' in query['sql']])
+        self.assertTrue(models.SummarySnapshot.objects.filter(application_id=self.application).exists())
+
+    def test_print_page_is_served_from_snapshot(self):
+        self.get_summary()
+        models.Reference.objects.filter(pk=self.reference.pk).update(first_name='Changed')
+
+        response = self.client.get(reverse('Print-Handler-View', kwargs={'page': 'master-summary'}),
+                                   data={'id': self.application.pk, 'orderCode': 'ABC'})
+
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, 'Original')
+        self.assertNotContains(response, 'Changed')
+
+    def test_saving_returned_application_does_not_touch_snapshot(self):
+        self.get_summary()
+        # ARC returns applications by writing to the database directly
+        models.Application.objects.filter(pk=self.application.pk).update(application_status='FURTHER_INFORMATION')
+        application = models.Application.objects.get(pk=self.application.pk)
+
+        with CaptureQueriesContext(connection) as context:
+            application.save()
+
+        self.assertFalse([query for query in context.captured_queries if '"SUMMARY_SNAPSHOT"' in query['sql']])
+
+    @mock.patch('application.views.declaration.magic_link_resubmission_confirmation_email')
+    def test_resubmitting_application_discards_snapshot(self, email_mock):
+        self.get_summary()
+        models.Application.objects.filter(pk=self.application.pk).update(application_status='FURTHER_INFORMATION')
+        models.Reference.objects.filter(pk=self.reference.pk).update(first_name='Changed')
+
+        response = self.client.post(reverse('Declaration-Declaration-View'),
+                                    {'id': self.application.pk, 'declaration_confirmation': True})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(models.Application.objects.get(pk=self.application.pk).application_status, 'SUBMITTED')
+        self.assertFalse(models.SummarySnapshot.objects.filter(application_id=self.application).exists())
+        self.assertContains(self.get_summary(), 'Changed')
+
+    def test_drafting_application_summary_is_not_snapshotted(self):
+        self.application.application_status = 'DRAFTING'
+        self.application.save()
+
+        self.assertEqual(200, self.get_summary().status_code)
+        self.assertFalse(models.SummarySnapshot.objects.filter(application_id=self.application).exists())
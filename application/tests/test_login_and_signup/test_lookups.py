@@ -0,0 +1,41 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, tag
+
+from application import models
+
+
+@tag('unit')
+class TestAccountLookups(TestCase):
+
+    def make_account(self, email):
+        application = models.Application.objects.create()
+        return models.UserDetails.objects.create(application_id=application, email=email)
+
+    def test_email_lookup_ignores_case_and_whitespace(self):
+        account = self.make_account('Jo.Bloggs@example.com')
+
+        self.assertEqual(models.UserDetails.get_by_email(' jo.bloggs@EXAMPLE.com '), account)
+
+    def test_email_lookup_prefers_exact_match(self):
+        self.make_account('jo.bloggs@example.com')
+        account = self.make_account('Jo.Bloggs@example.com')
+
+        self.assertEqual(models.UserDetails.get_by_email('Jo.Bloggs@example.com'), account)
+
+    def test_email_lookup_returns_none_if_no_account_registered(self):
+        self.make_account('')
+
+        self.assertIsNone(models.UserDetails.get_by_email('jo.bloggs@example.com'))
+        self.assertIsNone(models.UserDetails.get_by_email(''))
+
+    def test_benchmark_reports_each_lookup_and_leaves_no_data(self):
+        stdout = StringIO()
+
+        call_command('benchmark_lookups', applications=20, iterations=5, stdout=stdout)
+
+        self.assertIn('Email (case insensitive)', stdout.getvalue())
+        self.assertIn('Magic link', stdout.getvalue())
+        self.assertIn('Health check token', stdout.getvalue())
+        self.assertEqual(models.UserDetails.objects.count(), 0)
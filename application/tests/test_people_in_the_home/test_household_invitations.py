@@ -0,0 +1,100 @@
+from unittest.mock import patch, Mock
+
+from django.test import tag, TestCase, override_settings
+
+from application import models
+from application.household_invitations import send_health_check_invitations
+
+
+@tag('unit')
+@override_settings(NOTIFY_SEND_ASYNCHRONOUSLY=False, PUBLIC_APPLICATION_URL='http://localhost:8000')
+class SendHealthCheckInvitationsUnitTests(TestCase):
+
+    def setUp(self):
+        self.application = models.Application.objects.create()
+        self.adults = [
+            models.AdultInHome.objects.create(application_id=self.application, adult=number, first_name=name,
+                                              birth_day=1, birth_month=8, birth_year=1976,
+                                              email=name.lower() + '@informed.com', health_check_status=health_check)
+            for number, name, health_check in [(1, 'Anne', 'To do'), (2, 'Bob', 'To do'), (3, 'Cat', 'Done')]]
+
+    def test_invites_adults_who_have_not_completed_their_health_check(self):
+        with patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value = Mock(status_code=201)
+            results = send_health_check_invitations(self.adults, 'Jo Bloggs')
+
+        self.assertEqual([result.adult.first_name for result in results], ['Anne', 'Bob'])
+        self.assertTrue(all(result.sent for result in results))
+        self.assertEqual(post_notification.call_count, 2)
+
+    def test_tokens_and_timestamps_are_saved(self):
+        with patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value = Mock(status_code=201)
+            results = send_health_check_invitations(self.adults, 'Jo Bloggs')
+
+        for result in results:
+            adult = models.AdultInHome.objects.get(pk=result.adult.pk)
+            self.assertEqual(adult.token, result.adult.token)
+            self.assertIn(adult.token, result.link)
+            self.assertIsNotNone(adult.email_resent_timestamp)
+
+        self.assertIsNone(models.AdultInHome.objects.get(first_name='Cat').token)
+
+    def test_failed_invitations_are_reported_per_recipient(self):
+        def post(url, notification_request):
+            if notification_request['personalisation']['firstName'] == 'Bob':
+                raise ConnectionError('gateway unavailable')
+            return Mock(status_code=201)
+
+        with patch('application.notify.post_notification', side_effect=post):
+            results = {result.adult.first_name: result for result in
+                       send_health_check_invitations(self.adults, 'Jo Bloggs')}
+
+        self.assertTrue(results['Anne'].sent)
+        self.assertFalse(results['Bob'].sent)
+        self.assertEqual(results['Bob'].error, 'gateway unavailable')
+
+    def test_adults_whose_invitation_failed_are_not_marked_as_invited(self):
+        def post(url, notification_request):
+            if notification_request['personalisation']['firstName'] == 'Bob':
+                return Mock(status_code=500)
+            return Mock(status_code=201)
+
+        with patch('application.notify.post_notification', side_effect=post):
+            results = {result.adult.first_name: result for result in
+                       send_health_check_invitations(self.adults, 'Jo Bloggs')}
+
+        self.assertFalse(results['Bob'].sent)
+        self.assertIsNotNone(models.AdultInHome.objects.get(first_name='Anne').email_resent_timestamp)
+        bob = models.AdultInHome.objects.get(first_name='Bob')
+        self.assertIsNone(bob.email_resent_timestamp)
+        # The token is still written, so the link in any invitation which did arrive works
+        self.assertEqual(bob.token, results['Bob'].adult.token)
+
+    def test_only_adults_whose_invitation_failed_are_invited_again(self):
+        def post(url, notification_request):
+            if notification_request['personalisation']['firstName'] == 'Bob':
+                raise ConnectionError('gateway unavailable')
+            return Mock(status_code=201)
+
+        with patch('application.notify.post_notification', side_effect=post):
+            send_health_check_invitations(models.AdultInHome.objects.all(), 'Jo Bloggs')
+        anne_token = models.AdultInHome.objects.get(first_name='Anne').token
+
+        with patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value = Mock(status_code=201)
+            results = send_health_check_invitations(models.AdultInHome.objects.all(), 'Jo Bloggs')
+
+        self.assertEqual([result.adult.first_name for result in results], ['Bob'])
+        self.assertEqual(post_notification.call_count, 1)
+        self.assertEqual(models.AdultInHome.objects.get(first_name='Anne').token, anne_token)
+        self.assertIsNotNone(models.AdultInHome.objects.get(first_name='Bob').email_resent_timestamp)
+
+    @override_settings(NOTIFY_SEND_ASYNCHRONOUSLY=True)
+    def test_invitations_are_queued_once_when_sending_asynchronously(self):
+        with patch('application.notify.post_notification') as post_notification:
+            results = send_health_check_invitations(self.adults, 'Jo Bloggs')
+
+        post_notification.assert_not_called()
+        self.assertTrue(all(result.sent for result in results))
+        self.assertEqual(models.OutboundNotification.objects.count(), 2)
@@ -0,0 +1,53 @@
+"""
+Unit tests for the request scoped application cache
+"""
+
+from django.test import TestCase, RequestFactory, tag
+
+from ...application_loader import start_request, end_request, load_application, get_current_loader
+from ...models import Application
+
+
+@tag('unit')
+class ApplicationLoaderTests(TestCase):
+
+    def setUp(self):
+        self.application = Application.objects.create(application_status='DRAFTING')
+        self.request = RequestFactory().get('/')
+
+    def tearDown(self):
+        end_request()
+
+    def test_application_is_only_queried_once_per_request(self):
+        start_request(self.request)
+
+        with self.assertNumQueries(1):
+            first = load_application(self.application.pk)
+            second = load_application(str(self.application.pk))
+
+        self.assertIs(first, second)
+        self.assertIs(self.request.application_loader, get_current_loader())
+
+    def test_saving_cached_application_keeps_it_cached(self):
+        start_request(self.request)
+        application = load_application(self.application.pk)
+        application.application_status = 'FURTHER_INFORMATION'
+        application.save()
+
+        with self.assertNumQueries(0):
+            self.assertIs(application, load_application(self.application.pk))
+
+    def test_saving_another_instance_invalidates_cached_application(self):
+        start_request(self.request)
+        load_application(self.application.pk)
+
+        other_instance = Application.objects.get(pk=self.application.pk)
+        other_instance.application_status = 'FURTHER_INFORMATION'
+        other_instance.save()
+
+        self.assertEqual('FURTHER_INFORMATION', load_application(self.application.pk).application_status)
+
+    def test_application_is_queried_every_time_outside_of_a_request(self):
+        with self.assertNumQueries(2):
+            load_application(self.application.pk)
+            load_application(self.application.pk)
@@ -0,0 +1,61 @@
+"""
+Unit tests for the ARC flag handling shared by all childminder forms
+"""
+
+from uuid import uuid4
+
+from django import forms
+from django.test import TestCase, tag
+
+from ...forms.childminder import ChildminderForms
+from ...models import ArcComments
+
+
+class FlaggedAddressForm(ChildminderForms):
+    field_list = ['street_line1', 'town', 'postcode', 'email']
+
+    street_line1 = forms.CharField(required=False)
+    town = forms.CharField(required=False)
+    postcode = forms.CharField(required=False)
+    email = forms.CharField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        self.pk = kwargs.pop('id')
+        super(FlaggedAddressForm, self).__init__(*args, **kwargs)
+
+
+@tag('unit')
+class ChildminderFormsFlagTests(TestCase):
+
+    def setUp(self):
+        self.table_pk = uuid4()
+        ArcComments.objects.create(table_pk=self.table_pk, table_name='REFERENCE', field_name='address',
+                                   comment='Address is incorrect', flagged=True)
+        ArcComments.objects.create(table_pk=self.table_pk, table_name='REFERENCE', field_name='email',
+                                   comment='Email is incorrect', flagged=True)
+
+    def test_check_flag_adds_errors_with_a_single_query(self):
+        form = FlaggedAddressForm({}, id=self.table_pk)
+        form.is_valid()
+
+        with self.assertNumQueries(1):
+            form.check_flag()
+
+        self.assertEqual(['Address is incorrect'], form.errors['street_line1'])
+        self.assertEqual(['Email is incorrect'], form.errors['email'])
+        self.assertIn('town', form.errors)
+
+    def test_remove_flag_unflags_comments_in_two_queries(self):
+        form = FlaggedAddressForm({}, id=self.table_pk)
+
+        with self.assertNumQueries(2):
+            form.remove_flag()
+
+        self.assertFalse(ArcComments.objects.filter(table_pk=self.table_pk, flagged=True).exists())
+        self.assertEqual(2, ArcComments.objects.filter(table_pk=self.table_pk).count())
+
+    def test_remove_flag_does_not_write_when_nothing_is_flagged(self):
+        form = FlaggedAddressForm({}, id=uuid4())
+
+        with self.assertNumQueries(1):
+            form.remove_flag()
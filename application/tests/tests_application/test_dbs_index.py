@@ -0,0 +1,120 @@
+"""
+Unit tests for the local index of the Capita DBS list
+"""
+
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings, tag
+
+from ... import dbs, dbs_index
+from ...models import CapitaDBSFile
+
+CSV_EXPORT = '''certificate_number,date_of_birth,date_of_issue,certificate_information
+123456789014,1985-06-30,2018-03-01,Caution for theft
+123456789012,1980-01-01,2018-01-01,
+not-a-number,1980-01-01,2018-01-01,
+123456789015,30/06/1985,01/03/2018,
+123456789016,1985-02-30,2018-03-01,
+'''
+
+FIXED_WIDTH_EXPORT = '1234567890131975-02-032017-12-25\n'
+
+
+@tag('unit')
+class DBSIndexTests(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.index_path = os.path.join(self.directory, 'dbs.idx')
+
+        dbs.lookup_cache.clear()
+        self.addCleanup(dbs.lookup_cache.clear)
+
+    def write_export(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as export:
+            export.write(content)
+        return path
+
+    def ingest(self, name, content):
+        stdout = StringIO()
+        call_command('ingest_capita_dbs_file', self.write_export(name, content), index_path=self.index_path,
+                     stdout=stdout)
+        return stdout.getvalue()
+
+    def test_csv_export_is_indexed_with_provenance(self):
+        output = self.ingest('capita.csv', CSV_EXPORT)
+
+        self.assertIn('skipped 3 invalid rows', output)
+        index = dbs_index.DBSIndex(self.index_path)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.lookup('123456789014'), {
+            'certificate_number': '123456789014',
+            'date_of_birth': '1985-06-30',
+            'date_of_issue': '2018-03-01',
+            'certificate_information': 'Caution for theft',
+        })
+        self.assertEqual(index.lookup('123456789012')['certificate_information'], '')
+        self.assertIsNone(index.lookup('123456789013'))
+        self.assertIsNone(index.lookup('999999999999'))
+        # Rows with dates which are not in YYYY-MM-DD format, or are not real dates, are skipped
+        self.assertIsNone(index.lookup('123456789015'))
+        self.assertIsNone(index.lookup('123456789016'))
+
+        capita_file = CapitaDBSFile.objects.get()
+        self.assertEqual(capita_file.filename, 'capita.csv')
+        self.assertEqual(capita_file.record_count, 2)
+        self.assertEqual(len(capita_file.checksum), 64)
+
+    def test_fixed_width_export_is_indexed(self):
+        self.ingest('capita.txt', FIXED_WIDTH_EXPORT)
+
+        record = dbs_index.DBSIndex(self.index_path).lookup('123456789013')
+        self.assertEqual(record['date_of_birth'], '1975-02-03')
+        self.assertEqual(record['date_of_issue'], '2017-12-25')
+
+    def test_read_uses_local_index_before_dbs_api(self):
+        self.ingest('capita.csv', CSV_EXPORT)
+
+        with override_settings(DBS_INDEX_PATH=self.index_path), mock.patch('application.gateway.get') as get:
+            get.return_value = mock.Mock(status_code=404)
+
+            response = dbs.read('123456789014')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.record['date_of_birth'], '1985-06-30')
+            get.assert_not_called()
+
+            self.assertEqual(dbs.read('123456789099').status_code, 404)
+            get.assert_called_once()
+
+    def test_invalid_indexed_record_is_looked_up_from_dbs_api(self):
+        dbs_index.write_index([{'certificate_number': '123456789015', 'date_of_birth': '30/06/1985',
+                                'date_of_issue': '01/03/2018', 'certificate_information': ''}], self.index_path)
+
+        with override_settings(DBS_INDEX_PATH=self.index_path), mock.patch('application.gateway.get') as get:
+            get.return_value = mock.Mock(status_code=200, text='{"certificate_number": "123456789015", '
+                                                               '"date_of_birth": "1985-06-30", '
+                                                               '"date_of_issue": "2018-03-01", '
+                                                               '"certificate_information": ""}')
+
+            response = dbs.read('123456789015')
+
+        get.assert_called_once()
+        self.assertEqual(response.record['date_of_birth'], '1985-06-30')
+
+    def test_replaced_index_is_reopened(self):
+        with override_settings(DBS_INDEX_PATH=self.index_path):
+            self.ingest('capita.txt', FIXED_WIDTH_EXPORT)
+            self.assertIsNotNone(dbs_index.lookup('123456789013'))
+
+            self.ingest('capita.csv', CSV_EXPORT)
+            # Ensure the replacement is seen even on filesystems with coarse modification times
+            os.utime(self.index_path, ns=(0, 1))
+            self.assertIsNone(dbs_index.lookup('123456789013'))
+            self.assertIsNotNone(dbs_index.lookup('123456789014'))
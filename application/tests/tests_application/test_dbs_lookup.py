@@ -0,0 +1,85 @@
+"""
+Unit tests for the cached DBS api lookups
+"""
+
+import json
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from ... import dbs
+
+RECORD = {'certificate_number': '123456789012', 'date_of_issue': '2018-01-01', 'date_of_birth': '1980-01-01',
+          'certificate_information': ''}
+
+
+@tag('unit')
+@override_settings(DBS_LOOKUP_CACHE_TTL_IN_SECONDS=60, DBS_LOOKUP_NEGATIVE_CACHE_TTL_IN_SECONDS=30)
+class DBSLookupCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        dbs.lookup_cache.clear()
+        self.addCleanup(dbs.lookup_cache.clear)
+        patcher = mock.patch('application.gateway.get')
+        self.gateway_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.gateway_get.return_value = mock.Mock(status_code=200, text=json.dumps(RECORD))
+
+    def test_found_record_is_cached(self):
+        dbs.read('123456789012')
+        response = dbs.read('123456789012')
+
+        self.assertEqual(response.record, RECORD)
+        self.assertEqual(self.gateway_get.call_count, 1)
+
+    def test_certificate_not_found_is_cached(self):
+        self.gateway_get.return_value = mock.Mock(status_code=404)
+
+        dbs.read('123456789012')
+        self.assertEqual(dbs.read('123456789012').status_code, 404)
+        self.assertEqual(self.gateway_get.call_count, 1)
+
+    def test_failed_lookup_is_not_cached(self):
+        self.gateway_get.return_value = mock.Mock(status_code=500)
+
+        dbs.read('123456789012')
+        dbs.read('123456789012')
+        self.assertEqual(self.gateway_get.call_count, 2)
+
+    def test_expired_lookup_is_repeated(self):
+        with mock.patch('application.dbs.time.monotonic', side_effect=[0, 0, 61, 61]):
+            dbs.read('123456789012')
+            dbs.read('123456789012')
+        self.assertEqual(self.gateway_get.call_count, 2)
+
+    def test_created_certificate_is_looked_up_again(self):
+        self.gateway_get.return_value = mock.Mock(status_code=404)
+        dbs.read('123456789012')
+
+        with mock.patch('application.gateway.post'):
+            dbs.create('123456789012', '2018-01-01', '1980-01-01', '')
+
+        self.gateway_get.return_value = mock.Mock(status_code=200, text=json.dumps(RECORD))
+        self.assertEqual(dbs.read('123456789012').status_code, 200)
+
+    def test_household_certificates_are_looked_up_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get(url, **kwargs):
+            # Each lookup waits for the others to start, which only happens if they run at the same time
+            barrier.wait()
+            return mock.Mock(status_code=404)
+
+        self.gateway_get.side_effect = get
+        responses = dbs.read_many(['123456789012', '123456789013', '123456789014', '123456789012'])
+
+        self.assertEqual(sorted(responses), ['123456789012', '123456789013', '123456789014'])
+        self.assertEqual(self.gateway_get.call_count, 3)
+
+    def test_failed_lookup_is_left_out_of_batch(self):
+        self.gateway_get.side_effect = [ConnectionError(), mock.Mock(status_code=404)]
+
+        responses = dbs.read_many(['123456789012', '123456789013'])
+
+        self.assertEqual(len(responses), 1)
@@ -0,0 +1,90 @@
+"""
+Unit tests for updating several fields of a record in a single UPDATE
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from timeline_logger.models import TimelineLog
+
+from .. import utils
+from ... import status
+from ...business_logic import update_application, update_criminal_record_check
+from ...field_updates import get_field_values, update_fields
+from ...models import Application, CriminalRecordCheck
+
+
+def get_updates(queries):
+    return [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+
+
+@tag('unit')
+class FieldUpdateTests(TestCase):
+
+    def setUp(self):
+        self.application = utils.make_test_application()
+        # The content type is cached for the life of the process
+        ContentType.objects.get_for_model(Application)
+
+    def test_changed_fields_are_written_in_one_update(self):
+        record = CriminalRecordCheck.objects.get(application_id=self.application)
+
+        with CaptureQueriesContext(connection) as queries:
+            changed = update_fields(record, {'capita': True, 'within_three_months': False, 'on_update': None})
+
+        self.assertEqual(sorted(changed), ['capita', 'within_three_months'])
+        updates = get_updates(queries)
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"capita"', updates[0])
+        self.assertIn('"within_three_months"', updates[0])
+        self.assertNotIn('"dbs_certificate_number"', updates[0])
+
+        record.refresh_from_db()
+        self.assertTrue(record.capita)
+        self.assertFalse(record.within_three_months)
+
+    def test_unchanged_fields_are_not_written(self):
+        record = CriminalRecordCheck.objects.get(application_id=self.application)
+
+        with self.assertNumQueries(0):
+            changed = update_fields(record, {'certificate_information': '', 'capita': None})
+
+        self.assertEqual(changed, [])
+
+    def test_helper_accepts_dictionary_of_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            update_criminal_record_check(self.application.pk, {'capita': False, 'certificate_information': 'None'})
+
+        self.assertEqual(len(get_updates(queries)), 1)
+        record = CriminalRecordCheck.objects.get(application_id=self.application)
+        self.assertFalse(record.capita)
+        self.assertEqual(record.certificate_information, 'None')
+
+    def test_helper_rejects_other_field_objects(self):
+        with self.assertRaises(TypeError):
+            get_field_values(1, True)
+
+    def test_changes_to_returned_application_are_logged(self):
+        Application.objects.filter(pk=self.application.pk).update(application_status='FURTHER_INFORMATION')
+
+        update_criminal_record_check(self.application.pk, {'cautions_convictions': True, 'capita': True})
+
+        logs = TimelineLog.objects.filter(object_id=str(self.application.pk), extra_data__contains={'action': 'updated'})
+        self.assertEqual([log.extra_data['field'] for log in logs], ['cautions_convictions'])
+
+    def test_task_status_update_writes_only_the_status(self):
+        with CaptureQueriesContext(connection) as queries:
+            status.update(self.application.pk, 'criminal_record_check_status', 'IN_PROGRESS')
+
+        updates = get_updates(queries)
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"people_in_home_status"', updates[0])
+        self.assertEqual(Application.objects.get(pk=self.application.pk).criminal_record_check_status, 'IN_PROGRESS')
+
+    def test_application_fields_are_updated_together(self):
+        update_application(self.application.pk, ['own_children', 'working_in_other_childminder_home'], True)
+
+        application = Application.objects.get(pk=self.application.pk)
+        self.assertTrue(application.own_children)
+        self.assertTrue(application.working_in_other_childminder_home)
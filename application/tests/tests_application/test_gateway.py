@@ -0,0 +1,43 @@
+"""
+Unit tests for the pooled gateway HTTP client
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from ... import gateway
+
+
+@tag('unit')
+class GatewayClientTests(SimpleTestCase):
+
+    def setUp(self):
+        gateway.close_sessions()
+        self.addCleanup(gateway.close_sessions)
+
+    def test_sessions_are_shared_per_host(self):
+        first = gateway.get_session('http://notify-gateway:8000/api/v1/notifications/email/')
+        second = gateway.get_session('http://notify-gateway:8000/api/v1/notifications/sms/')
+        other = gateway.get_session('http://payment-gateway:8000/api/v1/payments/card/')
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    @override_settings(GATEWAY_POOL_MAXSIZE=7, GATEWAY_MAX_RETRIES=4)
+    def test_sessions_are_pooled_and_retried_from_settings(self):
+        adapter = gateway.get_session('https://addressing:8000/').get_adapter('https://addressing:8000/')
+
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertEqual(4, adapter.max_retries.total)
+        self.assertNotIn('POST', adapter.max_retries.method_whitelist)
+
+    @override_settings(GATEWAY_TIMEOUT_IN_SECONDS=3)
+    def test_requests_default_to_gateway_timeout(self):
+        with mock.patch('requests.Session.request') as session_request:
+            gateway.get('http://dbs:8000/api/v1/dbs/1/')
+            gateway.post('http://dbs:8000/api/v1/dbs/', data={'a': 1}, timeout=12)
+
+        self.assertEqual(3, session_request.call_args_list[0][1]['timeout'])
+        self.assertEqual(12, session_request.call_args_list[1][1]['timeout'])
+        self.assertEqual(('POST', 'http://dbs:8000/api/v1/dbs/'), session_request.call_args_list[1][0])
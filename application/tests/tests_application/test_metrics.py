@@ -0,0 +1,82 @@
+"""
+Unit tests for the metrics registry and endpoint
+"""
+
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, TestCase, override_settings, tag
+from django.urls import reverse
+
+from ... import gateway
+from ...metrics import Counter, Histogram, Registry, registry
+
+
+@tag('unit')
+class MetricsRegistryTests(SimpleTestCase):
+
+    def test_histogram_is_rendered_with_cumulative_buckets(self):
+        test_registry = Registry()
+        histogram = test_registry.register(Histogram('test_duration_seconds', 'Test durations', ('view',),
+                                                     buckets=(0.1, 1.0)))
+        histogram.observe(0.05, 'Task-List-View')
+        histogram.observe(0.5, 'Task-List-View')
+        histogram.observe(5, 'Task-List-View')
+
+        self.assertEqual(test_registry.render().splitlines(), [
+            '# HELP test_duration_seconds Test durations',
+            '# TYPE test_duration_seconds histogram',
+            'test_duration_seconds_bucket{view="Task-List-View",le="0.1"} 1.0',
+            'test_duration_seconds_bucket{view="Task-List-View",le="1.0"} 2.0',
+            'test_duration_seconds_bucket{view="Task-List-View",le="+Inf"} 3.0',
+            'test_duration_seconds_sum{view="Task-List-View"} 5.55',
+            'test_duration_seconds_count{view="Task-List-View"} 3.0',
+        ])
+
+    def test_counter_label_values_are_escaped(self):
+        test_registry = Registry()
+        counter = test_registry.register(Counter('test_errors_total', 'Test errors', ('error',)))
+        counter.inc('say "hello"')
+        counter.inc('say "hello"', amount=2)
+
+        self.assertIn('test_errors_total{error="say \\"hello\\""} 3.0', test_registry.render())
+
+
+@tag('http')
+@override_settings(NOTIFY_URL='http://notify.test/notify-gateway', METRICS_ENABLED=True, METRICS_BEARER_TOKEN='')
+class MetricsEndpointTests(TestCase):
+
+    def setUp(self):
+        registry.clear()
+
+    def test_metrics_are_served_without_authentication(self):
+        self.client.get(reverse('Help-And-Contact-View'))
+
+        response = self.client.get(reverse('Metrics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn('childminder_view_duration_seconds_count{view="Help-And-Contact-View",method="GET"} 1.0',
+                      response.content.decode())
+        self.assertIn('childminder_view_responses_total{view="Help-And-Contact-View",method="GET",status="200"} 1.0',
+                      response.content.decode())
+
+    @override_settings(METRICS_BEARER_TOKEN='secret')
+    def test_metrics_require_bearer_token_if_set(self):
+        self.assertEqual(self.client.get(reverse('Metrics')).status_code, 403)
+        self.assertEqual(self.client.get(reverse('Metrics'), HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+
+    def test_gateway_calls_and_errors_are_recorded(self):
+        with mock.patch('requests.Session.request', return_value=mock.Mock(status_code=503)):
+            gateway.post('http://notify.test/notify-gateway/api/v1/notifications/email/')
+        with mock.patch('requests.Session.request', side_effect=requests.exceptions.ConnectTimeout()):
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                gateway.get('http://notify.test/notify-gateway/api/v1/health/')
+
+        metrics = self.client.get(reverse('Metrics')).content.decode()
+
+        self.assertIn('childminder_gateway_request_duration_seconds_count{gateway="notify",method="POST"} 1.0', metrics)
+        self.assertIn('childminder_gateway_request_duration_seconds_count{gateway="notify",method="GET"} 1.0', metrics)
+        self.assertIn('childminder_gateway_errors_total{gateway="notify",method="POST",error="503"} 1.0', metrics)
+        self.assertIn('childminder_gateway_errors_total{gateway="notify",method="GET",error="ConnectTimeout"} 1.0',
+                      metrics)
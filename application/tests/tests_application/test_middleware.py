@@ -0,0 +1,114 @@
+"""
+Unit tests for the custom authentication middleware
+"""
+
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.core.signing import TimestampSigner
+from django.http import HttpResponse
+from django.test import TestCase, RequestFactory, tag
+
+from ...middleware import CustomAuthenticationHandler, COOKIE_IDENTIFIER
+from ...models import Application, UserDetails
+from ...ownership_cache import ownership_cache
+
+
+@tag('unit')
+class CustomAuthenticationHandlerTests(TestCase):
+
+    def setUp(self):
+        self.middleware = CustomAuthenticationHandler(lambda request: HttpResponse())
+        self.factory = RequestFactory()
+
+    def test_exempt_paths_are_allowed_through_without_session(self):
+        for path in ['/', '/sign-in/', '/health-check/a1b2c3/', '/validate/abc-123/', '/djga/anything',
+                     '/prepare-interview/']:
+            response = self.middleware(self.factory.get(settings.URL_PREFIX + path))
+            self.assertEqual(200, response.status_code, path)
+
+    def test_protected_paths_redirect_to_sign_in_without_session(self):
+        for path in ['/task-list/', '/health-check/a1b2c3/extra/', '/sign-in/check-answers/']:
+            response = self.middleware(self.factory.get(settings.URL_PREFIX + path))
+            self.assertEqual(302, response.status_code, path)
+            self.assertEqual(settings.AUTHENTICATION_URL, response.url)
+
+
+@tag('unit')
+class ApplicationOwnershipTests(TestCase):
+
+    def setUp(self):
+        ownership_cache.clear()
+        self.middleware = CustomAuthenticationHandler(lambda request: HttpResponse())
+        self.factory = RequestFactory()
+        self.application = Application.objects.create(application_status='DRAFTING')
+        self.account = UserDetails.objects.create(application_id=self.application, email='owner@example.com')
+
+    def tearDown(self):
+        ownership_cache.clear()
+
+    def get_task_list(self, email):
+        request = self.factory.get(settings.URL_PREFIX + '/task-list/', {'id': self.application.pk})
+        request.COOKIES[COOKIE_IDENTIFIER] = TimestampSigner().sign(email)
+        return self.middleware(request)
+
+    def test_owner_is_verified_once_then_served_from_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(200, self.get_task_list('owner@example.com').status_code)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(200, self.get_task_list('owner@example.com').status_code)
+
+    def test_other_user_is_rejected(self):
+        with self.assertRaises(Exception):
+            self.get_task_list('someone.else@example.com')
+
+    def test_changing_email_invalidates_verified_owner(self):
+        self.get_task_list('owner@example.com')
+
+        self.account.email = 'new.owner@example.com'
+        self.account.save()
+
+        with self.assertRaises(Exception):
+            self.get_task_list('owner@example.com')
+        self.assertEqual(200, self.get_task_list('new.owner@example.com').status_code)
+
+
+@tag('unit')
+class SessionCookieTests(TestCase):
+
+    def setUp(self):
+        self.middleware = CustomAuthenticationHandler(lambda request: HttpResponse())
+        self.request = RequestFactory().get(settings.URL_PREFIX + '/task-list/')
+        self.request.COOKIES[COOKIE_IDENTIFIER] = TimestampSigner().sign('owner@example.com')
+
+    def test_session_is_only_unsigned_once_per_request(self):
+        with mock.patch.object(TimestampSigner, 'unsign', autospec=True,
+                               side_effect=TimestampSigner.unsign) as unsign:
+            self.middleware(self.request)
+            CustomAuthenticationHandler.get_session_user(self.request)
+
+        self.assertEqual(1, unsign.call_count)
+        self.assertEqual('owner@example.com', CustomAuthenticationHandler.get_session_user(self.request))
+
+    def test_fresh_cookie_is_not_reissued(self):
+        response = self.middleware(self.request)
+        self.assertNotIn(COOKIE_IDENTIFIER, response.cookies)
+
+    def test_cookie_is_reissued_once_inside_refresh_window(self):
+        now = time.time() + 1800 - settings.SESSION_REFRESH_WINDOW_IN_SECONDS + 1
+        with mock.patch('application.middleware.time.time', return_value=now):
+            response = self.middleware(self.request)
+        self.assertIn(COOKIE_IDENTIFIER, response.cookies)
+
+    def test_cookie_set_by_view_is_not_overwritten(self):
+        def logout(request):
+            response = HttpResponse()
+            CustomAuthenticationHandler.destroy_session(response)
+            return response
+
+        now = time.time() + 1700
+        with mock.patch('application.middleware.time.time', return_value=now):
+            response = CustomAuthenticationHandler(logout)(self.request)
+        self.assertEqual('', response.cookies[COOKIE_IDENTIFIER].value)
@@ -0,0 +1,82 @@
+"""
+Unit tests for the notification outbox
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings, tag
+from django.utils import timezone
+
+from ... import notification_outbox, notify
+from ...models import OutboundNotification
+
+
+@tag('unit')
+@override_settings(NOTIFICATION_OUTBOX_MAX_ATTEMPTS=2, NOTIFICATION_OUTBOX_RETRY_BACKOFF_IN_SECONDS=30)
+class NotificationOutboxTests(TestCase):
+
+    def queue(self, idempotency_key=None):
+        return notification_outbox.queue_notification('EMAIL', 'test@informed.com', {'link': 'abc'}, 'template-id',
+                                                      idempotency_key)
+
+    def test_notification_is_only_queued_once_per_idempotency_key(self):
+        first = self.queue('invitation-1')
+        second = self.queue('invitation-1')
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(OutboundNotification.objects.count(), 1)
+
+    def test_send_email_queues_notification_when_asynchronous(self):
+        with mock.patch('application.notify.post_notification') as post_notification:
+            notification = notify.send_email('test@informed.com', {'link': 'abc'}, 'template-id', asynchronous=True)
+
+        post_notification.assert_not_called()
+        self.assertEqual(notification.status, 'PENDING')
+        self.assertEqual(notification.notification_type, 'EMAIL')
+
+    def test_due_notification_is_sent(self):
+        notification = self.queue()
+
+        with mock.patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value.status_code = 201
+            sent, failed = notification_outbox.send_due_notifications(concurrency=1)
+
+        self.assertEqual((sent, failed), (1, 0))
+        post_notification.assert_called_once()
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'SENT')
+        self.assertEqual(notification.attempts, 1)
+        self.assertIsNotNone(notification.date_sent)
+
+    def test_sent_notification_is_not_sent_again(self):
+        self.queue()
+
+        with mock.patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value.status_code = 201
+            notification_outbox.send_due_notifications(concurrency=1)
+            notification_outbox.send_due_notifications(concurrency=1)
+
+        post_notification.assert_called_once()
+
+    def test_failed_notification_is_retried_with_backoff_then_given_up(self):
+        notification = self.queue()
+
+        with mock.patch('application.notify.post_notification') as post_notification:
+            post_notification.return_value.status_code = 503
+            self.assertEqual(notification_outbox.send_due_notifications(concurrency=1), (0, 1))
+
+            notification.refresh_from_db()
+            self.assertEqual(notification.status, 'PENDING')
+            self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=25))
+
+            # Not due again until the backoff has passed
+            self.assertEqual(notification_outbox.send_due_notifications(concurrency=1), (0, 0))
+
+            OutboundNotification.objects.filter(pk=notification.pk).update(next_attempt_at=timezone.now())
+            self.assertEqual(notification_outbox.send_due_notifications(concurrency=1), (0, 1))
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'FAILED')
+        self.assertEqual(notification.attempts, 2)
+        self.assertIn('503', notification.last_error)
@@ -0,0 +1,67 @@
+"""
+Unit tests for the Notify gateway health monitor
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from ... import utils
+from ...notify_monitor import NotifyHealthMonitor
+
+
+@tag('unit')
+@override_settings(NOTIFY_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2)
+class NotifyHealthMonitorTests(SimpleTestCase):
+
+    def setUp(self):
+        self.probe = mock.Mock(return_value=True)
+        self.monitor = NotifyHealthMonitor(probe=self.probe)
+        # The background thread is not needed as probes are run directly
+        patcher = mock.patch.object(self.monitor, 'start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_circuit_opens_after_consecutive_failures(self):
+        self.probe.return_value = False
+
+        self.monitor.check()
+        self.assertTrue(self.monitor.is_available())
+
+        self.monitor.check()
+        self.assertFalse(self.monitor.is_available())
+
+    def test_successful_probe_closes_circuit(self):
+        self.probe.side_effect = [False, False, True]
+        self.monitor.check()
+        self.monitor.check()
+
+        self.monitor.check()
+
+        self.assertTrue(self.monitor.is_available())
+        self.assertEqual(0, self.monitor.consecutive_failures)
+
+    def test_probe_exceptions_count_as_failures(self):
+        self.probe.side_effect = Exception
+
+        self.assertFalse(self.monitor.check())
+        self.assertEqual(1, self.monitor.consecutive_failures)
+
+    def test_availability_is_read_without_probing(self):
+        self.monitor.record_failure()
+        self.monitor.record_failure()
+
+        self.assertFalse(self.monitor.is_available())
+        self.probe.assert_not_called()
+
+
+@tag('unit')
+class TestNotifyTests(SimpleTestCase):
+
+    @override_settings(EXECUTING_AS_TEST=None)
+    def test_sign_in_check_consults_monitor_instead_of_sending_probe(self):
+        with mock.patch('application.utils.notify_monitor.is_available', return_value=False), \
+                mock.patch('application.utils.test_notify_connection') as notify_connection:
+            self.assertFalse(utils.test_notify())
+
+        notify_connection.assert_not_called()
@@ -0,0 +1,161 @@
+"""
+Unit tests for the outbox of SC1 payment messages
+"""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings, tag
+from django.utils import timezone
+
+from .. import utils
+from ...messaging.sqs_handler import LocalSQSClient
+from ...models import ApplicantName, OutboundPaymentMessage, Payment
+from ...payment_outbox import (claim_payment_messages, publish_payment_message, queue_payment_message,
+                              relay_due_payment_messages)
+from ...payment_reconciliation import finalise_authorised_payment
+
+
+def make_message_body(payment_ref):
+    return {'payment_action': 'SC1', 'payment_ref': payment_ref, 'payment_amount': '35.0000',
+            'urn': 'EY1000001', 'setting_name': 'Bloggs,Jo'}
+
+
+@tag('unit')
+@override_settings(SQS_BACKEND='local', SQS_LOCAL_QUEUE_DIRECTORY='', PAYMENT_NOTIFICATIONS_QUEUE_NAME='TEST_PAYMENTS',
+                   PAYMENT_OUTBOX_RETRY_BACKOFF_IN_SECONDS=30, PAYMENT_OUTBOX_MAX_BACKOFF_IN_SECONDS=60)
+class PaymentOutboxTests(TestCase):
+
+    def setUp(self):
+        LocalSQSClient.messages.clear()
+        self.addCleanup(LocalSQSClient.messages.clear)
+
+    @staticmethod
+    def published_refs():
+        return [json.loads(body)['payment_ref'] for body in LocalSQSClient.messages['local://TEST_PAYMENTS']]
+
+    @staticmethod
+    def make_submitted_payment():
+        application = utils.make_test_application()
+        application.application_reference = '1000001'
+        application.save()
+        ApplicantName.objects.filter(application_id=application).update(
+            first_name='Jo', middle_names='', last_name='Bloggs')
+        Payment.objects.create(application_id=application, payment_reference='MO:1000001', payment_submitted=True)
+        return application
+
+    def test_message_is_queued_with_authorisation(self):
+        application = self.make_submitted_payment()
+
+        self.assertTrue(finalise_authorised_payment(application, 3500))
+        self.assertFalse(finalise_authorised_payment(application, 3500))
+
+        message = OutboundPaymentMessage.objects.get()
+        self.assertEqual(json.loads(message.message_body)['payment_ref'], 'MO:1000001')
+        self.assertEqual(json.loads(message.message_body)['payment_amount'], '35.0000')
+        self.assertEqual(self.published_refs(), [])
+
+    def test_message_is_published_once_authorisation_is_committed(self):
+        application = self.make_submitted_payment()
+
+        with mock.patch('application.payment_reconciliation.transaction.on_commit') as on_commit:
+            finalise_authorised_payment(application, 3500)
+
+        # Run the callback as the committed transaction would
+        on_commit.call_args[0][0]()
+
+        self.assertEqual(self.published_refs(), ['MO:1000001'])
+        self.assertEqual(OutboundPaymentMessage.objects.get().status, 'PUBLISHED')
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (0, 0))
+
+    @override_settings(PAYMENT_OUTBOX_PUBLISH_ON_COMMIT=False)
+    def test_message_is_left_for_relay_unless_published_on_commit(self):
+        application = self.make_submitted_payment()
+
+        with mock.patch('application.payment_reconciliation.transaction.on_commit') as on_commit:
+            finalise_authorised_payment(application, 3500)
+
+        on_commit.assert_not_called()
+
+    def test_message_which_cannot_be_published_on_commit_is_left_for_relay(self):
+        queue_payment_message(make_message_body('MO:1000001'))
+
+        with mock.patch.object(LocalSQSClient, 'send_message_batch', side_effect=ConnectionError()):
+            self.assertFalse(publish_payment_message('MO:1000001'))
+
+        self.assertEqual(OutboundPaymentMessage.objects.get().status, 'PENDING')
+        OutboundPaymentMessage.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (1, 0))
+        self.assertEqual(self.published_refs(), ['MO:1000001'])
+
+    def test_authorisation_is_rolled_back_if_message_cannot_be_queued(self):
+        application = self.make_submitted_payment()
+
+        with mock.patch('application.payment_reconciliation.queue_payment_message', side_effect=RuntimeError()):
+            with self.assertRaises(RuntimeError):
+                finalise_authorised_payment(application, 3500)
+
+        self.assertFalse(Payment.objects.get(application_id=application).payment_authorised)
+
+    def test_message_is_only_queued_once_per_payment_reference(self):
+        queue_payment_message(make_message_body('MO:1000001'))
+        queue_payment_message(make_message_body('MO:1000001'))
+
+        self.assertEqual(OutboundPaymentMessage.objects.count(), 1)
+
+    def test_due_messages_are_published_in_batches(self):
+        for reference in range(25):
+            queue_payment_message(make_message_body('MO:' + str(reference)))
+
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (25, 0))
+
+        self.assertEqual(sorted(self.published_refs()), sorted('MO:' + str(reference) for reference in range(25)))
+        self.assertFalse(OutboundPaymentMessage.objects.exclude(status='PUBLISHED').exists())
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (0, 0))
+
+    def test_failed_message_is_retried_with_backoff(self):
+        queue_payment_message(make_message_body('MO:1000001'))
+        queue_payment_message(make_message_body('MO:1000002'))
+
+        def send_message_batch(QueueUrl, Entries):
+            return {'Successful': [{'Id': entry['Id']} for entry in Entries
+                                   if json.loads(entry['MessageBody'])['payment_ref'] != 'MO:1000002'],
+                    'Failed': [{'Id': entry['Id']} for entry in Entries
+                               if json.loads(entry['MessageBody'])['payment_ref'] == 'MO:1000002']}
+
+        with mock.patch.object(LocalSQSClient, 'send_message_batch', side_effect=send_message_batch):
+            self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (1, 1))
+
+        failed = OutboundPaymentMessage.objects.get(payment_ref='MO:1000002')
+        self.assertEqual(failed.status, 'PENDING')
+        self.assertEqual(failed.attempts, 1)
+        self.assertGreater(failed.next_attempt_at, timezone.now() + timedelta(seconds=25))
+        self.assertEqual(claim_payment_messages(100), [])
+
+        OutboundPaymentMessage.objects.filter(pk=failed.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (1, 0))
+        self.assertEqual(OutboundPaymentMessage.objects.get(pk=failed.pk).status, 'PUBLISHED')
+
+    def test_message_held_by_dead_relay_is_published_again(self):
+        queue_payment_message(make_message_body('MO:1000001'))
+        claimed = claim_payment_messages(100)
+        self.assertEqual(len(claimed), 1)
+        self.assertEqual(claim_payment_messages(100), [])
+
+        OutboundPaymentMessage.objects.update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(relay_due_payment_messages(batch_size=100, concurrency=1), (1, 0))
+
+        # The first relay's claim has expired, so its outcome is not recorded
+        self.assertEqual(OutboundPaymentMessage.objects.get().attempts, 2)
+
+    def test_command_publishes_due_messages(self):
+        queue_payment_message(make_message_body('MO:1000001'))
+        stdout = StringIO()
+
+        call_command('relay_payment_messages', once=True, concurrency=1, stdout=stdout)
+
+        self.assertEqual(self.published_refs(), ['MO:1000001'])
+        self.assertIn('Published 1 payment messages, 0 failed', stdout.getvalue())
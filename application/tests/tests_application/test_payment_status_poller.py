@@ -0,0 +1,60 @@
+"""
+Unit tests for the background payment status poller
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from ...payment_status_poller import PaymentStatusPoller
+
+
+@tag('unit')
+@override_settings(PAYMENT_PROCESSING_ATTEMPTS=3, PAYMENT_STATUS_POLL_INITIAL_DELAY_IN_SECONDS=2,
+                   PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS=5)
+class PaymentStatusPollerTests(SimpleTestCase):
+
+    def setUp(self):
+        self.reconcile = mock.Mock(return_value='PENDING')
+        self.poller = PaymentStatusPoller(reconcile=self.reconcile)
+        # The background thread is not needed as checks are run directly
+        patcher = mock.patch.object(self.poller, 'start')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_delay_between_checks_backs_off_up_to_query_interval(self):
+        self.assertEqual([self.poller.get_delay(checks_made) for checks_made in range(4)], [2, 4, 5, 5])
+
+    def test_payment_is_only_polled_once(self):
+        self.poller.poll('app')
+        self.poller.poll('app')
+
+        self.assertEqual(len(self.poller.payments), 1)
+
+    def test_pending_payment_is_checked_again_until_attempts_exhausted(self):
+        self.poller.poll('app')
+
+        self.poller.check('app', 0)
+        self.assertEqual(self.poller.payments['app'][1], 1)
+        self.poller.check('app', 1)
+        self.assertTrue(self.poller.is_polling('app'))
+
+        self.poller.check('app', 2)
+        self.assertFalse(self.poller.is_polling('app'))
+        self.assertEqual(self.reconcile.call_count, 3)
+
+    def test_polling_stops_once_payment_processed(self):
+        self.reconcile.return_value = 'AUTHORISED'
+        self.poller.poll('app')
+
+        self.poller.check('app', 0)
+
+        self.assertFalse(self.poller.is_polling('app'))
+
+    def test_failed_check_is_retried(self):
+        self.reconcile.side_effect = ConnectionError()
+        self.poller.poll('app')
+
+        self.poller.check('app', 0)
+
+        self.assertTrue(self.poller.is_polling('app'))
@@ -0,0 +1,73 @@
+"""
+Unit tests for the postcode search cache
+"""
+
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings, tag
+
+from ...address_helper import AddressHelper
+from ...postcode_cache import PostcodeCache, postcode_cache
+
+ADDRESS_MATCHES = '''{"count": 2, "results": [
+    {"combinedAddress": "1 Test Street, Testville, WA14 4PA", "line1": "1 Test Street", "line2": "",
+     "townOrCity": "Testville", "postcode": "WA14 4PA"},
+    {"combinedAddress": "2 Test Street, Testville, WA14 4PA", "line1": "2 Test Street", "line2": "",
+     "townOrCity": "Testville", "postcode": "WA14 4PA"}]}'''
+
+
+@tag('unit')
+@override_settings(POSTCODE_CACHE_BACKEND='')
+class PostcodeCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        postcode_cache.clear()
+        self.addCleanup(postcode_cache.clear)
+        patcher = mock.patch('application.gateway.get')
+        self.gateway_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.gateway_get.return_value = mock.Mock(status_code=200, text=ADDRESS_MATCHES)
+
+    def test_posted_address_is_read_from_cache(self):
+        addresses = AddressHelper.create_address_lookup_list('WA14 4PA')
+        address = AddressHelper.get_posted_address(1, 'wa144pa')
+
+        self.assertEqual(addresses[0], (None, '2 addresses found'))
+        self.assertEqual(address['line1'], '2 Test Street')
+        self.assertEqual(self.gateway_get.call_count, 1)
+        self.assertEqual(postcode_cache.stats(), {'hits': 1, 'misses': 1, 'size': 1})
+
+    def test_failed_search_is_not_cached(self):
+        self.gateway_get.return_value = mock.Mock(status_code=500)
+        self.assertEqual(AddressHelper.create_address_lookup_list('WA14 4PA'), [])
+
+        self.gateway_get.return_value = mock.Mock(status_code=200, text=ADDRESS_MATCHES)
+        self.assertEqual(len(AddressHelper.create_address_lookup_list('WA14 4PA')), 3)
+        self.assertEqual(self.gateway_get.call_count, 2)
+
+    def test_least_recently_used_postcode_is_evicted(self):
+        cache = PostcodeCache(max_entries=2, ttl=60)
+        cache.get_or_fetch('A1 1AA', lambda: 'a')
+        cache.get_or_fetch('B1 1BB', lambda: 'b')
+        cache.get_or_fetch('A1 1AA', lambda: 'a')
+        cache.get_or_fetch('C1 1CC', lambda: 'c')
+
+        fetch = mock.Mock(return_value='b')
+        cache.get_or_fetch('B1 1BB', fetch)
+        fetch.assert_called_once_with()
+
+    def test_expired_results_are_fetched_again(self):
+        cache = PostcodeCache(ttl=60)
+        with mock.patch('application.postcode_cache.time.monotonic', side_effect=[0, 61]):
+            cache.get_or_fetch('A1 1AA', lambda: 'old')
+            self.assertEqual(cache.get_or_fetch('A1 1AA', lambda: 'new'), 'new')
+
+    @override_settings(POSTCODE_CACHE_BACKEND='default')
+    def test_results_are_shared_between_processes(self):
+        self.addCleanup(caches['default'].clear)
+        AddressHelper.create_address_lookup_list('WA14 4PA')
+        postcode_cache.entries.clear()
+
+        AddressHelper.create_address_lookup_list('WA14 4PA')
+        self.assertEqual(self.gateway_get.call_count, 1)
@@ -0,0 +1,62 @@
+"""
+Unit tests for the query budget instrumentation
+"""
+
+import logging
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings, tag
+from django.urls import resolve
+
+from ...models import Application
+from ...query_budget import QueryBudgetExceeded, QueryBudgetMiddleware, fingerprint
+
+
+def make_view(queries):
+    """
+    :return: stand in for the rest of the middleware chain, issuing the given number of queries
+    """
+    def get_response(request):
+        request.resolver_match = resolve('/childminder/task-list/')
+        for n in range(queries):
+            Application.objects.filter(application_reference=str(n)).exists()
+        return HttpResponse()
+    return get_response
+
+
+@tag('unit')
+@override_settings(QUERY_BUDGET_ENABLED=True, QUERY_BUDGET_STRICT=False, QUERY_BUDGET_DEFAULT=20,
+                   QUERY_BUDGET_DUPLICATE_THRESHOLD=2, QUERY_BUDGETS={'Task-List-View': 5})
+class QueryBudgetTests(TestCase):
+
+    def test_queries_differing_only_in_parameters_share_a_fingerprint(self):
+        self.assertEqual(fingerprint("SELECT * FROM \"APPLICATION\" WHERE id = 'abc' AND n = 12"),
+                         fingerprint("SELECT * FROM \"APPLICATION\" WHERE id = 'it''s' AND n = 3"))
+        self.assertEqual(fingerprint('SELECT * FROM "ARC_COMMENTS" WHERE table_pk IN (1, 2, 3)'),
+                         fingerprint('SELECT * FROM "ARC_COMMENTS" WHERE table_pk IN (4)'))
+
+    def test_request_within_budget_is_not_reported(self):
+        with self.assertLogs('application.query_budget', 'INFO') as logs:
+            QueryBudgetMiddleware(make_view(1))(RequestFactory().get('/'))
+            # assertLogs requires something to be logged
+            logging.getLogger('application.query_budget').info('done')
+
+        self.assertEqual(logs.output, ['INFO:application.query_budget:done'])
+
+    def test_request_over_budget_is_logged_with_repeated_queries(self):
+        with self.assertLogs('application.query_budget', 'WARNING') as logs:
+            QueryBudgetMiddleware(make_view(6))(RequestFactory().get('/'))
+
+        self.assertIn('Task-List-View issued 6 queries (budget 5)', logs.output[0])
+        self.assertIn('6 x SELECT', logs.output[0])
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_request_over_budget_raises_in_strict_mode(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            QueryBudgetMiddleware(make_view(6))(RequestFactory().get('/'))
+
+    @override_settings(QUERY_BUDGET_ENABLED=False)
+    def test_middleware_is_not_used_unless_enabled(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            QueryBudgetMiddleware(make_view(0))
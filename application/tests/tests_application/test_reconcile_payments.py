@@ -0,0 +1,91 @@
+"""
+Unit tests for the payment reconciliation management command
+"""
+
+import json
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, tag
+
+from .. import utils
+from ...management.commands.reconcile_payments import Command
+from ...models import ApplicantName, Application, OutboundPaymentMessage, Payment
+
+
+@tag('unit')
+@mock.patch('application.services.payment_service.check_payment')
+class ReconcilePaymentsTests(TestCase):
+
+    def setUp(self):
+        self.applications = []
+        for reference in ('1000001', '1000002', '1000003'):
+            application = utils.make_test_application()
+            application.application_reference = reference
+            application.save()
+            ApplicantName.objects.filter(application_id=application).update(
+                first_name='Jo', middle_names='', last_name='Bloggs')
+            Payment.objects.create(application_id=application, payment_reference='MO:' + reference,
+                                   payment_submitted=True)
+            self.applications.append(application)
+
+    @staticmethod
+    def payment_status(statuses):
+        def check_payment(payment_reference):
+            if statuses[payment_reference] is None:
+                return mock.Mock(status_code=404, text='')
+            return mock.Mock(status_code=200, text=json.dumps({'lastEvent': statuses[payment_reference]}))
+        return check_payment
+
+    def reconcile(self):
+        call_command('reconcile_payments', once=True, concurrency=1, rate=0, stdout=StringIO())
+
+    def test_outstanding_payments_are_finalised_or_rolled_back(self, check_payment_mock):
+        check_payment_mock.side_effect = self.payment_status({
+            'MO:1000001': 'AUTHORISED', 'MO:1000002': 'REFUSED', 'MO:1000003': 'SENT_FOR_AUTHORISATION'})
+
+        self.reconcile()
+
+        authorised, refused, pending = self.applications
+        self.assertTrue(Payment.objects.get(application_id=authorised).payment_authorised)
+        self.assertIsNotNone(Application.objects.get(pk=authorised.pk).date_submitted)
+        self.assertFalse(Payment.objects.filter(application_id=refused).exists())
+        self.assertFalse(Payment.objects.get(application_id=pending).payment_authorised)
+
+        self.assertEqual(list(OutboundPaymentMessage.objects.values_list('payment_ref', flat=True)), ['MO:1000001'])
+
+    def test_authorised_payment_is_only_sent_to_noo_once(self, check_payment_mock):
+        check_payment_mock.side_effect = self.payment_status({
+            'MO:1000001': 'AUTHORISED', 'MO:1000002': 'AUTHORISED', 'MO:1000003': 'AUTHORISED'})
+
+        self.reconcile()
+        self.reconcile()
+
+        self.assertEqual(OutboundPaymentMessage.objects.count(), 3)
+        self.assertEqual(check_payment_mock.call_count, 3)
+
+    def test_errored_and_unknown_payments_are_rolled_back_and_not_checked_again(self, check_payment_mock):
+        check_payment_mock.side_effect = self.payment_status({
+            'MO:1000001': 'ERROR', 'MO:1000002': None, 'MO:1000003': 'SENT_FOR_AUTHORISATION'})
+
+        self.reconcile()
+        self.reconcile()
+
+        errored, unknown, pending = self.applications
+        self.assertFalse(Payment.objects.filter(application_id__in=[errored, unknown]).exists())
+        self.assertTrue(Payment.objects.filter(application_id=pending).exists())
+        self.assertEqual(check_payment_mock.call_count, 4)
+
+    def test_sweeps_carry_on_from_last_payment_checked(self, check_payment_mock):
+        check_payment_mock.side_effect = self.payment_status({
+            'MO:1000001': 'SENT_FOR_AUTHORISATION', 'MO:1000002': 'SENT_FOR_AUTHORISATION',
+            'MO:1000003': 'SENT_FOR_AUTHORISATION'})
+        command = Command(stdout=StringIO(), stderr=StringIO())
+
+        for sweep in range(4):
+            command.sweep(batch_size=2, concurrency=1, rate=0)
+
+        checked = [call[0][0] for call in check_payment_mock.call_args_list]
+        payment_references = list(Payment.objects.order_by('payment_id').values_list('payment_reference', flat=True))
+        self.assertEqual(checked, (payment_references * 3)[:8])
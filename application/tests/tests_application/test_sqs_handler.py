@@ -0,0 +1,82 @@
+"""
+Unit tests for the SQS publisher
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from ...messaging.sqs_handler import LocalSQSClient, SQSHandler, get_sqs_handler
+
+
+@tag('unit')
+@override_settings(SQS_BACKEND='local', SQS_LOCAL_QUEUE_DIRECTORY='')
+class SQSHandlerTests(SimpleTestCase):
+
+    def setUp(self):
+        LocalSQSClient.messages.clear()
+        self.addCleanup(LocalSQSClient.messages.clear)
+
+    def test_queue_is_not_connected_until_first_message(self):
+        with mock.patch('boto3.Session') as session:
+            handler = SQSHandler('TEST_QUEUE')
+            session.assert_not_called()
+        self.assertIsNone(handler.queue_url)
+
+        handler.send_message({'payment_ref': 'MO1'})
+
+        self.assertEqual(handler.queue_url, 'local://TEST_QUEUE')
+        self.assertEqual(LocalSQSClient.messages['local://TEST_QUEUE'], [json.dumps({'payment_ref': 'MO1'})])
+
+    def test_handler_is_shared_per_queue(self):
+        self.assertIs(get_sqs_handler('TEST_QUEUE'), get_sqs_handler('TEST_QUEUE'))
+
+    def test_messages_are_published_in_batches_of_ten(self):
+        handler = SQSHandler('TEST_QUEUE')
+        handler.connect()
+
+        with mock.patch.object(handler.client, 'send_message_batch',
+                               wraps=handler.client.send_message_batch) as send_message_batch:
+            self.assertEqual(handler.send_messages([{'payment_ref': str(n)} for n in range(25)]), [])
+
+        self.assertEqual([len(call[1]['Entries']) for call in send_message_batch.call_args_list], [10, 10, 5])
+        self.assertEqual(len(LocalSQSClient.messages['local://TEST_QUEUE']), 25)
+
+    def test_failed_message_is_retried_before_next_message(self):
+        handler = SQSHandler('TEST_QUEUE')
+        handler.connect()
+
+        with mock.patch.object(handler.client, 'send_message', side_effect=ConnectionError()):
+            handler.send_message({'payment_ref': 'MO1'})
+        self.assertEqual(list(handler.retry_buffer), [{'payment_ref': 'MO1'}])
+
+        handler.send_message({'payment_ref': 'MO2'})
+
+        self.assertEqual(len(handler.retry_buffer), 0)
+        self.assertEqual([json.loads(body)['payment_ref'] for body in LocalSQSClient.messages['local://TEST_QUEUE']],
+                         ['MO1', 'MO2'])
+
+    def test_failed_batch_entries_are_returned(self):
+        handler = SQSHandler('TEST_QUEUE')
+        handler.connect()
+
+        with mock.patch.object(handler.client, 'send_message_batch',
+                               return_value={'Successful': [{'Id': '0'}], 'Failed': [{'Id': '1'}]}):
+            failed = handler.send_messages([{'payment_ref': 'MO1'}, {'payment_ref': 'MO2'}], buffer_failures=False)
+
+        self.assertEqual(failed, [{'payment_ref': 'MO2'}])
+        self.assertEqual(len(handler.retry_buffer), 0)
+
+    def test_messages_can_be_written_to_local_files(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        with self.settings(SQS_LOCAL_QUEUE_DIRECTORY=directory):
+            SQSHandler('TEST_QUEUE').send_message({'payment_ref': 'MO1'})
+
+        with open(os.path.join(directory, 'TEST_QUEUE.jsonl')) as queue_file:
+            self.assertEqual(queue_file.read(), json.dumps({'payment_ref': 'MO1'}) + '\n')
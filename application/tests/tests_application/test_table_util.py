@@ -0,0 +1,66 @@
+"""
+Unit tests for the summary table helpers
+"""
+
+from uuid import uuid4
+
+from django.test import TestCase, tag
+
+from ...models import ArcComments
+from ...table_util import ArcCommentIndex, Table, Row, create_tables
+
+
+@tag('unit')
+class TableUtilTests(TestCase):
+
+    def setUp(self):
+        self.first_table_pk = uuid4()
+        self.second_table_pk = uuid4()
+        ArcComments.objects.create(table_pk=self.first_table_pk, table_name='APPLICANT_NAME',
+                                   field_name='first_name', comment='Name is misspelt', flagged=True)
+        ArcComments.objects.create(table_pk=self.second_table_pk, table_name='APPLICANT_NAME',
+                                   field_name='last_name', comment='Previously flagged', flagged=False)
+
+    def test_index_returns_flagged_comment(self):
+        index = ArcCommentIndex([self.first_table_pk, self.second_table_pk])
+
+        self.assertEqual('Name is misspelt', index.get_comment(self.first_table_pk, 'first_name'))
+        self.assertEqual('Name is misspelt', index.get_comment(str(self.first_table_pk), 'first_name'))
+
+    def test_index_ignores_unflagged_comment(self):
+        index = ArcCommentIndex([self.first_table_pk, self.second_table_pk])
+
+        self.assertIsNone(index.get_comment(self.second_table_pk, 'last_name'))
+        self.assertIsNone(index.get_comment(self.first_table_pk, 'last_name'))
+
+    def test_create_tables_resolves_errors_with_a_single_query(self):
+        tables = [
+            {
+                'table_object': Table([self.first_table_pk]),
+                'fields': {'first_name': 'Jon', 'last_name': 'Smith'},
+                'title': 'Your name',
+                'error_summary_title': 'There was a problem with your name',
+            },
+            {
+                'table_object': Table([self.second_table_pk]),
+                'fields': {'first_name': 'Ann', 'last_name': 'Jones'},
+                'title': 'Their name',
+                'error_summary_title': 'There was a problem with their name',
+            },
+        ]
+        name_dict = {'first_name': 'First name', 'last_name': 'Last name'}
+        link_dict = {'first_name': 'Personal-Details-Name-View', 'last_name': 'Personal-Details-Name-View'}
+
+        with self.assertNumQueries(1):
+            table_list = create_tables(tables, name_dict, link_dict)
+
+        self.assertEqual(1, table_list[0].get_error_amount())
+        self.assertEqual(0, table_list[1].get_error_amount())
+
+    def test_get_errors_builds_its_own_index(self):
+        table = Table([self.first_table_pk])
+        table.add_row(Row('first_name', 'First name', 'Jon', 'Personal-Details-Name-View', ''))
+
+        table.get_errors()
+
+        self.assertEqual('Name is misspelt', table.get_row_list()[0].error)
@@ -0,0 +1,94 @@
+"""
+Unit tests for the timelog signals recording changes made to returned applications
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, tag
+from timeline_logger.models import TimelineLog
+
+from .. import utils
+from ...models import ApplicantName, ApplicantPersonalDetails, Application
+
+
+@tag('unit')
+class TimelogSignalTests(TestCase):
+
+    def setUp(self):
+        self.application = utils.make_test_application()
+        # The content type is cached for the life of the process
+        ContentType.objects.get_for_model(Application)
+
+    def return_application(self):
+        Application.objects.filter(pk=self.application.pk).update(application_status='FURTHER_INFORMATION')
+
+    def logged_fields(self):
+        return sorted(log.extra_data['field'] for log in TimelineLog.objects.filter(
+            object_id=str(self.application.pk), extra_data__contains={'action': 'updated'}))
+
+    def test_unchanged_save_issues_no_further_queries(self):
+        name = ApplicantName.objects.get(application_id=self.application)
+
+        with self.assertNumQueries(1):
+            name.save()
+
+    def test_changes_are_not_logged_unless_application_returned(self):
+        name = ApplicantName.objects.get(application_id=self.application)
+        name.first_name = 'Sherlock'
+
+        # The update, and the application's status
+        with self.assertNumQueries(2):
+            name.save()
+
+        self.assertEqual(self.logged_fields(), [])
+
+    def test_changes_to_returned_application_are_logged_in_one_insert(self):
+        self.return_application()
+        name = ApplicantName.objects.get(application_id=self.application)
+        name.first_name = 'Sherlock'
+        name.last_name = 'Holmes'
+
+        # The update, the application's status and the insert of both log entries
+        with self.assertNumQueries(3):
+            name.save()
+
+        self.assertEqual(self.logged_fields(), ['first_name', 'last_name'])
+
+    def test_loaded_application_is_reused(self):
+        self.return_application()
+        name = ApplicantName.objects.select_related('application_id').get(application_id=self.application)
+        name.first_name = 'Sherlock'
+
+        with self.assertNumQueries(2):
+            name.save()
+
+        self.assertEqual(self.logged_fields(), ['first_name'])
+
+    def test_each_change_is_only_logged_once(self):
+        self.return_application()
+        name = ApplicantName.objects.get(application_id=self.application)
+        name.first_name = 'Sherlock'
+        name.save()
+        name.save()
+
+        self.assertEqual(self.logged_fields(), ['first_name'])
+
+    def test_values_equal_once_saved_are_not_logged(self):
+        self.return_application()
+        details = ApplicantPersonalDetails.objects.get(application_id=self.application)
+        details.birth_day = 1
+        details.save()
+        details.birth_day = '1'
+        details.save()
+
+        self.assertEqual(self.logged_fields(), ['birth_day'])
+
+    def test_deferred_fields_are_not_loaded(self):
+        with self.assertNumQueries(1):
+            name = ApplicantName.objects.only('name_id', 'application_id').get(application_id=self.application)
+        self.return_application()
+
+        name.first_name = 'Sherlock'
+        name.middle_names = ''
+        name.save()
+
+        self.assertEqual(self.logged_fields(), ['first_name'])
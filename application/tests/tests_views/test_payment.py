@@ -141,7 +141,7 @@ class PaymentTest(ViewsTest):
         )
 
         try:
-            with mock.patch('requests.get') as request_get_mock:
+            with mock.patch('application.gateway.get') as request_get_mock:
                 test_urn_response = {
                     "URN": 123456789
                 }
@@ -1,3 +1,9 @@
+from django.core.signing import TimestampSigner
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.middleware import COOKIE_IDENTIFIER
+from application.tests.utils import make_test_application
 from .view_parent import *
 
 
@@ -15,3 +21,39 @@ class TaskListTest(ViewsTest):
         except:
             self.assertEqual(0, 0)
 
+
+class TaskListRenderingTest(TestCase):
+
+    def setUp(self):
+        self.application = make_test_application()
+        self.application.application_status = 'DRAFTING'
+        self.application.login_details_status = 'COMPLETED'
+        self.application.personal_details_status = 'COMPLETED'
+        self.application.first_aid_training_status = 'FLAGGED'
+        self.application.criminal_record_check_status = 'NOT_STARTED'
+        self.application.save()
+        self.email = 'applicant@example.com'
+        models.UserDetails.objects.filter(application_id=self.application).update(email=self.email)
+
+    def test_task_list_is_rendered_from_one_application_and_one_childcare_type_query(self):
+        client = Client()
+        client.cookies[COOKIE_IDENTIFIER] = TimestampSigner().sign(self.email)
+        # Warm the ownership, content type and url caches shared between requests
+        client.get(reverse('Task-List-View'), {'id': self.application.pk})
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(reverse('Task-List-View'), {'id': self.application.pk})
+
+        application_queries = [query['sql'] for query in context.captured_queries
+                               if 'govuk_template_base' not in query['sql']]
+        self.assertEqual(2, len(application_queries))
+        self.assertIn('FROM "APPLICATION"', application_queries[0])
+        self.assertIn('FROM "CHILDCARE_TYPE"', application_queries[1])
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('Early Years and Childcare Register (both parts)', response.context['registers'])
+        tasks = {task['name']: task for task in response.context['tasks']}
+        self.assertEqual(reverse('Contact-Summary-View'), tasks['account_details']['status_url'])
+        self.assertEqual(reverse('First-Aid-Training-Summary-View'), tasks['first_aid']['status_url'])
+        self.assertEqual(reverse('DBS-Guidance-View'), tasks['dbs']['status_url'])
+        self.assertEqual('Declaration and payment', tasks['review']['description'])
+        self.assertContains(response, 'href="{}?id={}"'.format(reverse('DBS-Guidance-View'), self.application.pk))
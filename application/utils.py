@@ -7,13 +7,15 @@ OFS-MORE-CCN3: Apply to be a Childminder Beta
 import json
 from urllib.parse import urlencode
 
-import requests
 import logging
 from django.conf import settings
 from django.shortcuts import render
 from django.utils.http import urlencode
 from django.core.urlresolvers import reverse
 
+from . import gateway
+from .notify_monitor import notify_monitor
+
 from .models import Application, Reference, CriminalRecordCheck, ChildcareTraining, HealthDeclarationBooklet, \
     ChildInHome, \
     ChildcareType, FirstAidTraining, ApplicantPersonalDetails, ApplicantName, ApplicantHomeAddress, AdultInHome, \
@@ -66,10 +68,8 @@ def test_notify():
     if settings.EXECUTING_AS_TEST:
         return True
 
-    if test_notify_connection():
-        return True
-    else:
-        return False
+    # Consult the state cached by the background health monitor rather than probing the notify API on every call
+    return notify_monitor.is_available()
 
 
 def test_notify_settings():
@@ -92,7 +92,6 @@ def test_notify_connection():
     try:
         # Test Sending Email
         header = {'content-type': 'application/json'}
-        req = requests.Session()
         notification_request = {
             'email': 'simulate-delivered@notifications.service.gov.uk',
             'personalisation': {
@@ -100,9 +99,9 @@ def test_notify_connection():
             },
             'templateId': 'ecd2a788-257b-4bb9-8784-5aed82bcbb92'
         }
-        r = req.post(settings.NOTIFY_URL + '/api/v1/notifications/email/',
-                     json.dumps(notification_request),
-                     headers=header, timeout=10)
+        r = gateway.post(settings.NOTIFY_URL + '/api/v1/notifications/email/',
+                         json.dumps(notification_request),
+                         headers=header, timeout=settings.NOTIFY_HTTP_REQUEST_TIMEOUT)
         if r.status_code == 201:
             return True
     except Exception as ex:
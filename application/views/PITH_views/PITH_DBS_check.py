@@ -3,7 +3,8 @@ import collections
 
 from django.http import HttpResponseRedirect
 
-from application.models import AdultInHome
+from application import dbs
+from application.models import AdultInHome, CriminalRecordCheck
 from application.forms.PITH_forms.PITH_DBS_check_form import PITHDBSCheckForm
 from application.utils import get_id
 from application.views.PITH_views.base_views.PITH_multi_form_view import PITHMultiFormView
@@ -52,6 +53,13 @@ class PITHDBSCheckView(PITHMultiFormView):
         return sorted_form_list
 
     def validate_form_list(self, form_list):
+        # Look up every adult's certificate at once, so that each form's validation reads its record from the cache
+        # rather than the forms calling the DBS api one after another. Numbers the forms will reject are skipped.
+        childminder_dbs_certificate_number = CriminalRecordCheck.objects.filter(
+            application_id=get_id(self.request)).values_list('dbs_certificate_number', flat=True).first()
+        dbs.read_many(number for number in (form.data.get(form.dbs_field_name, '') for form in form_list)
+                      if len(number) == 12 and number.isdigit() and number != childminder_dbs_certificate_number)
+
         if not super().validate_form_list(form_list):
             return False
         # validation of individual forms is done in the form objects themselves. This extra step checks the forms
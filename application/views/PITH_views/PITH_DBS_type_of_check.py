@@ -118,5 +118,4 @@ class PITHDBSTypeOfCheckView(PITHMultiRadioView):
         return filtered
 
     def update_adult_in_home_fields(self, adult_id, enhanced_check_value, on_update_value):
-        update_adult_in_home(adult_id, 'enhanced_check', enhanced_check_value)
-        update_adult_in_home(adult_id, 'on_update', on_update_value)
+        update_adult_in_home(adult_id, {'enhanced_check': enhanced_check_value, 'on_update': on_update_value})
@@ -4,8 +4,9 @@ from django.http import HttpResponseRedirect
 
 from application.views.PITH_views.your_adults import get_first_adult_number_for_address_entry
 from application.utils import build_url, get_id
+from application.application_loader import load_application
 from application.models import AdultInHome, AdultInHomeAddress, ApplicantHomeAddress, ApplicantPersonalDetails, \
-    Application, ChildAddress
+    ChildAddress
 from application.views.PITH_views.base_views.PITH_multi_radio_view import PITHMultiRadioView
 from application.forms.PITH_forms.PITH_address_check import PITHAddressDetailsCheckForm
 
@@ -129,8 +130,7 @@ class PITHAdultAddressCheckView(PITHMultiRadioView):
                                                              moved_in_year=moved_in_year,
                                                              adult_in_home_address=None,
                                                              adult_id=AdultInHome.objects.get(adult_id=adult_id),
-                                                             application_id=Application.objects.get(application_id=
-                                                                                                    application_id)
+                                                             application_id=load_application(application_id)
                                                              )
                     pith_address_record.save()
                 else:
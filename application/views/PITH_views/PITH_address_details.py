@@ -5,6 +5,7 @@ from django.shortcuts import render
 
 from application import status
 from application.forms.PITH_forms import PITHAddressForm
+from application.application_loader import load_application
 from application.models import AdultInHome, Application, AdultInHomeAddress
 from application.utils import get_id, build_url
 
@@ -87,7 +88,7 @@ def __PITH_address_lookup_post_handler(request, template, success_url):
 
     form = PITHAddressForm(request.POST, id=application_id, adult=adult, adult_record=adult_record)
 
-    application = Application.objects.get(application_id=application_id)
+    application = load_application(application_id)
 
     adult_id = adult_record.adult_id
     if 'postcode-search' in request.POST:
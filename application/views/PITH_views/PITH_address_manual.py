@@ -6,7 +6,8 @@ from django.utils import timezone
 from application import status
 from application.business_logic import PITH_address_logic, reset_declaration
 from application.forms.PITH_forms import PITHManualAddressForm
-from application.models import Application, AdultInHome, AdultInHomeAddress
+from application.application_loader import load_application
+from application.models import AdultInHome, AdultInHomeAddress
 from application.utils import build_url, get_id
 from application.views.PITH_views.your_adults import __get_next_adult_number_for_address_entry
 
@@ -53,7 +54,7 @@ def __PITH_address_manual_get_handler(request, template):
                  + str(application_id) + " and adult number: " + str(adult))
 
     adult_record = AdultInHome.objects.get(application_id=application_id, adult=adult)
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
     form = PITHManualAddressForm(id=application_id, adult=adult, adult_record=adult_record)
     form.check_flag()
 
@@ -88,7 +89,7 @@ def __PITH_address_manual_post_handler(request, template, success_url, address_u
     logger.debug('Saving manual adult address details for application with id: '
                  + str(application_id) + " and adult number: " + str(adult))
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
     adult_record = AdultInHome.objects.get(application_id=application_id, adult=adult)
     adult_name = '{0}{1} {2}'.format(adult_record.first_name, " " + adult_record.middle_names if
     adult_record.middle_names else "", adult_record.last_name)
@@ -100,7 +101,7 @@ def __PITH_address_manual_post_handler(request, template, success_url, address_u
 
         logger.debug('Form is valid')
 
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
         adult_address_record = PITH_address_logic(application_id, adult_record, form)
         adult_address_record.save()
 
@@ -7,7 +7,8 @@ from django.http import HttpResponseRedirect
 from django.shortcuts import reverse
 
 from application.forms.PITH_forms.PITH_check_your_answers_form import PITHCheckYourAnswersForm
-from application.models import AdultInHome, Application, ChildInHome, Child, ChildcareType, ApplicantHomeAddress, \
+from application.application_loader import load_application
+from application.models import AdultInHome, ChildInHome, Child, ChildcareType, ApplicantHomeAddress, \
     ApplicantPersonalDetails, AdultInHomeAddress
 from application.summary_page_data import (
     other_child_name_dict, other_child_link_dict,
@@ -93,7 +94,7 @@ class PITHCheckYourAnswersView(PITHTemplateView):
     def post(self, request, *args, **kwargs):
         # TODO: Refactor me!
         application_id_local = request.POST["id"]
-        application = Application.objects.get(application_id=application_id_local)
+        application = load_application(application_id_local)
 
         # If reaching the summary page for the first time
         if application.people_in_home_status == 'IN_PROGRESS' or application.people_in_home_status == 'WAITING':
@@ -16,7 +16,8 @@ from application.business_logic import (
     awaiting_pith_dbs_action_from_user,
 )
 from application.forms import OtherPeopleChildrenDetailsForm
-from application.models import Application, ApplicantHomeAddress, AdultInHome
+from application.application_loader import load_application
+from application.models import ApplicantHomeAddress, AdultInHome
 
 # Initiate logging
 log = logging.getLogger('')
@@ -30,7 +31,7 @@ class PITHChildrenDetailsView(View):
     def get(self, request):
 
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         number_of_children = int(request.GET["children"])
         remove_person = int(request.GET["remove"])
@@ -80,7 +81,7 @@ class PITHChildrenDetailsView(View):
 
         current_date = timezone.now()
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         number_of_children = int(request.POST["children"])
         remove_button = True
@@ -100,14 +100,17 @@ class PITHOwnChildrenCheckView(PITHRadioView):
         application_id = get_id(self.request)
         people_in_home_status = get_application(application_id, 'people_in_home_status')
 
-        if people_in_home_status not in ['COMPLETED', 'WAITING']:
-            update_application(app_id, 'people_in_home_status', 'IN_PROGRESS')
-
         update_bool = self.request.POST.get(self.application_known_field) == 'True'
-        update_application(app_id, self.application_known_field, update_bool)
-
         application_reasons_known = self.request.POST.get(self.application_reasons_known_field)
-        update_application(app_id, self.application_reasons_known_field, application_reasons_known)
+        values = {
+            self.application_known_field: update_bool,
+            self.application_reasons_known_field: application_reasons_known,
+        }
+
+        if people_in_home_status not in ['COMPLETED', 'WAITING']:
+            values['people_in_home_status'] = 'IN_PROGRESS'
+
+        update_application(app_id, values)
 
     def get_awaiting_user_pith_dbs_action(self, application_id):
 
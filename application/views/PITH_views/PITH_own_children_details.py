@@ -14,7 +14,8 @@ from application.business_logic import (
     reset_declaration,
 )
 from application.forms.PITH_forms.PITH_own_children_details_form import PITHOwnChildrenDetailsForm
-from application.models import Application, ApplicantHomeAddress, AdultInHome
+from application.application_loader import load_application
+from application.models import ApplicantHomeAddress, AdultInHome
 from application.utils import build_url
 
 # Initiate logging
@@ -29,7 +30,7 @@ class PITHOwnChildrenDetailsView(View):
     def get(self, request):
 
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         number_of_children = int(request.GET["children"])
         remove_person = int(request.GET["remove"])
@@ -81,7 +82,7 @@ class PITHOwnChildrenDetailsView(View):
 
         current_date = timezone.now()
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         number_of_children = int(request.POST["children"])
         remove_button = True
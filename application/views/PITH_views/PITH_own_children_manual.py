@@ -6,7 +6,8 @@ from django.utils import timezone
 from application import status
 from application.business_logic import child_address_logic, reset_declaration
 from application.forms import YourChildManualAddressForm, Child
-from application.models import Application, AdultInHome
+from application.application_loader import load_application
+from application.models import AdultInHome
 from application.utils import build_url, get_id
 from application.views.your_children import __remove_arc_address_flag, __get_next_child_number_for_address_entry
 
@@ -53,7 +54,7 @@ def __own_children_address_manual_get_handler(request, template):
                  + str(application_id) + " and child number: " + str(child))
 
     child_record = Child.objects.get(application_id=application_id, child=child)
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
     form = YourChildManualAddressForm(id=application_id, child=child)
     form.check_flag()
 
@@ -88,7 +89,7 @@ def __own_children_address_manual_post_handler(request, template, success_url, a
     logger.debug('Saving manual child address details for application with id: '
                  + str(application_id) + " and child number: " + str(child))
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
 
     form = YourChildManualAddressForm(request.POST, id=application_id, child=child)
     form.remove_flag()
@@ -99,7 +100,7 @@ def __own_children_address_manual_post_handler(request, template, success_url, a
 
         child_address_record = child_address_logic(application_id, child, form)
         child_address_record.save()
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
         application.date_updated = current_date
         application.save()
 
@@ -5,6 +5,7 @@ from django.shortcuts import render
 
 from application import status
 from application.forms import ChildAddressForm
+from application.application_loader import load_application
 from application.models import Child, Application, ChildAddress
 from application.utils import get_id, build_url
 
@@ -83,7 +84,7 @@ def __own_children_address_lookup_post_handler(request, template, success_url):
 
     form = ChildAddressForm(request.POST, id=application_id, child=child)
 
-    application = Application.objects.get(application_id=application_id)
+    application = load_application(application_id)
 
     if 'postcode-search' in request.POST:
 
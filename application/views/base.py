@@ -11,7 +11,7 @@ from django.conf import settings
 from django.shortcuts import render
 
 from .. import status
-from ..models import Application
+from ..application_loader import load_application
 
 # initiate logging
 log = logging.getLogger('django.server')
@@ -54,7 +54,7 @@ def awaiting_review(request):
     :return: an HttpResponse object with the rendered awaiting review saved template
     """
     application_id_local = request.GET["id"]
-    application = Application.objects.get(application_id=application_id_local)
+    application = load_application(application_id_local)
     if 'resubmitted' in request.GET.keys():
         resubmitted = request.GET["resubmitted"]
     else:
@@ -77,7 +77,7 @@ def application_accepted(request):
     :return: an HttpResponse object with the rendered application submitted saved template
     """
     application_id_local = request.GET["id"]
-    application = Application.objects.get(application_id=application_id_local)
+    application = load_application(application_id_local)
     variables = {
         'application_id': application_id_local,
         'id': application_id_local,
@@ -2,6 +2,7 @@ from django.http import HttpResponseRedirect
 from django.shortcuts import render
 from django.urls import reverse
 
+from application.application_loader import load_application
 from application.models import Application
 
 
@@ -93,4 +94,4 @@ def delete_app(app_id):
     :return: None.
     """
     if Application.objects.filter(application_id=app_id).exists():
-        Application.objects.get(application_id=app_id).delete()
+        load_application(app_id).delete()
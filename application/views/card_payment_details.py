@@ -4,11 +4,9 @@ Method returning the template for the Card payment details page
 page when successfully completed
 """
 
-import datetime
 import logging
 import re
 import json
-import time
 
 from django.conf import settings
 from django.http import HttpResponseRedirect
@@ -16,17 +14,17 @@ from django.shortcuts import render
 from django.core.urlresolvers import reverse
 from django.views.decorators.cache import never_cache
 
+from .. import payment_reconciliation
 from ..services import payment_service, noo_integration_service
 from ..forms import PaymentDetailsForm
-from ..models import Application, ApplicantName, Payment, ChildcareType
-from ..messaging.sqs_handler import SQSHandler
+from ..application_loader import load_application
+from ..models import Payment, ChildcareType
+from ..payment_status_poller import payment_status_poller
 
 from ..business_logic import get_childcare_register_type
 
 logger = logging.getLogger(__name__)
 
-sqs_handler = SQSHandler(settings.PAYMENT_NOTIFICATIONS_QUEUE_NAME)
-
 
 @never_cache
 def card_payment_details(request):
@@ -48,7 +46,7 @@ def card_payment_get_handler(request):
     :return: A page for capturing card payment details
     """
     app_id = request.GET["id"]
-    application = Application.objects.get(pk=app_id)
+    application = load_application(app_id)
     paid = application.application_reference
     prior_payment_record_exists = Payment.objects.filter(application_id=application).exists()
     childcare_register_type, childcare_register_cost = get_childcare_register_type(app_id)
@@ -107,7 +105,7 @@ def card_payment_post_handler(request):
         }
         return render(request, 'payment-details.html', variables)
 
-    application = Application.objects.get(pk=app_id)
+    application = load_application(app_id)
     childcare_type = ChildcareType.objects.get(application_id=app_id)
     amount = int(childcare_register_cost) * 100  # Payment amount needs to be in pence
 
@@ -199,66 +197,39 @@ def resubmission_handler(request, form, application, amount, childcare_register_
     """
     logger.info('Resubmission handler triggered due to multiple payment requests')
 
-    # All logic below acts as a handler for page re-submissions
-    time.sleep(int(settings.PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS))
-
     prior_payment_record_exists = Payment.objects.filter(application_id=application).exists()
     if prior_payment_record_exists:
         payment = Payment.objects.get(application_id=application)
         if payment.payment_reference is not None and payment.payment_reference != "PENDING":
             # Check at this point whether Worldpay has marked the payment as authorised
-            payment_status_response_raw = payment_service.check_payment(payment.payment_reference)
+            outcome = payment_reconciliation.check_payment_status(payment.payment_reference)
 
             # If no record of the payment could be found, yield error
-            if payment_status_response_raw.status_code == 404:
+            if outcome == payment_reconciliation.NOT_FOUND:
                 logger.info('Worldpay payment record does not exist for application ' + str(application.application_id))
                 # If payment record was rolled back then payment has not successfully been taken
                 return __yield_general_processing_error_to_user(request, form, application.application_id,
                                                                     childcare_register_cost)
 
-            # Deserialize Payment Gateway API response
-            parsed_payment_response = json.loads(payment_status_response_raw.text)
-
-            if parsed_payment_response.get('lastEvent') == "AUTHORISED":
+            if outcome == payment_reconciliation.AUTHORISED:
                 # If payment has been marked as a AUTHORISED by Worldpay then payment has been captured
                 # meaning user can be safely progressed to confirmation page
                 return __handle_authorised_payment(application, amount)
-            if parsed_payment_response.get('lastEvent') == "REFUSED":
+            if outcome == payment_reconciliation.REFUSED:
                 # If payment has been marked as a REFUSED by Worldpay then payment has
                 # been attempted but was not successful in which case a new order should be attempted.
                 __rollback_payment_submission_status(application)
                 return __yield_general_processing_error_to_user(request, form, application.application_id,
                                                                 childcare_register_cost)
-            if parsed_payment_response.get('lastEvent') == "ERROR":
+            if outcome == payment_reconciliation.ERROR:
                 return __yield_general_processing_error_to_user(request, form, application.application_id,
                                                                 childcare_register_cost)
-            else:
-                if 'processing_attempts' in request.META:
-                    processing_attempts = int(request.META.get('processing_attempts'))
-
-                    # If 3 attempts to process the payment have already been made without success
-                    # yield error to user
-                    if processing_attempts >= settings.PAYMENT_PROCESSING_ATTEMPTS:
-                        form.add_error(None, 'There has been a problem when trying to process your payment. '
-                                             'Please contact Ofsted for assistance.',)
-                        form.error_summary_template_name = 'error-summary.html'
-
-                        variables = {
-                            'form': form,
-                            'application_id': application.application_id,
-                            'cost': childcare_register_cost
-                        }
-
-                        return HttpResponseRedirect(
-                            reverse('Payment-Details-View') + '?id=' + application.application_id, variables)
-
-                    # Otherwise increment processing attempt count
-                    request.META['processing_attempts'] = processing_attempts + 1
-                else:
-                    request.META['processing_attempts'] = 1
-
-                # Retry processing of payment
-                return resubmission_handler(request, form, application, amount, childcare_register_cost)
+
+            # Otherwise the payment is still being processed by Worldpay, so its status is checked in the background
+            # while the applicant waits on the processing page
+            payment_status_poller.poll(application.application_id)
+            return HttpResponseRedirect(
+                reverse('Payment-Processing-View') + '?id=' + str(application.application_id))
 
         else:
             # No payment reference exists - clear the payment record so that applicant can try again
@@ -272,6 +243,57 @@ def resubmission_handler(request, form, application, amount, childcare_register_
                                                  childcare_register_cost)
 
 
+@never_cache
+def card_payment_processing(request):
+    """
+    Method returning the template for the payment processing page, shown while the status of a payment which Worldpay
+    has not yet authorised or refused is checked in the background. The page refreshes itself until the payment has
+    been finalised or rolled back, reading the outcome from the payment record rather than querying Worldpay.
+    :param request: a request object used to generate the HttpResponse
+    :return: an HttpResponse object with the rendered payment processing template, or a redirect once the payment
+    has been processed
+    """
+    app_id = request.GET["id"]
+    attempt = int(request.GET.get('attempt', 0))
+    application = load_application(app_id)
+    payment_record = Payment.objects.filter(application_id=application).first()
+
+    if payment_record is not None and payment_record.payment_authorised:
+        return __redirect_to_payment_confirmation(app_id)
+
+    childcare_register_type, childcare_register_cost = get_childcare_register_type(app_id)
+    form = PaymentDetailsForm()
+    # The form is not bound to any card details, so there is no cleaned data for errors to be added against
+    form.cleaned_data = {}
+
+    # The payment was refused and rolled back
+    if payment_record is None:
+        return __yield_general_processing_error_to_user(request, form, app_id, childcare_register_cost)
+
+    # If the payment has still not been processed after every refresh, yield error to user
+    if attempt >= int(settings.PAYMENT_PROCESSING_ATTEMPTS):
+        form.add_error(None, 'There has been a problem when trying to process your payment. '
+                             'Please contact Ofsted for assistance.')
+        form.error_summary_template_name = 'error-summary.html'
+
+        variables = {
+            'form': form,
+            'application_id': app_id,
+            'cost': childcare_register_cost
+        }
+        return render(request, 'payment-details.html', variables)
+
+    # Resumes checking the payment if this process was not already doing so
+    payment_status_poller.poll(app_id)
+
+    variables = {
+        'application_id': app_id,
+        'refresh_interval': int(settings.PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS),
+        'refresh_url': reverse('Payment-Processing-View') + '?id=' + str(app_id) + '&attempt=' + str(attempt + 1),
+    }
+    return render(request, 'payment-processing.html', variables)
+
+
 def __assign_application_reference(application):
     """
     Private helper function for assigning an application reference number if one has not already allocated
@@ -330,23 +352,11 @@ def __create_payment_record(application):
 
 def __handle_authorised_payment(application, amount):
     """
-    Private helper function for managing a rejected payment
+    Private helper function for managing an authorised payment
     :param application: application associated with the payment attempting to be made
     :return: redirect to payment confirmation page
     """
-
-    # Update payment record to finalise approval of payment
-    __mark_payment_record_as_authorised(application)
-
-    # Transition application to submitted
-    logger.info('Assigning submitted date for application with id: ' + str(application.application_id))
-    application.date_submitted = datetime.datetime.today()
-    application.save()
-
-    # Send ad-hoc payment to NOO
-    app_cost_float = float(amount / 100)
-    msg_body = __build_message_body(application, format(app_cost_float, '.4f'))
-    sqs_handler.send_message(msg_body)
+    payment_reconciliation.finalise_authorised_payment(application, amount)
 
     return __redirect_to_payment_confirmation(application.application_id)
 
@@ -362,17 +372,6 @@ def __mark_payment_record_as_submitted(application):
     payment_record.save()
 
 
-def __mark_payment_record_as_authorised(application):
-    """
-    Private helper function for marking a payment as processed by Worldpay
-    :param application: the application for which a payment record is to be marked as authorised
-    """
-    logger.info('Marking payment as AUTHORISED for application with id: ' + str(application.application_id))
-    payment_record = Payment.objects.get(application_id=application.application_id)
-    payment_record.payment_authorised = True
-    payment_record.save()
-
-
 def __yield_general_processing_error_to_user(request, form, app_id, childcare_register_cost):
     """
     Private helper function to show a non-field relevant error on the payment details page
@@ -403,16 +402,7 @@ def __rollback_payment_submission_status(application):
     Method for rolling back a payment submission if card details have been declined
     :param application: the application for which a payment is to be rolled back
     """
-    logger.info('Rolling payment back for application with id: '
-                + str(application.application_id))
-
-    if Payment.objects.filter(application_id=application).exists():
-        payment_record = Payment.objects.get(application_id=application.application_id)
-        if not payment_record.payment_authorised:
-            # Only delete the record if the payment is not authorised
-            payment_record.delete()
-        else:
-            logger.info('Rollback cancelled - payment has already been authorised')
+    payment_reconciliation.rollback_payment_submission_status(application)
 
 
 def __redirect_to_payment_confirmation(app_id):
@@ -420,37 +410,9 @@ def __redirect_to_payment_confirmation(app_id):
     Private helper function for redirecting to the payment confirmation page
     :return: payment confirmation page redirect
     """
-    application = Application.objects.get(pk=app_id)
+    application = load_application(app_id)
     return HttpResponseRedirect(
         reverse('Payment-Confirmation')
         + '?id=' + str(app_id)
         + '&orderCode=' + application.application_reference
     )
-
-
-def __build_message_body(application, amount):
-    """
-    Helper method to build an SQS request to be picked up by the Integration Adapter component
-    for relay to NOO
-    :param application: the application for which a payment request is to be generated
-    :param amount: the amount that the payment was for
-    :return: an SQS request that can be consumed up by the Integration Adapter component
-    """
-
-    application_reference = application.application_reference
-    applicant_name_obj = ApplicantName.objects.get(application_id=application)
-
-    if len(applicant_name_obj.middle_names):
-        applicant_name = applicant_name_obj.last_name + ',' + applicant_name_obj.first_name + " " + applicant_name_obj.middle_names
-    else:
-        applicant_name = applicant_name_obj.last_name + ',' + applicant_name_obj.first_name
-
-    payment_reference = Payment.objects.get(application_id=application).payment_reference
-
-    return {
-        "payment_action": "SC1",
-        "payment_ref": payment_reference,
-        "payment_amount": amount,
-        "urn": str(settings.PAYMENT_URN_PREFIX) + application_reference,
-        "setting_name": applicant_name
-    }
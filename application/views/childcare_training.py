@@ -12,7 +12,8 @@ from ..business_logic import (childcare_register_type,
                               childcare_training_course_logic,
                               reset_declaration)
 from ..forms import EYFSDetailsForm, TypeOfChildcareTrainingForm
-from ..models import Application, ChildcareTraining
+from ..application_loader import load_application
+from ..models import ChildcareTraining
 
 
 class ChildcareTrainingGuidanceView(View):
@@ -23,7 +24,7 @@ class ChildcareTrainingGuidanceView(View):
 
     def post(self, request):
         application_id = request.GET['id']
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
 
         if application.childcare_training_status != 'COMPLETED':
             status.update(application_id, 'childcare_training_status', 'IN_PROGRESS')
@@ -70,7 +71,7 @@ class ChildcareTrainingDetailsView(FormView):
 
     def form_valid(self, form):
         application_id = self.request.GET['id']
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
 
         if application.childcare_training_status != 'COMPLETED':
             status.update(application_id, 'childcare_training_status', 'IN_PROGRESS')
@@ -108,7 +109,7 @@ class TypeOfChildcareTrainingView(FormView):
 
     def form_valid(self, form):
         application_id = self.request.GET['id']
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
 
         if application.childcare_training_status != 'COMPLETED':
             status.update(application_id, 'childcare_training_status', 'IN_PROGRESS')
@@ -177,13 +178,18 @@ class ChildcareTrainingSummaryView(View):
         return HttpResponseRedirect(reverse(self.success_url) + '?id=' + application_id)
 
     @staticmethod
-    def get_context_data(application_id):  # Static method for use in Master-Summary-View.
+    def get_context_data(application_id, childcare_training_record=None, childcare_type_record=None):
+        # Static method for use in Master-Summary-View, which passes in the records it has already loaded.
         context = dict()
         context['application_id'] = application_id
         context['page_title'] = 'Check your answers: childcare training'
 
-        register = childcare_register_type(application_id)
-        childcare_training_record = ChildcareTraining.objects.get(application_id=application_id)
+        if childcare_type_record is None:
+            register = childcare_register_type(application_id)
+        else:
+            register = 'early_years_register' if childcare_type_record.zero_to_five else 'childcare_register_only'
+        if childcare_training_record is None:
+            childcare_training_record = ChildcareTraining.objects.get(application_id=application_id)
 
         if register == 'childcare_register_only':
             context['table_list'] = ChildcareTrainingSummaryView.childcare_register_table_list(childcare_training_record)
@@ -16,6 +16,7 @@ from .. import status
 from ..business_logic import reset_declaration, childcare_type_logic, get_childcare_register_type, childcare_timing_logic
 from ..forms import TypeOfChildcareGuidanceForm, TypeOfChildcareAgeGroupsForm, TypeOfChildcareRegisterForm, \
     TypeOfChildcareOvernightCareForm, TypeOfChildcareNumberOfPlacesForm, TimingOfChildcareGroupsForm
+from ..application_loader import load_application
 from ..models import Application, ChildcareType
 
 
@@ -409,7 +410,7 @@ def childcare_type_summary(request):
 
         app_id = request.GET["id"]
         childcare_record = ChildcareType.objects.get(application_id=app_id)
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
 
         childcare_age_groups = ''
 
@@ -11,6 +11,7 @@ from ..summary_page_data import contact_info_link_dict, contact_info_name_dict
 from .. import status
 from ..business_logic import reset_declaration, login_contact_logic_add_phone, login_contact_logic_mobile_phone
 from ..forms import ContactAddPhoneForm, ContactMobilePhoneForm, ContactSummaryForm
+from ..application_loader import load_application
 from ..models import Application, UserDetails
 
 
@@ -113,7 +114,7 @@ def contact_summary(request):
     if request.method == 'GET':
 
         app_id = request.GET["id"]
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
         user_details = UserDetails.objects.get(application_id=app_id)
         email = user_details.email
         mobile_number = user_details.mobile_number
@@ -162,7 +163,7 @@ def contact_summary(request):
     if request.method == 'POST':
 
         app_id = request.POST["id"]
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
 
         status.update(app_id, 'login_details_status', 'COMPLETED')
 
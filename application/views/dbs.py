@@ -16,8 +16,8 @@ from ..forms import (DBSLivedAbroadForm,
                      DBSCheckCapitaForm,
                      DBSCheckNoCapitaForm,
                      DBSUpdateForm)
-from ..models import (Application,
-                      CriminalRecordCheck)
+from ..application_loader import load_application
+from ..models import CriminalRecordCheck
 from ..table_util import Table, Row
 from ..utils import build_url, get_id
 
@@ -151,7 +151,7 @@ class DBSRadioView(FormView):
 
     def get_context_data(self, **kwargs):
         application_id = get_id(self.request)
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
         form = self.get_form()
 
         if application.application_status == 'FURTHER_INFORMATION':
@@ -175,7 +175,7 @@ class DBSRadioView(FormView):
 
     def form_valid(self, form):
         application_id = get_id(self.request)
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
 
         # Update task status if flagged or completed (criminal_record_check_status)
         dbs_task_status = application.criminal_record_check_status
@@ -288,8 +288,9 @@ class DBSSummaryView(DBSTemplateView):
         return super().post(request, *args, **kwargs)
 
     @staticmethod
-    def get_table_object(app_id):
-        criminal_record_check_record = CriminalRecordCheck.objects.get(application_id=app_id)
+    def get_table_object(app_id, criminal_record_check_record=None):
+        if criminal_record_check_record is None:
+            criminal_record_check_record = CriminalRecordCheck.objects.get(application_id=app_id)
         criminal_record_id = criminal_record_check_record.pk
 
         # childcare_training_row = Row('childcare_training', 'What type of childcare course have you completed?', row_value, 'Type-Of-Childcare-Training', None)
@@ -310,11 +311,12 @@ class DBSSummaryView(DBSTemplateView):
                     dbs_certificate_number_row,
                     on_update_row]
 
-        non_empty_row_list = [row for row in row_list if get_criminal_record_check(app_id, row['field']) is not None]
+        non_empty_row_list = [row for row in row_list
+                              if getattr(criminal_record_check_record, row['field']) is not None]
 
         Row_Obj_row_list = [Row(row['field'],
                                 row['title'],
-                                get_criminal_record_check(app_id, row['field']),
+                                getattr(criminal_record_check_record, row['field']),
                                 row['url']
                                 , '',
                                 change_link_description=row['alt_text'])
@@ -328,8 +330,8 @@ class DBSSummaryView(DBSTemplateView):
         return criminal_record_check_summary_table
 
     @staticmethod
-    def get_context_data_static(app_id):
-        return DBSSummaryView.get_table_object(app_id)
+    def get_context_data_static(app_id, criminal_record_check_record=None):
+        return DBSSummaryView.get_table_object(app_id, criminal_record_check_record)
 
 
 class DBSUpdateView(DBSRadioView):
@@ -350,7 +352,7 @@ class DBSTypeView(DBSRadioView):
 
     def form_valid(self, form):
         application_id = get_id(self.request)
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
 
         initial_bool = form.initial[self.dbs_field_name]
         update_bool = form.cleaned_data[self.dbs_field_name] == 'True'
@@ -392,7 +394,7 @@ class DBSLivedAbroadView(DBSRadioView):
 
     def get(self, request, *args, **kwargs):
         application_id = get_id(self.request)
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
 
         # Re-route depending on task status (criminal_record_check_status)
         dbs_task_status = application.criminal_record_check_status
@@ -463,30 +465,35 @@ class DBSCheckNoCapitaView(DBSCheckDetailsView):
             issue_date = datetime.strptime(record['date_of_issue'], "%Y-%m-%d")
             info = record['certificate_information']
 
-            update_criminal_record_check(application_id, 'capita', True)
-            update_criminal_record_check(application_id, 'certificate_information', info)
-
-            # Nullify fields on the capita = False route
-            update_criminal_record_check(application_id, 'enhanced_check', None)
-            update_criminal_record_check(application_id, 'on_update', None)
+            values = {
+                'capita': True,
+                'certificate_information': info,
+                # Nullify fields on the capita = False route
+                'enhanced_check': None,
+                'on_update': None,
+            }
 
             if date_issued_within_three_months(issue_date):
-                update_criminal_record_check(application_id, 'within_three_months', True)
+                values['within_three_months'] = True
                 if not info in NO_ADDITIONAL_CERTIFICATE_INFORMATION:
                     redirect_url = capita_info
                 else:
                     redirect_url = capita_no_info
             else:
-                update_criminal_record_check(application_id, 'within_three_months', False)
+                values['within_three_months'] = False
                 redirect_url = capita_old
         else:
-            update_criminal_record_check(application_id, 'capita', False)
             redirect_url = no_capita
 
-            # Nullify fields on the capita = True route
-            update_criminal_record_check(application_id, 'within_three_months', None)
-            update_criminal_record_check(application_id, 'certificate_information', "")
+            values = {
+                'capita': False,
+                # Nullify fields on the capita = True route
+                'within_three_months': None,
+                'certificate_information': "",
+            }
 
             # TODO: Currently just redirecting as if not a valid dbs number if DBS API is inaccessible.
 
+        update_criminal_record_check(application_id, values)
+
         return build_url(redirect_url, get={'id': application_id})
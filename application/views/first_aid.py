@@ -19,8 +19,8 @@ from ..forms import (FirstAidTrainingDeclarationForm,
                      FirstAidTrainingRenewForm,
                      FirstAidTrainingSummaryForm,
                      FirstAidTrainingTrainingForm)
-from ..models import (Application,
-                      FirstAidTraining)
+from ..application_loader import load_application
+from ..models import FirstAidTraining
 
 
 def first_aid_training_guidance(request):
@@ -34,7 +34,7 @@ def first_aid_training_guidance(request):
         application_id_local = request.GET["id"]
         form = FirstAidTrainingGuidanceForm()
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -46,7 +46,7 @@ def first_aid_training_guidance(request):
         application_id_local = request.POST["id"]
         form = FirstAidTrainingGuidanceForm(request.POST)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             if application.first_aid_training_status != 'COMPLETED':
                 status.update(application_id_local, 'first_aid_training_status', 'IN_PROGRESS')
@@ -75,7 +75,7 @@ def first_aid_training_details(request):
         application_id_local = request.GET["id"]
         form = FirstAidTrainingDetailsForm(id=application_id_local)
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
             form.error_summary_title = 'There was a problem'
@@ -94,7 +94,7 @@ def first_aid_training_details(request):
         status.update(application_id_local, 'first_aid_training_status', 'IN_PROGRESS')
         form = FirstAidTrainingDetailsForm(request.POST, id=application_id_local)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if form.is_valid():
             # Calculate certificate age and determine which page to navigate to.
@@ -145,7 +145,7 @@ def first_aid_training_declaration(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = FirstAidTrainingDeclarationForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -179,7 +179,7 @@ def first_aid_training_renew(request):
         application_id_local = request.GET["id"]
         form = FirstAidTrainingRenewForm()
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -211,7 +211,7 @@ def first_aid_training_training(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = FirstAidTrainingTrainingForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -244,7 +244,7 @@ def first_aid_training_summary(request):
         first_aid_record = FirstAidTraining.objects.get(
             application_id=application_id_local)
         form = FirstAidTrainingSummaryForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         first_aid_fields = collections.OrderedDict([
             ('first_aid_training_organisation', first_aid_record.training_organisation),
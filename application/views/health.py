@@ -9,7 +9,7 @@ from ..business_logic import (health_check_logic,
                               reset_declaration)
 from ..forms import (HealthBookletForm,
                      HealthIntroForm)
-from ..models import (Application)
+from ..application_loader import load_application
 
 
 def health_intro(request):
@@ -22,7 +22,7 @@ def health_intro(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = HealthIntroForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -32,7 +32,7 @@ def health_intro(request):
     if request.method == 'POST':
         application_id_local = request.POST["id"]
         form = HealthIntroForm(request.POST)
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             if application.health_status != 'COMPLETED':
                 status.update(application_id_local, 'health_status', 'IN_PROGRESS')
@@ -57,7 +57,7 @@ def health_booklet(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = HealthBookletForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
@@ -72,7 +72,7 @@ def health_booklet(request):
     if request.method == 'POST':
         application_id_local = request.POST["id"]
         form = HealthBookletForm(request.POST)
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             hdb_record = health_check_logic(application_id_local, form)
             hdb_record.save()
@@ -101,7 +101,7 @@ def health_check_answers(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = HealthBookletForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
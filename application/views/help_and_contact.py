@@ -3,7 +3,7 @@ Method for returning the template for the Help page
 """
 from django.shortcuts import render
 from ..utils import build_url
-from ..models import Application
+from ..application_loader import load_application
 
 
 def help_and_contact(request):
@@ -19,7 +19,7 @@ def help_and_contact(request):
     }
 
     if application_id_local is not None:
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         url_params = {'id': application_id_local, 'get': True}
         status = application.application_status
 
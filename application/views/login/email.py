@@ -13,6 +13,7 @@ import application.login
 from ...views import magic_link
 from ...utils import test_notify, build_url
 from ...forms import ContactEmailForm
+from ...application_loader import load_application
 from ...models import UserDetails, Application, ApplicantName
 
 
@@ -31,8 +32,9 @@ class NewUserSignInView(View):
 
             email = form.cleaned_data['email_address']
 
-            if UserDetails.objects.filter(email=email).exists():
-                app_id = str(UserDetails.objects.get(email=email).application_id.application_id)
+            account = UserDetails.get_by_email(email)
+            if account is not None:
+                app_id = str(account.application_id_id)
                 send_magic_link(email)  # acc created here so conditional must be made before then.
                 return login_email_link_sent(request, app_id)
             else:
@@ -61,8 +63,9 @@ class ExistingUserSignInView(View):
                 return HttpResponseRedirect(reverse('Service-Down'))
 
             email = form.cleaned_data['email_address']
-            if UserDetails.objects.filter(email=email).exists():
-                app_id = str(UserDetails.objects.get(email=email).application_id.application_id)
+            account = UserDetails.get_by_email(email)
+            if account is not None:
+                app_id = str(account.application_id_id)
                 send_magic_link(email)  # acc created here so conditional must be made before then.
                 return login_email_link_sent(request, app_id)
             else:
@@ -83,7 +86,7 @@ class UpdateEmailView(View):
     """
     def get(self, request):
         app_id = request.GET["id"]
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
         form = ContactEmailForm(id=app_id)
         form.field_list = ['email_address']
         form.pk = UserDetails.objects.get(application_id=application).login_id
@@ -93,13 +96,13 @@ class UpdateEmailView(View):
             form.error_summary_template_name = 'returned-error-summary.html'
             form.error_summary_title = 'There was a problem'
 
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
 
         return self.render_update_email_template(request, form=form, application=application)
 
     def post(self, request):
         app_id = request.POST["id"]
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
         acc = UserDetails.objects.get(application_id=app_id)
         form = ContactEmailForm(request.POST, id=app_id)
         form.remove_flag()
@@ -107,13 +110,13 @@ class UpdateEmailView(View):
         if form.is_valid():
             email = form.cleaned_data['email_address']
 
-            if acc.email == email:
+            if acc.email.lower() == email.lower():
                 # Update date last accessed when successfully logged in
                 application.date_last_accessed = timezone.now()
                 application.save()
                 return HttpResponseRedirect(reverse('Contact-Summary-View') + '?id=' + app_id)
 
-            elif UserDetails.objects.filter(email=email).exists():
+            elif UserDetails.get_by_email(email) is not None:
                 if settings.DEBUG:
                     print("You will not see an email validation link printed because an account"
                           " already exists with that email.")
@@ -214,11 +217,11 @@ def send_magic_link(email):
     Send email containing link to access an account.
     :param email: email address for the account to be accessed.
     """
-    try:
-        acc = UserDetails.objects.get(email=email)
+    acc = UserDetails.get_by_email(email)
+    if acc is not None:
         email_func = magic_link.magic_link_confirmation_email
 
-    except ObjectDoesNotExist:  # if acc doesn't exist, create one and send corresponding email.
+    else:  # if acc doesn't exist, create one and send corresponding email.
         acc = create_new_app()
         acc.email = email
         email_func = magic_link.magic_link_non_existent_email
@@ -0,0 +1,28 @@
+"""
+OFS-MORE-CCN3: Apply to be a Childminder Beta
+-- metrics.py --
+
+@author: Informed Solutions
+"""
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from ..metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def metrics(request):
+    """
+    Method returning the view latency and gateway metrics of this process in the Prometheus text format. If
+    METRICS_BEARER_TOKEN is set, requests must present it in their Authorization header.
+    :param request: a request object used to generate the HttpResponse
+    :return: an HttpResponse object containing the metrics
+    """
+    if settings.METRICS_BEARER_TOKEN and not constant_time_compare(
+            request.META.get('HTTP_AUTHORIZATION', ''), 'Bearer ' + settings.METRICS_BEARER_TOKEN):
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -25,10 +25,11 @@ from ..forms import (
     OtherPeopleApproaching16Form,
     OtherPeopleEmailConfirmationForm,
     OtherPeopleResendEmailForm)
+from ..application_loader import load_application
+from ..household_invitations import send_health_check_invitations
 from ..models import (AdultInHome,
                       ApplicantName,
                       ApplicantPersonalDetails,
-                      Application,
                       ArcComments,
                       ChildInHome, ApplicantHomeAddress)
 
@@ -58,7 +59,7 @@ def other_people_adult_details(request):
         if number_of_adults == 1:
             # Disable the remove person button
             remove_button = False
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         # Remove specific adult if remove button is pressed
         remove_adult(application_id_local, remove_person)
         # Rearrange adult numbers if there are gaps
@@ -115,7 +116,7 @@ def other_people_adult_details(request):
         if number_of_adults == 1:
             # Disable the remove person button
             remove_button = False
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         # Generate a list of forms to iterate through in the HTML
         form_list = []
         # List to allow for the validation of each form
@@ -214,7 +215,7 @@ def other_people_approaching_16(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = OtherPeopleApproaching16Form()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         number_of_children = ChildInHome.objects.filter(
             application_id=application_id_local).count()
         variables = {
@@ -228,7 +229,7 @@ def other_people_approaching_16(request):
     if request.method == 'POST':
         application_id_local = request.POST["id"]
         form = OtherPeopleApproaching16Form(request.POST)
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         number_of_children = ChildInHome.objects.filter(
             application_id=application_id_local).count()
         if form.is_valid():
@@ -260,11 +261,8 @@ def other_people_email_confirmation(request):
         application_id_local = request.GET["id"]
         form = OtherPeopleEmailConfirmationForm()
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         adults = AdultInHome.objects.filter(application_id=application_id_local)
-        # Send health check e-mail to each household member
-        # Generate parameters for Notify e-mail template
-        template_id = '1e3c066a-4bbe-4743-b6b1-1d52ac291caf'
 
         if all([adult.email_resent_timestamp is not None for adult in adults]):
             return HttpResponseRedirect(build_url('Task-List-View', get={'id': application_id_local}))
@@ -276,29 +274,17 @@ def other_people_email_confirmation(request):
         else:
             applicant_name_formatted = applicant_name.first_name + ' ' + applicant_name.middle_names + ' ' + applicant_name.last_name
 
-        if settings.EXECUTING_AS_TEST == 'True':
-            os.environ['EMAIL_VALIDATION_URL'] = ''
         # For each household member, generate a unique link to access their health check page
         # and send an e-mail
-        for adult in adults:
-            if adult.health_check_status != 'Done':
-                adult.token = ''.join([random.choice(string.digits[1:]) for n in range(7)])
-                email = adult.email
-                base_url = settings.PUBLIC_APPLICATION_URL
-                personalisation = {"link": base_url +
-                                           reverse('Health-Check-Authentication', kwargs={'id': adult.token}).replace(
-                                               '/childminder', ''),
-                                   "firstName": adult.first_name,
-                                   "ApplicantName": applicant_name_formatted}
-                print(personalisation['link'])
-                r = send_email(email, personalisation, template_id)
-                if settings.EXECUTING_AS_TEST == 'True':
-                    os.environ['EMAIL_VALIDATION_URL'] = os.environ['EMAIL_VALIDATION_URL'] + " " + str(
-                        personalisation['link'])
+        results = send_health_check_invitations(adults, applicant_name_formatted)
+        for result in results:
+            # Adults whose invitation failed are not marked as invited, so are invited again on the next visit
+            if not result.sent:
+                logger.error('Health check invitation not sent to adult ' + str(result.adult.pk) +
+                             ' for application ' + str(application_id_local) + ': ' + str(result.error))
 
-                # Set a timestamp when the e-mail was last send (for later use in resend e-mail logic)
-                adult.email_resent_timestamp = datetime.now(pytz.utc)
-                adult.save()
+        if settings.EXECUTING_AS_TEST == 'True':
+            os.environ['EMAIL_VALIDATION_URL'] = ''.join([' ' + result.link for result in results])
 
         variables = {
             'form': form,
@@ -348,7 +334,7 @@ def other_people_resend_email(request):
         form = OtherPeopleResendEmailForm()
         form.check_flag()
         # Generate variables for display on email resend page
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         adult_record = AdultInHome.objects.get(application_id=application_id_local, adult=adult_number)
 
         if adult_record.middle_names != '':
@@ -397,7 +383,7 @@ def other_people_resend_email(request):
         form = OtherPeopleResendEmailForm(request.POST)
         form.remove_flag()
         # Generate parameters for e-mail template
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         applicant = ApplicantPersonalDetails.objects.get(application_id=application_id_local)
         applicant_name = ApplicantName.objects.get(personal_detail_id=applicant)
         if applicant_name.middle_names == '':
@@ -499,7 +485,7 @@ def other_people_resend_confirmation(request):
         form = OtherPeopleResendEmailForm()
         form.check_flag()
         # Generate variables for display on email resent page
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         adult_record = AdultInHome.objects.get(application_id=application_id_local, adult=adult_number)
 
         if adult_record.middle_names != '':
@@ -3,7 +3,8 @@ from django.core.exceptions import ObjectDoesNotExist
 
 from application.forms.other_person_health_check import dob_auth
 from application.views.other_people_health_check.BaseViews import BaseFormView
-from ...models import Application, AdultInHome
+from ...application_loader import load_application
+from ...models import AdultInHome
 
 
 class DobAuthView(BaseFormView):
@@ -23,7 +24,7 @@ class DobAuthView(BaseFormView):
         adult_id = self.request.GET.get('person_id')
         adult_record = AdultInHome.objects.get(pk=adult_id)
         application_id = adult_record.application_id_id
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
 
         # Both success_url_name and success_url required due to conflicting methods
         if application.people_in_home_arc_flagged or adult_record.health_check_status == 'COMPLETED':
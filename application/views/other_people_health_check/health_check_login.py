@@ -6,7 +6,8 @@ from django.conf import settings
 from django.shortcuts import render
 from django.urls import reverse
 
-from application.models import Application, ApplicantName
+from application.application_loader import load_application
+from application.models import ApplicantName
 from application.utils import build_url
 from ...middleware import CustomAuthenticationHandler
 from ...models.adult_in_home import AdultInHome
@@ -23,7 +24,7 @@ def validate_magic_link(request, id):
     """
     try:
         person = AdultInHome.objects.get(token=id)
-        application = Application.objects.get(pk=person.application_id.pk)
+        application = load_application(person.application_id.pk)
 
         if person.validated is not True:
             try:
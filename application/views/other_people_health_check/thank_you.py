@@ -1,5 +1,6 @@
 from application.middleware import CustomAuthenticationHandler
-from application.models import AdultInHome, UserDetails, ApplicantName, Application, ArcComments
+from application.application_loader import load_application
+from application.models import AdultInHome, UserDetails, ApplicantName, ArcComments
 from application.notify import send_email
 from application.status import update
 from application.views import create_account_magic_link
@@ -33,7 +34,7 @@ class ThankYou(BaseTemplateView):
         adult_record = AdultInHome.objects.get(pk=adult_id)
         adult_name = ' '.join([adult_record.first_name, (adult_record.middle_names or ''), adult_record.last_name])
         application_id = adult_record.application_id_id
-        application = Application.objects.get(application_id=application_id)
+        application = load_application(application_id)
         user_details = UserDetails.objects.get(application_id=application_id)
 
         try:
@@ -7,7 +7,8 @@ from application.business_logic import get_childcare_register_type
 from application.notify import send_email
 from application.utils import get_id
 from .. import status
-from ..models import (Application, ApplicantName, UserDetails, CriminalRecordCheck)
+from ..application_loader import load_application
+from ..models import (ApplicantName, UserDetails, CriminalRecordCheck)
 
 log = logging.getLogger()
 
@@ -26,8 +27,7 @@ def payment_confirmation(request):
         criminal_record_check = None
         conviction = False
 
-    local_app = Application.objects.get(
-        application_id=application_id_local)
+    local_app = load_application(application_id_local)
 
     childcare_register_type, childcare_register_cost = get_childcare_register_type(application_id_local)
 
@@ -52,7 +52,7 @@ def payment_confirmation(request):
         'application_id': application_id_local,
         'order_code': request.GET["orderCode"],
         'conviction': conviction,
-        'health_status': Application.objects.get(application_id=application_id_local).health_status,
+        'health_status': load_application(application_id_local).health_status,
         'cost': childcare_register_cost,
         'is_early_years_register': is_early_years_register
     }
@@ -33,6 +33,7 @@ from ..forms import (PersonalDetailsChildcareAddressForm,
                      PersonalDetailsOwnChildrenForm,
                      PersonalDetailsSummaryForm,
                      PersonalDetailsWorkingInOtherChildminderHomeForm)
+from ..application_loader import load_application
 from ..models import (ApplicantHomeAddress,
                       ApplicantName,
                       ArcComments,
@@ -116,7 +117,7 @@ def personal_details_name(request):
         app_id = request.POST["id"]
         form = PersonalDetailsNameForm(request.POST, id=app_id)
         form.remove_flag()
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
 
         if form.is_valid():
 
@@ -1107,7 +1108,7 @@ def personal_details_summary(request):
     global moved_in_date
     if request.method == 'GET':
         app_id = request.GET["id"]
-        application = Application.objects.get(application_id=app_id)
+        application = load_application(app_id)
         personal_detail_id = ApplicantPersonalDetails.get_id(app_id=app_id)
         birth_day = personal_detail_id.birth_day
         birth_month = personal_detail_id.birth_month
@@ -12,6 +12,7 @@ from django.http import HttpResponseRedirect
 from django.core.urlresolvers import reverse
 
 from .. import status
+from ..application_loader import load_application
 from ..models import Application, ApplicantPersonalDetails
 from ..forms import PersonalDetailsHomeAddressManualForm
 from ..business_logic import reset_declaration, personal_home_address_logic
@@ -26,7 +27,7 @@ def personal_details_home_address_manual(request):
 
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = PersonalDetailsHomeAddressManualForm(id=application_id_local)
         form.check_flag()
         if application.application_status == 'FURTHER_INFORMATION':
@@ -42,7 +43,7 @@ def personal_details_home_address_manual(request):
     if request.method == 'POST':
 
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         form = PersonalDetailsHomeAddressManualForm(request.POST, id=application_id_local)
         form.remove_flag()
@@ -52,7 +53,7 @@ def personal_details_home_address_manual(request):
             home_address_record = personal_home_address_logic(application_id_local, form)
             home_address_record.save()
             moved_in_day, moved_in_month, moved_in_year = form.cleaned_data.get('moved_in_date')
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             personal_detail_record = ApplicantPersonalDetails.get_id(app_id=application_id_local)
@@ -5,7 +5,7 @@ from django.shortcuts import render
 from django.core.urlresolvers import reverse
 
 from ..forms import PrepareForInterviewForm
-from ..models import Application
+from ..application_loader import load_application
 
 
 def prepare_for_interview(request):
@@ -16,8 +16,7 @@ def prepare_for_interview(request):
 
     if request.method == 'GET':
         application_id_local = request.GET['id']
-        order_code = Application.objects.get(
-            pk=application_id_local).application_reference
+        order_code = load_application(application_id_local).application_reference
         form = PrepareForInterviewForm()
         variables = {
             'application_id': application_id_local,
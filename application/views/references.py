@@ -24,8 +24,8 @@ from ..forms import (FirstReferenceForm,
                      ReferenceSecondReferenceContactForm,
                      ReferenceSummaryForm,
                      SecondReferenceForm)
-from ..models import (Application,
-                      Reference)
+from ..application_loader import load_application
+from ..models import Reference
 
 
 def references_intro(request):
@@ -38,7 +38,7 @@ def references_intro(request):
     if request.method == 'GET':
         application_id_local = request.GET["id"]
         form = ReferenceIntroForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         variables = {
             'form': form,
             'application_id': application_id_local,
@@ -48,7 +48,7 @@ def references_intro(request):
     if request.method == 'POST':
         application_id_local = request.POST["id"]
         form = ReferenceIntroForm(request.POST)
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         # Default status to in progress irrespective of choices made
         status.update(application_id_local, 'references_status', 'IN_PROGRESS')
@@ -78,7 +78,7 @@ def references_first_reference(request):
         application_id_local = request.GET["id"]
         form = FirstReferenceForm(id=application_id_local)
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
@@ -94,7 +94,7 @@ def references_first_reference(request):
         application_id_local = request.POST["id"]
         form = FirstReferenceForm(request.POST, id=application_id_local)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             if application.references_status != 'COMPLETED':
                 status.update(application_id_local,
@@ -132,7 +132,7 @@ def references_first_reference_address(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceFirstReferenceAddressForm(id=application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
@@ -147,7 +147,7 @@ def references_first_reference_address(request):
         return render(request, 'references-first-reference-address.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceFirstReferenceAddressForm(
             request.POST, id=application_id_local)
         if form.is_valid():
@@ -156,7 +156,7 @@ def references_first_reference_address(request):
                 application_id=application_id_local, reference=1)
             first_reference_record.postcode = postcode
             first_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             if 'postcode-search' in request.POST:
@@ -190,7 +190,7 @@ def references_first_reference_address_select(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         first_reference_record = Reference.objects.get(
             application_id=application_id_local, reference=1)
         postcode = first_reference_record.postcode
@@ -228,7 +228,7 @@ def references_first_reference_address_select(request):
             return render(request, 'references-first-reference-address.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         first_reference_record = Reference.objects.get(
             application_id=application_id_local, reference=1)
         postcode = first_reference_record.postcode
@@ -249,10 +249,10 @@ def references_first_reference_address_select(request):
             first_reference_record.postcode = postcode
             first_reference_record.country = 'United Kingdom'
             first_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
-            if Application.objects.get(pk=application_id_local).references_status != 'COMPLETED':
+            if load_application(application_id_local).references_status != 'COMPLETED':
                 status.update(application_id_local, 'references_status', 'IN_PROGRESS')
             return HttpResponseRedirect(reverse('References-First-Reference-Contact-Details-View') + '?id=' +
                                         application_id_local)
@@ -282,7 +282,7 @@ def references_first_reference_address_manual(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceFirstReferenceAddressManualForm(id=application_id_local)
         form.check_flag()
 
@@ -298,7 +298,7 @@ def references_first_reference_address_manual(request):
         return render(request, 'references-first-reference-address-manual.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceFirstReferenceAddressManualForm(request.POST, id=application_id_local)
         form.remove_flag()
 
@@ -320,7 +320,7 @@ def references_first_reference_address_manual(request):
             first_reference_record.postcode = postcode
             first_reference_record.country = country
             first_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             reset_declaration(application)
@@ -356,7 +356,7 @@ def references_first_reference_contact_details(request):
         application_id_local = request.GET["id"]
         form = ReferenceFirstReferenceContactForm(id=application_id_local)
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
@@ -372,7 +372,7 @@ def references_first_reference_contact_details(request):
         application_id_local = request.POST["id"]
         form = ReferenceFirstReferenceContactForm(request.POST, id=application_id_local)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             if application.references_status != 'COMPLETED':
                 status.update(application_id_local,
@@ -384,7 +384,7 @@ def references_first_reference_contact_details(request):
             references_first_reference_address_record.phone_number = phone_number
             references_first_reference_address_record.email = email_address
             references_first_reference_address_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             reset_declaration(application)
@@ -416,7 +416,7 @@ def references_second_reference(request):
         application_id_local = request.GET["id"]
         form = SecondReferenceForm(id=application_id_local)
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
@@ -432,7 +432,7 @@ def references_second_reference(request):
         application_id_local = request.POST["id"]
         form = SecondReferenceForm(request.POST, id=application_id_local)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             if application.references_status != 'COMPLETED':
                 status.update(application_id_local,
@@ -470,7 +470,7 @@ def references_second_reference_address(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceSecondReferenceAddressForm(id=application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
@@ -485,7 +485,7 @@ def references_second_reference_address(request):
         return render(request, 'references-second-reference-address.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceSecondReferenceAddressForm(
             request.POST, id=application_id_local)
         if form.is_valid():
@@ -494,7 +494,7 @@ def references_second_reference_address(request):
                 application_id=application_id_local, reference=2)
             second_reference_record.postcode = postcode
             second_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             if 'postcode-search' in request.POST:
@@ -528,7 +528,7 @@ def references_second_reference_address_select(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         second_reference_record = Reference.objects.get(
             application_id=application_id_local, reference=2)
         postcode = second_reference_record.postcode
@@ -566,7 +566,7 @@ def references_second_reference_address_select(request):
             return render(request, 'references-second-reference-address.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         second_reference_record = Reference.objects.get(
             application_id=application_id_local, reference=2)
         postcode = second_reference_record.postcode
@@ -588,10 +588,10 @@ def references_second_reference_address_select(request):
             second_reference_record.postcode = postcode
             second_reference_record.country = 'United Kingdom'
             second_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
-            if Application.objects.get(pk=application_id_local).references_status != 'COMPLETED':
+            if load_application(application_id_local).references_status != 'COMPLETED':
                 status.update(application_id_local,
                               'references_status', 'IN_PROGRESS')
             return HttpResponseRedirect(reverse('References-Second-Reference-Contact-Details-View') + '?id=' +
@@ -622,7 +622,7 @@ def references_second_reference_address_manual(request):
     current_date = timezone.now()
     if request.method == 'GET':
         application_id_local = request.GET["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceSecondReferenceAddressManualForm(id=application_id_local)
         form.check_flag()
 
@@ -638,7 +638,7 @@ def references_second_reference_address_manual(request):
         return render(request, 'references-second-reference-address-manual.html', variables)
     if request.method == 'POST':
         application_id_local = request.POST["id"]
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         form = ReferenceSecondReferenceAddressManualForm(request.POST, id=application_id_local)
         form.remove_flag()
         if form.is_valid():
@@ -659,7 +659,7 @@ def references_second_reference_address_manual(request):
             second_reference_record.postcode = postcode
             second_reference_record.country = country
             second_reference_record.save()
-            application = Application.objects.get(pk=application_id_local)
+            application = load_application(application_id_local)
             application.date_updated = current_date
             application.save()
             reset_declaration(application)
@@ -695,7 +695,7 @@ def references_second_reference_contact_details(request):
         application_id_local = request.GET["id"]
         form = ReferenceSecondReferenceContactForm(id=application_id_local)
         form.check_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         if application.application_status == 'FURTHER_INFORMATION':
             form.error_summary_template_name = 'returned-error-summary.html'
@@ -711,7 +711,7 @@ def references_second_reference_contact_details(request):
         application_id_local = request.POST["id"]
         form = ReferenceSecondReferenceContactForm(request.POST, id=application_id_local)
         form.remove_flag()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
         if form.is_valid():
             status.update(application_id_local,
                           'references_status', 'COMPLETED')
@@ -782,7 +782,7 @@ def references_summary(request):
         second_reference_phone_number = second_reference_record.phone_number
         second_reference_email = second_reference_record.email
         form = ReferenceSummaryForm()
-        application = Application.objects.get(pk=application_id_local)
+        application = load_application(application_id_local)
 
         first_years_known_str = "year" if first_reference_years_known == 1 else "years"
         first_months_known_str = "month" if first_reference_months_known == 1 else "months"
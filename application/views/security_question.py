@@ -10,7 +10,8 @@ from django.core.exceptions import PermissionDenied
 
 from application import login
 from application.forms import SecurityQuestionForm, SecurityDateForm
-from application.models import Application, UserDetails, ApplicantHomeAddress, ApplicantPersonalDetails, AdultInHome, \
+from application.application_loader import load_application
+from application.models import UserDetails, ApplicantHomeAddress, ApplicantPersonalDetails, AdultInHome, \
     CriminalRecordCheck
 
 
@@ -50,7 +51,7 @@ def question(request):
         app_id = user_details.application_id.pk
         question = get_security_question(app_id)
         forms = post_forms(question, request.POST, app_id)
-        application = Application.objects.get(pk=app_id)
+        application = load_application(app_id)
         valid_forms = [form.is_valid() for form in forms]
 
         if all(valid_forms):
@@ -93,7 +94,7 @@ def get_answer(question, app_id):
     :return: dict object containing correct question answer and, if applicable, the correct date answer.
     """
     date = []
-    app = Application.objects.get(application_id=app_id)
+    app = load_application(app_id)
     acc = UserDetails.objects.get(application_id=app)
     if 'mobile' in question:
         question = acc.mobile_number
@@ -160,7 +161,7 @@ def get_forms(app_id, question):
     :return: list of forms instantiated with the correct answer to each question.
     """
     form_list = []
-    app = Application.objects.get(application_id=app_id)
+    app = load_application(app_id)
     acc = UserDetails.objects.get(application_id=app)
     if 'mobile' in question:
         form_list.append(SecurityQuestionForm(answer=acc.mobile_number))
@@ -186,7 +187,7 @@ def get_security_question(app_id):
     :param app_id: ID of application of whom the secrity question is being asked.
     :return: str which identifies the type of question to be asked.
     """
-    app = Application.objects.get(pk=app_id)
+    app = load_application(app_id)
     acc = UserDetails.objects.get(application_id=app_id)
     adults = AdultInHome.objects.filter(application_id=app_id)
     question = ''
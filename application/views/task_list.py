@@ -10,14 +10,149 @@ based on whether they have previously completed the task or not.
 
 from django.http import HttpResponseRedirect
 from django.shortcuts import render
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
 from django.views.decorators.cache import never_cache
 
-from ..models import (ApplicantPersonalDetails, Application, ChildcareType, ApplicantHomeAddress)
-from ..business_logic import get_childcare_register_type
+from ..application_loader import load_application
+from ..models import ChildcareType
+from ..business_logic import get_childcare_register_type_from_record
 # noinspection PyTypeChecker
 from ..utils import can_cancel
 
+# Display name of each register an applicant may apply to
+REGISTERS = {
+    'EYR-CR-both': 'Early Years and Childcare Register (both parts)',
+    'EYR-CR-compulsory': 'Early Years and Childcare Register (compulsory part)',
+    'EYR-CR-voluntary': 'Early Years and Childcare Register (voluntary part)',
+    'EYR': 'Early Years Register',
+    'CR-compulsory': 'Childcare Register (compulsory part)',
+    'CR-both': 'Childcare Register (both parts)',
+    'CR-voluntary': 'Childcare Register (voluntary part)',
+}
+
+# Static description of each task: its CSS class name, the Application fields holding its status and ARC flag, and
+# the url to link to for each status ('OTHER' being used for all other statuses)
+TASKS = (
+    {
+        'name': 'account_details',
+        'description': 'Your sign in details',
+        'status_field': 'login_details_status',
+        'arc_flagged_field': 'login_details_arc_flagged',
+        'status_urls': {'COMPLETED': 'Contact-Summary-View',
+                        'FLAGGED': 'Contact-Summary-View',
+                        'OTHER': 'Contact-Email-View'},
+    },
+    {
+        'name': 'children',
+        'description': 'Type of childcare',
+        'status_field': 'childcare_type_status',
+        'arc_flagged_field': 'childcare_type_arc_flagged',
+        'status_urls': {'COMPLETED': 'Type-Of-Childcare-Summary-View',
+                        'FLAGGED': 'Type-Of-Childcare-Summary-View',
+                        'OTHER': 'Type-Of-Childcare-Guidance-View'},
+    },
+    {
+        'name': 'personal_details',
+        'description': 'Your personal details',
+        'status_field': 'personal_details_status',
+        'arc_flagged_field': 'personal_details_arc_flagged',
+        'status_urls': {'COMPLETED': 'Personal-Details-Summary-View',
+                        'FLAGGED': 'Personal-Details-Summary-View',
+                        'OTHER': 'Personal-Details-Name-View'},
+    },
+    {
+        'name': 'your_children',
+        'description': 'Your children',
+        'status_field': 'your_children_status',
+        'arc_flagged_field': 'your_children_arc_flagged',
+        'status_urls': {'COMPLETED': 'Your-Children-Summary-View',
+                        'FLAGGED': 'Your-Children-Summary-View',
+                        'OTHER': 'Your-Children-Guidance-View'},
+    },
+    {
+        'name': 'first_aid',
+        'description': 'First aid training',
+        'status_field': 'first_aid_training_status',
+        'arc_flagged_field': 'first_aid_training_arc_flagged',
+        'status_urls': {'COMPLETED': 'First-Aid-Training-Summary-View',
+                        'FLAGGED': 'First-Aid-Training-Summary-View',
+                        'OTHER': 'First-Aid-Training-Guidance-View'},
+    },
+    {
+        'name': 'eyfs',
+        'description': 'Childcare training',
+        'status_field': 'childcare_training_status',
+        'arc_flagged_field': 'childcare_training_arc_flagged',
+        'status_urls': {'COMPLETED': 'Childcare-Training-Summary-View',
+                        'FLAGGED': 'Childcare-Training-Summary-View',
+                        'OTHER': 'Childcare-Training-Guidance-View'},
+    },
+    {
+        'name': 'health',
+        'description': 'Health declaration booklet',
+        'status_field': 'health_status',
+        'arc_flagged_field': 'health_arc_flagged',
+        'early_years_only': True,
+        'status_urls': {'COMPLETED': 'Health-Check-Answers-View',
+                        'FLAGGED': 'Health-Check-Answers-View',
+                        'OTHER': 'Health-Intro-View'},
+    },
+    {
+        'name': 'dbs',
+        'description': 'Criminal record checks',
+        'status_field': 'criminal_record_check_status',
+        'arc_flagged_field': 'criminal_record_check_arc_flagged',
+        'status_urls': {'COMPLETED': 'DBS-Summary-View',
+                        'FLAGGED': 'DBS-Summary-View',
+                        'OTHER': 'DBS-Guidance-View'},
+    },
+    {
+        'name': 'other_people',
+        'description': 'People in the home',
+        'status_field': 'people_in_home_status',
+        'arc_flagged_field': 'people_in_home_arc_flagged',
+        'status_urls': {'COMPLETED': 'PITH-Summary-View',
+                        'FLAGGED': 'PITH-Summary-View',
+                        'WAITING': 'PITH-Summary-View',
+                        'OTHER': 'PITH-Guidance-View'},
+    },
+    {
+        'name': 'references',
+        'description': 'References',
+        'status_field': 'references_status',
+        'arc_flagged_field': 'references_arc_flagged',
+        'early_years_only': True,
+        'status_urls': {'COMPLETED': 'References-Summary-View',
+                        'FLAGGED': 'References-Summary-View',
+                        'OTHER': 'References-Intro-View'},
+    },
+    {
+        'name': 'review',
+        'description': 'Declaration',
+        # The review task has no status until every other task is complete
+        'status_field': None,
+        'arc_flagged_field': 'application_status',
+        'status_urls': {'COMPLETED': 'Declaration-Declaration-View',
+                        'OTHER': 'Declaration-Summary-View'},
+    },
+)
+
+# Reversed task urls, keyed by script prefix then url name. Filled on first use, as the url configuration imports
+# this module and so cannot be reversed against while it is being imported.
+_task_urls = {}
+
+
+def get_task_url(url_name):
+    """
+    Function to reverse a task url, reversing each url only once per process
+    :param url_name: the name of the url to reverse
+    :return: the path of the url
+    """
+    urls = _task_urls.setdefault(get_script_prefix(), {})
+    if url_name not in urls:
+        urls[url_name] = reverse(url_name)
+    return urls[url_name]
+
 
 def show_hide_tasks(context, application):
     """
@@ -42,6 +177,32 @@ def show_hide_tasks(context, application):
     return context
 
 
+def get_tasks(application, zero_to_five_status):
+    """
+    Method building the list of tasks shown on the task list from the static task descriptions
+    :param application: Application object
+    :param zero_to_five_status: whether the applicant is applying to look after children aged zero to five
+    :return: list of task dictionaries
+    """
+    tasks = []
+    for task in TASKS:
+        tasks.append({
+            'name': task['name'],
+            'status': getattr(application, task['status_field']) if task['status_field'] else None,
+            'arc_flagged': getattr(application, task['arc_flagged_field']),
+            'description': task['description'],
+            'hidden': task.get('early_years_only', False) and not zero_to_five_status,
+            'status_url': None,  # Will be filled later
+            'status_urls': task['status_urls'],
+        })
+
+    # If application is being resubmitted (i.e. is not drafting, set declaration task name to read "Declaration" only)
+    if application.application_status == 'DRAFTING':
+        tasks[-1]['description'] = 'Declaration and payment'
+
+    return tasks
+
+
 @never_cache
 def task_list(request):
     """
@@ -54,7 +215,7 @@ def task_list(request):
     if request.method == 'GET':
         application_id = request.GET["id"]
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
 
     # Add handlers to prevent a user re-accessing their application details and modifying post-submission
     if application.application_status == 'ARC_REVIEW' or application.application_status == 'SUBMITTED':
@@ -77,23 +238,8 @@ def task_list(request):
 
     zero_to_five_status = childcare_record.zero_to_five
 
-    # Get the fee and the type for display on the page
-    childcare_register_type, fee = get_childcare_register_type(application.application_id)
-
-    if childcare_register_type == 'EYR-CR-both':
-        registers = 'Early Years and Childcare Register (both parts)'
-    elif childcare_register_type == 'EYR-CR-compulsory':
-        registers = 'Early Years and Childcare Register (compulsory part)'
-    elif childcare_register_type == 'EYR-CR-voluntary':
-        registers = 'Early Years and Childcare Register (voluntary part)'
-    elif childcare_register_type == 'EYR':
-        registers = 'Early Years Register'
-    elif childcare_register_type == 'CR-compulsory':
-        registers = 'Childcare Register (compulsory part)'
-    elif childcare_register_type == 'CR-both':
-        registers = 'Childcare Register (both parts)'
-    elif childcare_register_type == 'CR-voluntary':
-        registers = 'Childcare Register (voluntary part)'
+    # Get the fee and the type for display on the page, from the childcare type record already loaded
+    childcare_register_type, fee = get_childcare_register_type_from_record(childcare_record)
 
     """
     Variables which are passed to the template
@@ -102,158 +248,11 @@ def task_list(request):
     context = {
         'id': application_id,
         'all_complete': False,
-        'registers': registers,
+        'registers': REGISTERS.get(childcare_register_type),
         'fee': '£' + str(fee),
         'can_cancel': can_cancel(application),
         'application_status': application.application_status,
-        'tasks': [
-            {
-                'name': 'account_details',  # This is CSS class (Not recommended to store it here)
-                'status': application.login_details_status,
-                'arc_flagged': application.login_details_arc_flagged,
-                'description': "Your sign in details",
-                'hidden': False,
-                'status_url': None,  # Will be filled later
-                'status_urls': [  # Available urls for each status
-                    {'status': 'COMPLETED', 'url': 'Contact-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'Contact-Summary-View'},
-                    {'status': 'OTHER', 'url': 'Contact-Email-View'},  # For all other statuses
-                ],
-            },
-            {
-                'name': 'children',
-                'status': application.childcare_type_status,
-                'arc_flagged': application.childcare_type_arc_flagged,
-                'description': "Type of childcare",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Type-Of-Childcare-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'Type-Of-Childcare-Summary-View'},
-                    {'status': 'OTHER', 'url': 'Type-Of-Childcare-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'personal_details',
-                'status': application.personal_details_status,
-                'arc_flagged': application.personal_details_arc_flagged,
-                'description': "Your personal details",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Personal-Details-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'Personal-Details-Summary-View'},
-                    {'status': 'OTHER', 'url': 'Personal-Details-Name-View'}
-                ],
-            },
-            {
-                'name': 'your_children',
-                'status': application.your_children_status,
-                'arc_flagged': application.your_children_arc_flagged,
-                'description': "Your children",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Your-Children-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'Your-Children-Summary-View'},
-                    {'status': 'OTHER', 'url': 'Your-Children-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'first_aid',
-                'status': application.first_aid_training_status,
-                'arc_flagged': application.first_aid_training_arc_flagged,
-                'description': "First aid training",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'First-Aid-Training-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'First-Aid-Training-Summary-View'},
-                    {'status': 'OTHER', 'url': 'First-Aid-Training-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'eyfs',
-                'status': application.childcare_training_status,
-                'arc_flagged': application.childcare_training_arc_flagged,
-                'description': 'Childcare training',
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Childcare-Training-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'Childcare-Training-Summary-View'},
-                    {'status': 'OTHER', 'url': 'Childcare-Training-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'health',
-                'status': application.health_status,
-                'arc_flagged': application.health_arc_flagged,
-                'description': "Health declaration booklet",
-                'hidden': True if not zero_to_five_status else False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Health-Check-Answers-View'},
-                    {'status': 'FLAGGED', 'url': 'Health-Check-Answers-View'},
-                    {'status': 'OTHER', 'url': 'Health-Intro-View'}
-                ],
-            },
-            {
-                'name': 'dbs',
-                'status': application.criminal_record_check_status,
-                'arc_flagged': application.criminal_record_check_arc_flagged,
-                'description': "Criminal record checks",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'DBS-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'DBS-Summary-View'},
-                    {'status': 'OTHER', 'url': 'DBS-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'other_people',
-                'status': application.people_in_home_status,
-                'arc_flagged': application.people_in_home_arc_flagged,
-                'description': "People in the home",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'PITH-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'PITH-Summary-View'},
-                    {'status': 'WAITING', 'url': 'PITH-Summary-View'},
-                    {'status': 'OTHER', 'url': 'PITH-Guidance-View'}
-                ],
-            },
-            {
-                'name': 'references',
-                'status': application.references_status,
-                'arc_flagged': application.references_arc_flagged,
-                'description': "References",
-                'hidden': True if not zero_to_five_status else False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'References-Summary-View'},
-                    {'status': 'FLAGGED', 'url': 'References-Summary-View'},
-                    {'status': 'OTHER', 'url': 'References-Intro-View'}
-                ],
-            },
-            {
-                'name': 'review',
-                'status': None,
-                'arc_flagged': application.application_status,
-                # If application is being resubmitted (i.e. is not drafting,
-                # set declaration task name to read "Declaration" only)
-                'description':
-                    "Declaration and payment" if application.application_status == 'DRAFTING' else "Declaration",
-                'hidden': False,
-                'status_url': None,
-                'status_urls': [
-                    {'status': 'COMPLETED', 'url': 'Declaration-Declaration-View'},
-                    {'status': 'OTHER', 'url': 'Declaration-Summary-View'}
-                ],
-            },
-        ]
+        'tasks': get_tasks(application, zero_to_five_status),
     }
 
     # Show/hide Your children and People in your home tasks
@@ -278,18 +277,11 @@ def task_list(request):
                 if task['status'] is None:
                     task['status'] = application.declarations_status
 
-    # Prepare task links
+    # Prepare links for the tasks shown, matching the current task status or falling back to the url for all other
+    # statuses
     for task in context['tasks']:
-
-        # Iterating through tasks
-
-        for url in task.get('status_urls'):  # Iterating through task available urls
-            if url['status'] == task['status']:  # Match current task status with url which is in status_urls
-                task['status_url'] = url['url']  # Set main task primary url to the one which matched
-
-        if not task['status_url']:  # In case no matches were found by task status
-            for url in task.get('status_urls'):  # Search for link with has status "OTHER"
-                if url['status'] == "OTHER":
-                    task['status_url'] = url['url']
+        if not task['hidden']:
+            status_urls = task['status_urls']
+            task['status_url'] = get_task_url(status_urls.get(task['status'], status_urls['OTHER']))
 
     return render(request, 'task-list.html', context)
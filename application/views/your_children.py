@@ -10,6 +10,7 @@ from django.urls import reverse
 
 from ..forms import YourChildrenGuidanceForm, YourChildrenDetailsForm, YourChildrenLivingWithYouForm, ChildAddressForm, \
     YourChildrenSummaryForm, YourChildrenAddressLookupForm, YourChildManualAddressForm, ArcComments
+from ..application_loader import load_application
 from ..models import Application, Child, ChildAddress, ApplicantPersonalDetails, ApplicantHomeAddress
 from .. import status, address_helper
 from ..business_logic import remove_child, rearrange_children, your_children_details_logic, reset_declaration, \
@@ -328,7 +329,7 @@ def __your_children_details_get_handler(request):
         # Disable the remove person button
         remove_button = False
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
 
     # Remove specific children if remove link is clicked
     if remove_request_querystring_present:
@@ -387,7 +388,7 @@ def __your_children_details_post_handler(request):
     if number_of_children == 1:
         remove_button = False
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
 
     form_list = []
     valid_list = []
@@ -588,7 +589,7 @@ def __your_children_living_with_you_post_handler(request):
 
 
 def __set_child_address_to_childminder_personal_address(application_id, child):
-    application = Application.objects.get(application_id=application_id)
+    application = load_application(application_id)
 
     child_address_record = ChildAddress(
         application_id=application
@@ -672,7 +673,7 @@ def __your_children_address_lookup_post_handler(request):
 
     form = ChildAddressForm(request.POST, id=application_id, child=child)
 
-    application = Application.objects.get(application_id=application_id)
+    application = load_application(application_id)
 
     if 'postcode-search' in request.POST:
 
@@ -881,7 +882,7 @@ def __your_children_address_manual_get_handler(request):
                  + str(application_id) + " and child number: " + str(child))
 
     child_record = Child.objects.get(application_id=application_id, child=child)
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
     form = YourChildManualAddressForm(id=application_id, child=child)
     form.check_flag()
 
@@ -913,7 +914,7 @@ def _your_children_address_manual_post_handler(request):
     logger.debug('Saving manual child address details for application with id: '
                  + str(application_id) + " and child number: " + str(child))
 
-    application = Application.objects.get(pk=application_id)
+    application = load_application(application_id)
 
     form = YourChildManualAddressForm(request.POST, id=application_id, child=child)
     form.remove_flag()
@@ -922,7 +923,7 @@ def _your_children_address_manual_post_handler(request):
 
         child_address_record = child_address_logic(application_id, child, form)
         child_address_record.save()
-        application = Application.objects.get(pk=application_id)
+        application = load_application(application_id)
         application.date_updated = current_date
         application.save()
 
@@ -981,7 +982,7 @@ def __your_children_summary_get_handler(request):
     """
 
     application_id = request.GET["id"]
-    application = Application.objects.get(application_id=application_id)
+    application = load_application(application_id)
 
     logger.debug('Rendering Your Children task summary for application with id: '
                  + str(application_id))
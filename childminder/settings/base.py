@@ -71,12 +71,68 @@ PAYMENT_REFERENCE_PREFIX = 'MO'
 PAYMENT_PROCESSING_ATTEMPTS = os.environ.get('PAYMENT_PROCESSING_ATTEMPTS', 10)
 PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS = os.environ.get('PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS', 10)
 
+# Number of seconds before the status of a payment still being processed by Worldpay is first checked in the
+# background, doubled for each further check up to PAYMENT_STATUS_QUERY_INTERVAL_IN_SECONDS
+PAYMENT_STATUS_POLL_INITIAL_DELAY_IN_SECONDS = int(os.environ.get('PAYMENT_STATUS_POLL_INITIAL_DELAY_IN_SECONDS', 2))
+
 PAYMENT_HTTP_REQUEST_TIMEOUT = 60
 
+# Timeouts in seconds for requests issued to each of the other gateways
+NOTIFY_HTTP_REQUEST_TIMEOUT = int(os.environ.get('NOTIFY_HTTP_REQUEST_TIMEOUT', 10))
+ADDRESSING_HTTP_REQUEST_TIMEOUT = int(os.environ.get('ADDRESSING_HTTP_REQUEST_TIMEOUT', 10))
+DBS_HTTP_REQUEST_TIMEOUT = int(os.environ.get('DBS_HTTP_REQUEST_TIMEOUT', 10))
+INTEGRATION_ADAPTER_HTTP_REQUEST_TIMEOUT = int(os.environ.get('INTEGRATION_ADAPTER_HTTP_REQUEST_TIMEOUT', 30))
+
+# Interval in seconds between background probes of the notify gateway, and between probes while it is unavailable
+NOTIFY_HEALTH_CHECK_INTERVAL_IN_SECONDS = int(os.environ.get('NOTIFY_HEALTH_CHECK_INTERVAL_IN_SECONDS', 60))
+NOTIFY_CIRCUIT_BREAKER_RETRY_INTERVAL_IN_SECONDS = int(
+    os.environ.get('NOTIFY_CIRCUIT_BREAKER_RETRY_INTERVAL_IN_SECONDS', 10))
+
+# Number of consecutive failed notify requests after which sign-in reports the service as unavailable
+NOTIFY_CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('NOTIFY_CIRCUIT_BREAKER_FAILURE_THRESHOLD', 3))
+
+# Whether emails and texts are added to the notification outbox, to be sent by the send_notifications management
+# command, rather than sent during the request
+NOTIFY_SEND_ASYNCHRONOUSLY = os.environ.get('NOTIFY_SEND_ASYNCHRONOUSLY', 'False') == 'True'
+
+# Retry policy for notifications in the outbox: the number of attempts before a notification is marked as failed, the
+# delay before the first retry (doubled for each further retry) and how long a worker may hold a notification for
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('NOTIFICATION_OUTBOX_MAX_ATTEMPTS', 5))
+NOTIFICATION_OUTBOX_RETRY_BACKOFF_IN_SECONDS = int(os.environ.get('NOTIFICATION_OUTBOX_RETRY_BACKOFF_IN_SECONDS', 30))
+NOTIFICATION_OUTBOX_LEASE_IN_SECONDS = int(os.environ.get('NOTIFICATION_OUTBOX_LEASE_IN_SECONDS', 300))
+
+# Maximum number of household health check invitations sent to the notify gateway at the same time
+HOUSEHOLD_INVITATION_CONCURRENCY = int(os.environ.get('HOUSEHOLD_INVITATION_CONCURRENCY', 4))
+
+# Connection pooling and retry policy shared by all gateway requests
+GATEWAY_TIMEOUT_IN_SECONDS = int(os.environ.get('GATEWAY_TIMEOUT_IN_SECONDS', 30))
+GATEWAY_POOL_CONNECTIONS = int(os.environ.get('GATEWAY_POOL_CONNECTIONS', 10))
+GATEWAY_POOL_MAXSIZE = int(os.environ.get('GATEWAY_POOL_MAXSIZE', 20))
+GATEWAY_MAX_RETRIES = int(os.environ.get('GATEWAY_MAX_RETRIES', 2))
+GATEWAY_RETRY_BACKOFF_FACTOR = float(os.environ.get('GATEWAY_RETRY_BACKOFF_FACTOR', 0.2))
+
 SQS_QUEUE_PREFIX = os.environ.get('SQS_QUEUE_PREFIX', 'DEV')
 
 PAYMENT_NOTIFICATIONS_QUEUE_NAME = SQS_QUEUE_PREFIX + '_PAYMENT_NOTIFICATIONS'
 
+# Where SQS messages are published: 'sqs' for Amazon SQS, or 'local' to keep them in memory (or in a file per queue in
+# SQS_LOCAL_QUEUE_DIRECTORY, if set) for offline development
+SQS_BACKEND = os.environ.get('SQS_BACKEND', 'sqs')
+SQS_LOCAL_QUEUE_DIRECTORY = os.environ.get('SQS_LOCAL_QUEUE_DIRECTORY', '')
+
+# Maximum number of messages which could not be published held in each process to be retried
+SQS_RETRY_BUFFER_SIZE = int(os.environ.get('SQS_RETRY_BUFFER_SIZE', 1000))
+
+# Retry policy for SC1 messages in the payment outbox: the delay before the first retry (doubled for each further
+# retry, up to the maximum) and how long a relay may hold a message for
+PAYMENT_OUTBOX_RETRY_BACKOFF_IN_SECONDS = int(os.environ.get('PAYMENT_OUTBOX_RETRY_BACKOFF_IN_SECONDS', 30))
+PAYMENT_OUTBOX_MAX_BACKOFF_IN_SECONDS = int(os.environ.get('PAYMENT_OUTBOX_MAX_BACKOFF_IN_SECONDS', 3600))
+PAYMENT_OUTBOX_LEASE_IN_SECONDS = int(os.environ.get('PAYMENT_OUTBOX_LEASE_IN_SECONDS', 300))
+
+# Whether to publish each SC1 message as soon as its payment is authorised, rather than leaving it to the
+# relay_payment_messages worker
+PAYMENT_OUTBOX_PUBLISH_ON_COMMIT = os.environ.get('PAYMENT_OUTBOX_PUBLISH_ON_COMMIT', 'True') == 'True'
+
 GOOGLE_ANALYTICS = {
 }
 
@@ -87,6 +143,28 @@ STATIC_URL = URL_PREFIX + '/static/'
 
 AUTHENTICATION_URL = URL_PREFIX + '/sign-in/'
 
+# The session cookie is re-issued once fewer than this many seconds of its 30 minute lifetime remain
+SESSION_REFRESH_WINDOW_IN_SECONDS = int(os.environ.get('SESSION_REFRESH_WINDOW_IN_SECONDS', 1500))
+
+# Number of seconds an email address verified as owning an application is trusted before being checked again
+OWNERSHIP_CACHE_TTL_IN_SECONDS = int(os.environ.get('OWNERSHIP_CACHE_TTL_IN_SECONDS', 60))
+
+# Number of seconds addressing service results are cached for, the number of postcodes held in each process and,
+# optionally, the alias of a configured cache in which results are shared between processes
+POSTCODE_CACHE_TTL_IN_SECONDS = int(os.environ.get('POSTCODE_CACHE_TTL_IN_SECONDS', 3600))
+POSTCODE_CACHE_MAX_ENTRIES = int(os.environ.get('POSTCODE_CACHE_MAX_ENTRIES', 1000))
+POSTCODE_CACHE_BACKEND = os.environ.get('POSTCODE_CACHE_BACKEND', '')
+
+# Number of seconds DBS api lookups are cached for, for certificates which were found and which were not found, and the
+# maximum number of certificates looked up at the same time
+DBS_LOOKUP_CACHE_TTL_IN_SECONDS = int(os.environ.get('DBS_LOOKUP_CACHE_TTL_IN_SECONDS', 300))
+DBS_LOOKUP_NEGATIVE_CACHE_TTL_IN_SECONDS = int(os.environ.get('DBS_LOOKUP_NEGATIVE_CACHE_TTL_IN_SECONDS', 60))
+DBS_LOOKUP_CONCURRENCY = int(os.environ.get('DBS_LOOKUP_CONCURRENCY', 4))
+
+# Path of the local index of the Capita DBS list written by the ingest_capita_dbs_file management command, left blank
+# to look up every certificate from the DBS api
+DBS_INDEX_PATH = os.environ.get('DBS_INDEX_PATH', '')
+
 AUTHENTICATION_EXEMPT_URLS = tuple(u.format(prefix=URL_PREFIX) for u in (
     # omitting the trailing $ will allow *any* url starting with that pattern
     r'^{prefix}/$',
@@ -120,7 +198,8 @@ AUTHENTICATION_EXEMPT_URLS = tuple(u.format(prefix=URL_PREFIX) for u in (
     r'^{prefix}/feedback-submitted/$',
     r'^{prefix}/documents-needed/$',
     r'^{prefix}/home-ready/$',
-    r'^{prefix}/prepare-interview/$'
+    r'^{prefix}/prepare-interview/$',
+    r'^{prefix}/metrics/$',
 ))
 
 BUILTIN_APPS = [
@@ -147,6 +226,8 @@ PROJECT_APPS = [
 SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
 
 MIDDLEWARE = [
+    'application.metrics.MetricsMiddleware',
+    'application.query_budget.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -160,6 +241,32 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'childminder.urls'
 
+# Query budget instrumentation: when enabled, requests whose view issues more queries than the budget for its url name
+# are logged along with any query repeated more than QUERY_BUDGET_DUPLICATE_THRESHOLD times. Strict mode, for the test
+# suite, raises an error instead of logging
+QUERY_BUDGET_ENABLED = os.environ.get('QUERY_BUDGET_ENABLED', 'False') == 'True'
+QUERY_BUDGET_STRICT = os.environ.get('QUERY_BUDGET_STRICT', 'False') == 'True'
+QUERY_BUDGET_DEFAULT = int(os.environ.get('QUERY_BUDGET_DEFAULT', 20))
+QUERY_BUDGET_DUPLICATE_THRESHOLD = int(os.environ.get('QUERY_BUDGET_DUPLICATE_THRESHOLD', 2))
+
+# Query budgets of the views which legitimately issue more than QUERY_BUDGET_DEFAULT queries, by url name
+QUERY_BUDGETS = {
+    'Contact-Email-View': 25,
+    'Contact-Phone-View': 25,
+    'DBS-Check-No-Capita-View': 40,
+    'DBS-Type-View': 30,
+    'Declaration-Summary-View': 30,
+    'Existing-Email': 25,
+    'New-Email': 25,
+    'PITH-DBS-Check-View': 35,
+    'PITH-Summary-View': 30,
+}
+
+# Whether view latency is recorded for the metrics endpoint and, optionally, the bearer token a scraper must present
+# to read it
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_BEARER_TOKEN = os.environ.get('METRICS_BEARER_TOKEN', '')
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -11,7 +11,7 @@ from django.conf.urls import url, include
 from django.views.generic import TemplateView
 
 from application import views, utils
-from application.views import security_question, magic_link, feedback, your_children, cookies
+from application.views import security_question, magic_link, feedback, your_children, cookies, metrics
 from application.views.other_people_health_check import health_check_login, dob_auth, current_treatment, local_authorities, guidance, \
     declaration, serious_illness, hospital_admission, summary, thank_you
 from application.views import PITH_views
@@ -196,6 +196,7 @@ urlpatterns = [
     url(r'^publishing-your-details/', views.publishing_your_details, name='Publishing-Your-Details-View'),
     url(r'^check-answers/', views.declaration_summary, name='Declaration-Summary-View'),
     url(r'^payment/details/', views.card_payment_details, name='Payment-Details-View'),
+    url(r'^payment/processing/', views.card_payment_processing, name='Payment-Processing-View'),
     url(r'^application-saved/', views.application_saved, name='Application-Saved-View'),
     url(r'^validate/(?P<code>[\w-]+)/$', magic_link.validate_magic_link, name='Validate-Email'),
     url(r'^security-code/', magic_link.SMSValidationView.as_view(), name='Security-Code'),
@@ -233,6 +234,7 @@ urlpatterns = [
     url(r'^feedback/', feedback.feedback, name='Feedback'),
     url(r'^feedback-submitted/', feedback.feedback_confirmation, name='Feedback-Confirmation'),
     url(r'^cookies/', cookies.cookie_policy, name='Cookie-Policy'),
+    url(r'^metrics/$', metrics.metrics, name='Metrics'),
 ]
 
 if settings.DEBUG:
@@ -21,6 +21,10 @@ python manage.py migrate application --settings=$PROJECT_SETTINGS
 echo "Collecting static assets"
 python manage.py collectstatic --settings=$PROJECT_SETTINGS --noinput
 
+# Start the relay publishing SC1 payment messages from the payment outbox
+echo "Starting payment message relay"
+python manage.py relay_payment_messages --settings=$PROJECT_SETTINGS &
+
 # Start server
 echo "Starting server"
 python manage.py runserver --settings=$PROJECT_SETTINGS 0.0.0.0:8000